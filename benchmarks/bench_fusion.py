@@ -0,0 +1,96 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Micro-benchmark: CPU time to fuse, de-duplicate and compare several providers'
+result lists per query, as done by /api/search/fused.
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_fusion.py [--providers 4] [--results 500] [--queries 200]
+"""
+
+import argparse
+import random
+import time
+
+from search_api_webui.fusion import canonicalize_url, fuse_results
+
+
+def make_results(query_id, provider_id, count, overlap, rng):
+    """
+    Builds one provider's ranked results; about `overlap` of them are pages the
+    other providers also return, under a differently spelled URL.
+    """
+    results = []
+    for rank in range(count):
+        if rng.random() < overlap:
+            page = rng.randrange(count)
+            url = rng.choice((
+                f"https://www.example.com/q{query_id}/page/{page}",
+                f"http://example.com/q{query_id}/page/{page}/?utm_source=provider{provider_id}",
+                f"https://example.com/q{query_id}/page/{page}#section",
+            ))
+        else:
+            url = f"https://provider{provider_id}.example.org/q{query_id}/{rank}?id={rank}"
+        results.append({
+            "title": f"Result {rank} for query {query_id}",
+            "url": url,
+            "snippet": "Some snippet text describing the page. " * 3
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--providers", type=int, default=4, help="Providers per query")
+    parser.add_argument("--results", type=int, default=500, help="Results per provider")
+    parser.add_argument("--queries", type=int, default=200, help="Queries to fuse")
+    parser.add_argument("--overlap", type=float, default=0.5,
+                        help="Share of results that other providers also return")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    batches = [
+        {f"provider{p}": make_results(q, p, args.results, args.overlap, rng)
+         for p in range(args.providers)}
+        for q in range(args.queries)
+    ]
+
+    start = time.process_time()
+    unique = duplicates = 0
+    for ranked_lists in batches:
+        fused = fuse_results(ranked_lists)
+        unique += fused['unique']
+        duplicates += fused['duplicates']
+    elapsed = time.process_time() - start
+
+    total = args.providers * args.results
+    print(f"{args.queries} queries x {args.providers} providers x {args.results} results")
+    print(f"  per query:    {elapsed / args.queries * 1000:8.2f} ms CPU "
+          f"({total} results in, {unique / args.queries:.0f} unique out)")
+    print(f"  per result:   {elapsed / (args.queries * total) * 1e6:8.2f} us")
+    print(f"  duplicates:   {duplicates / args.queries:8.0f} per query")
+    print(f"  URL cache:    {canonicalize_url.cache_info().hits} hits, "
+          f"{canonicalize_url.cache_info().misses} misses")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Micro-benchmark: per-request CPU time GenericProvider spends building the request
+and normalizing a large mapped response, with precompiled templates/JMESPath
+versus re-parsing them on every request.
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_generic_normalize.py [--results 100] [--iterations 2000]
+"""
+
+import argparse
+import os
+import time
+
+import jmespath
+import yaml
+
+from search_api_webui.providers.generic import GenericProvider
+
+PROVIDERS_YAML = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'search_api_webui', 'providers.yaml'
+)
+
+
+def make_response(count):
+    """
+    Builds a synthetic response in the shape of the 'you' provider's API.
+    """
+    return {
+        "results": {
+            "web": [
+                {
+                    "title": f"Result title number {i}",
+                    "url": f"https://example.com/articles/{i}",
+                    "description": "A description of the page. " * 4,
+                    "snippets": [f"Snippet {i} with some matched text. " * 3]
+                }
+                for i in range(count)
+            ]
+        }
+    }
+
+
+def fill_template_uncompiled(template_obj, **kwargs):
+    # Mirrors the per-request template walk GenericProvider used before compilation
+    if isinstance(template_obj, str):
+        safe_kwargs = {k: (v if v is not None else '') for k, v in kwargs.items()}
+        try:
+            return template_obj.format(**safe_kwargs)
+        except KeyError:
+            return template_obj
+    elif isinstance(template_obj, dict):
+        return {k: fill_template_uncompiled(v, **kwargs) for k, v in template_obj.items()}
+    return template_obj
+
+
+def request_uncompiled(config, context, raw_data):
+    fill_template_uncompiled(config.get('headers', {}), **context)
+    fill_template_uncompiled(config.get('params', {}), **context)
+    fill_template_uncompiled(config.get('payload', {}), **context)
+
+    mapping = config.get('response_mapping', {})
+    root_list = jmespath.search(mapping.get('root_path', '@'), raw_data) or []
+    normalized_results = []
+    for item in root_list:
+        entry = {}
+        for std_key, source_path in mapping.get('fields', {}).items():
+            val = jmespath.search(source_path, item)
+            entry[std_key] = val if val else ""
+        normalized_results.append(entry)
+    return normalized_results
+
+
+def request_compiled(provider, context, raw_data):
+    provider.build_request(context)
+    return provider.normalize(raw_data)
+
+
+def cpu_time_per_call_us(fn, iterations):
+    start = time.process_time()
+    for _ in range(iterations):
+        fn()
+    return (time.process_time() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--results", type=int, default=100, help="Results per response")
+    parser.add_argument("--iterations", type=int, default=2000, help="Simulated requests")
+    args = parser.parse_args()
+
+    with open(PROVIDERS_YAML, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)['you']
+    config['name'] = 'you'
+
+    provider = GenericProvider(config)
+    raw_data = make_response(args.results)
+    context = {'query': 'python asyncio', 'api_key': 'key', 'limit': '10', 'language': 'en-US'}
+
+    # Both paths must produce identical output
+    assert request_compiled(provider, context, raw_data) == \
+        request_uncompiled(config, context, raw_data)
+
+    uncompiled = cpu_time_per_call_us(
+        lambda: request_uncompiled(config, context, raw_data), args.iterations
+    )
+    compiled = cpu_time_per_call_us(
+        lambda: request_compiled(provider, context, raw_data), args.iterations
+    )
+
+    print(f"{args.results} results, {args.iterations} iterations (CPU time per request)")
+    print(f"  uncompiled: {uncompiled:10.1f} us")
+    print(f"  compiled:   {compiled:10.1f} us")
+    print(f"  speedup:    {uncompiled / compiled:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Cold-start benchmark: time to import search_api_webui.app (from `python -X importtime`)
+and wall-clock time of `search-api-webui --help`, each in a fresh interpreter.
+Exits with status 1 if the median import time exceeds the target, so it can gate CI.
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_import_time.py [--runs 10] [--target-ms 300] [--top 10]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+MODULE = 'search_api_webui.app'
+
+
+def import_profile():
+    """
+    Imports the app in a fresh interpreter.
+
+    Returns:
+        tuple: (total import time in ms, {module: cumulative ms})
+    """
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {MODULE}'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        modules[name.strip()] = int(cumulative) / 1000
+    return modules[MODULE], modules
+
+
+def cli_startup_ms():
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, '-m', MODULE, '--help'],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Fresh interpreters per measurement")
+    parser.add_argument("--target-ms", type=float, default=300,
+                        help="Maximum median import time in milliseconds")
+    parser.add_argument("--top", type=int, default=10,
+                        help="Packages to list by import time")
+    args = parser.parse_args()
+
+    profiles = [import_profile() for _ in range(args.runs)]
+    import_ms = statistics.median(total for total, _ in profiles)
+    startup_ms = statistics.median(cli_startup_ms() for _ in range(args.runs))
+
+    # Break down the run closest to the median
+    _, modules = min(profiles, key=lambda profile: abs(profile[0] - import_ms))
+    top_level = {name: ms for name, ms in modules.items()
+                 if '.' not in name and name != MODULE}
+
+    print(f"{MODULE} import (median of {args.runs}): {import_ms:8.1f} ms")
+    print(f"CLI startup, --help (median):          {startup_ms:8.1f} ms")
+    print("Slowest packages:")
+    for name, ms in sorted(top_level.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:30s} {ms:8.1f} ms")
+
+    if import_ms > args.target_ms:
+        print(f"FAIL: import time exceeds the {args.target_ms:.0f} ms target")
+        return 1
+    print(f"OK: within the {args.target_ms:.0f} ms target")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
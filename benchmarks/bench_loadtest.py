@@ -0,0 +1,351 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Load test of the whole HTTP stack, fully offline: starts mock search upstreams
+(see mock_upstream.py) and the app in a fresh process pointed at them, then drives
+/api/search and an /api/arena fan-out at a fixed request rate.
+
+The load is open-loop: requests are sent on schedule whether or not earlier ones
+have completed, and latency is measured from the scheduled send time, so a server
+that falls behind shows up in the tail instead of slowing the load down. App-side
+overhead is the response time minus the upstream latency the app reports in
+`metrics`, i.e., the time spent in the server, dispatch and JSON handling.
+
+Usage:
+    pip install -e .
+    python benchmarks/bench_loadtest.py [--rps 50] [--duration 20] [--scenarios search arena] \\
+        [--server dev|serve|asgi] [--providers 3] [--latency-ms 50] [--max-overhead-p99-ms 25]
+
+Exits with status 1 if a scenario misses its target rate or the overhead target,
+so it can gate CI as a regression benchmark.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+import yaml
+
+from mock_upstream import add_arguments as add_upstream_arguments, to_arguments
+from search_api_webui.stats import percentile
+
+SCENARIOS = ('search', 'arena')
+SERVER_FLAGS = {'dev': [], 'serve': ['--serve'], 'asgi': ['--asgi']}
+STARTUP_TIMEOUT = 30   # Seconds the app gets to start answering
+REQUEST_TIMEOUT = 30
+MIN_RATE_RATIO = 0.95  # Share of the target rate a scenario must sustain
+MOCK_UPSTREAM = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'mock_upstream.py')
+
+_local = threading.local()
+
+
+def _session():
+    # One keep-alive connection per load generator thread, like independent clients
+    session = getattr(_local, 'session', None)
+    if session is None:
+        session = _local.session = requests.Session()
+    return session
+
+
+def write_user_config(home, upstream_url, provider_count):
+    """
+    Writes a providers.yaml override with `provider_count` mock providers, and API
+    keys for them, into the app's config directory under `home`.
+
+    Returns:
+        list[str]: The mock provider names.
+    """
+    config_dir = os.path.join(home, '.search-api-webui')
+    os.makedirs(config_dir, exist_ok=True)
+    names = [f'mock-{i}' for i in range(1, provider_count + 1)]
+    providers = {
+        name: {
+            'url': f'{upstream_url}/{name}',
+            'method': 'GET',
+            'params': {'query': '{query}'},
+            'response_mapping': {
+                'root_path': 'results.web',
+                'fields': {'title': 'title', 'url': 'url',
+                           'snippet': 'snippets[0] || description'}
+            }
+        }
+        for name in names
+    }
+    with open(os.path.join(config_dir, 'providers.yaml'), 'w', encoding='utf-8') as f:
+        yaml.safe_dump(providers, f)
+    with open(os.path.join(config_dir, 'config.json'), 'w', encoding='utf-8') as f:
+        json.dump({name: {'api_key': 'load-test'} for name in names}, f)
+    return names
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_until_serving(proc, url, what):
+    """
+    Polls `url` until it answers.
+
+    Raises:
+        RuntimeError: If the process exits or does not answer within STARTUP_TIMEOUT.
+    """
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"The {what} exited during startup (status {proc.returncode})")
+        try:
+            requests.get(url, timeout=1)
+            return
+        except requests.RequestException:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"The {what} did not answer within {STARTUP_TIMEOUT} s")
+
+
+def start_upstream(args, port, log_file):
+    """
+    Starts the mock upstream in its own process, so its threads do not compete
+    with the load generator's for the interpreter lock and skew upstream latency.
+    """
+    cmd = [sys.executable, MOCK_UPSTREAM, '--port', str(port)] + to_arguments(args)
+    proc = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT)
+    wait_until_serving(proc, f'http://127.0.0.1:{port}/', 'mock upstream')
+    return proc
+
+
+def start_app(home, port, server, log_file):
+    """
+    Starts the app in a fresh interpreter with its config under `home`, with the
+    result cache and history off so every request reaches the upstream.
+
+    Returns:
+        subprocess.Popen: The server process, once it answers requests.
+    """
+    # Not `-m search_api_webui.app`: main() must configure the module asgi.py imports
+    cmd = [sys.executable, '-c', 'from search_api_webui.app import main; main()',
+           '--no-browser', '--host', '127.0.0.1', '--port', str(port),
+           '--cache-ttl', '0', '--no-history'] + SERVER_FLAGS[server]
+    env = dict(os.environ, HOME=home, USERPROFILE=home)
+    proc = subprocess.Popen(cmd, env=env, stdout=log_file, stderr=subprocess.STDOUT)
+    wait_until_serving(proc, f'http://127.0.0.1:{port}/api/providers', 'app')
+    return proc
+
+
+def stop_process(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+
+
+def scenario_request(scenario, base_url, providers, query):
+    """
+    Returns:
+        tuple: (URL, JSON body) of a request for `query`.
+    """
+    if scenario == 'search':
+        return f'{base_url}/api/search', {'query': query, 'provider': providers[0]}
+    return f'{base_url}/api/arena', {'query': query, 'providers': providers}
+
+
+def upstream_latency_ms(scenario, payload):
+    """
+    Returns:
+        tuple: (upstream latency the app reported, whether any search failed).
+        A fan-out waits for its slowest provider.
+    """
+    if scenario == 'search':
+        results = [payload]
+    else:
+        results = payload.get('responses') or []
+    latency = max((result.get('metrics', {}).get('latency_ms', 0) for result in results),
+                  default=0)
+    return latency, any(result.get('error') for result in results)
+
+
+def timed_request(scenario, url, body, scheduled):
+    sent = time.perf_counter()
+    try:
+        response = _session().post(url, json=body, timeout=REQUEST_TIMEOUT)
+        payload = response.json()
+        end = time.perf_counter()
+        upstream_ms, failed = upstream_latency_ms(scenario, payload)
+        error = failed or response.status_code != 200
+    except (requests.RequestException, ValueError):
+        end = time.perf_counter()
+        upstream_ms, error = None, True
+    service_ms = (end - sent) * 1000
+    return {
+        'latency_ms': (end - scheduled) * 1000,
+        'overhead_ms': service_ms - upstream_ms if upstream_ms is not None else None,
+        'upstream_ms': upstream_ms,
+        'error': error
+    }
+
+
+def run_load(scenario, base_url, providers, rps, duration_s, max_in_flight,
+             query_prefix='load test query'):
+    """
+    Sends `rps` requests per second for `duration_s` seconds on a fixed schedule.
+    Every request has its own query, so none is coalesced with another.
+
+    Returns:
+        tuple: (samples, wall-clock seconds until the last response)
+    """
+    total = int(rps * duration_s)
+    executor = ThreadPoolExecutor(max_workers=max_in_flight)
+    futures = []
+    start = time.perf_counter()
+    for i in range(total):
+        scheduled = start + i / rps
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        url, body = scenario_request(scenario, base_url, providers, f'{query_prefix} {i}')
+        futures.append(executor.submit(timed_request, scenario, url, body, scheduled))
+    samples = [future.result() for future in futures]
+    elapsed_s = time.perf_counter() - start
+    executor.shutdown()
+    return samples, elapsed_s
+
+
+def summarize(scenario, rps, samples, elapsed_s):
+    latencies = sorted(sample['latency_ms'] for sample in samples)
+    overheads = sorted(sample['overhead_ms'] for sample in samples
+                       if sample['overhead_ms'] is not None and not sample['error'])
+    upstream = sorted(sample['upstream_ms'] for sample in samples
+                      if sample['upstream_ms'] is not None and not sample['error'])
+    errors = sum(1 for sample in samples if sample['error'])
+    return {
+        'scenario': scenario,
+        'target_rps': rps,
+        'achieved_rps': round(len(samples) / elapsed_s, 2) if elapsed_s else 0.0,
+        'requests': len(samples),
+        'errors': errors,
+        'error_rate': round(errors / len(samples), 4) if samples else 0.0,
+        'latency_p50_ms': round(percentile(latencies, 50), 2),
+        'latency_p90_ms': round(percentile(latencies, 90), 2),
+        'latency_p99_ms': round(percentile(latencies, 99), 2),
+        'latency_max_ms': round(latencies[-1], 2) if latencies else 0.0,
+        'upstream_p50_ms': round(percentile(upstream, 50), 2),
+        'overhead_p50_ms': round(percentile(overheads, 50), 2),
+        'overhead_p99_ms': round(percentile(overheads, 99), 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rps", type=float, default=50, help="Requests per second to send")
+    parser.add_argument("--duration", type=float, default=20, help="Seconds per scenario")
+    parser.add_argument("--warmup", type=float, default=2,
+                        help="Seconds of unrecorded load before each scenario")
+    parser.add_argument("--scenarios", nargs='+', choices=SCENARIOS, default=list(SCENARIOS),
+                        help="'search' hits /api/search, 'arena' fans out to every provider")
+    parser.add_argument("--server", choices=sorted(SERVER_FLAGS), default='dev',
+                        help="How the app is served: Flask's dev server, --serve or --asgi")
+    parser.add_argument("--providers", type=int, default=3,
+                        help="Mock providers, all queried by the arena scenario")
+    parser.add_argument("--max-in-flight", type=int, default=256,
+                        help="Requests the load generator keeps open at most")
+    parser.add_argument("--max-overhead-p99-ms", type=float,
+                        help="Fail if a scenario's p99 app-side overhead exceeds this")
+    parser.add_argument("--format", choices=('text', 'json'), default='text',
+                        help="Report format")
+    add_upstream_arguments(parser)
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp(prefix='search-api-webui-loadtest-')
+    log_path = os.path.join(home, 'server.log')
+    upstream_port = free_port()
+    providers = write_user_config(home, f'http://127.0.0.1:{upstream_port}', args.providers)
+    base_url = f'http://127.0.0.1:{free_port()}'
+
+    rows = []
+    processes = []
+    try:
+        with open(log_path, 'wb') as log_file:
+            try:
+                processes.append(start_upstream(args, upstream_port, log_file))
+                processes.append(start_app(home, base_url.rsplit(':', 1)[1], args.server,
+                                           log_file))
+                for scenario in args.scenarios:
+                    if args.warmup > 0:
+                        run_load(scenario, base_url, providers, args.rps, args.warmup,
+                                 args.max_in_flight, query_prefix=f'warm-up {scenario}')
+                    samples, elapsed_s = run_load(
+                        scenario, base_url, providers, args.rps, args.duration,
+                        args.max_in_flight
+                    )
+                    rows.append(summarize(scenario, args.rps, samples, elapsed_s))
+            finally:
+                for proc in reversed(processes):
+                    stop_process(proc)
+    except RuntimeError as e:
+        print(f"Error: {e}. Server log: {log_path}")
+        return 1
+
+    shutil.rmtree(home, ignore_errors=True)
+
+    if args.format == 'json':
+        json.dump(rows, sys.stdout, indent=2)
+        print()
+    else:
+        print(f"{args.server} server, {args.providers} mock provider(s), "
+              f"{args.latency_dist} upstream latency (median {args.latency_ms:g} ms)")
+        for row in rows:
+            print(f"{row['scenario']}: {row['achieved_rps']:.1f}/{row['target_rps']:g} rps, "
+                  f"{row['requests']} requests, {row['errors']} errors")
+            print(f"  latency   p50 {row['latency_p50_ms']:8.1f}"
+                  f"  p90 {row['latency_p90_ms']:8.1f}"
+                  f"  p99 {row['latency_p99_ms']:8.1f}  max {row['latency_max_ms']:8.1f} ms")
+            print(f"  overhead  p50 {row['overhead_p50_ms']:8.1f}"
+                  f"  p99 {row['overhead_p99_ms']:8.1f} ms"
+                  f" (upstream p50 {row['upstream_p50_ms']:.1f} ms)")
+
+    failed = False
+    for row in rows:
+        if row['achieved_rps'] < row['target_rps'] * MIN_RATE_RATIO:
+            print(f"FAIL: {row['scenario']} sustained {row['achieved_rps']} of "
+                  f"{row['target_rps']:g} rps", file=sys.stderr)
+            failed = True
+        if (args.max_overhead_p99_ms is not None
+                and row['overhead_p99_ms'] > args.max_overhead_p99_ms):
+            print(f"FAIL: {row['scenario']} p99 overhead {row['overhead_p99_ms']} ms exceeds "
+                  f"{args.max_overhead_p99_ms:g} ms", file=sys.stderr)
+            failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Mock search upstream for offline load tests: answers any GET or POST with a response
+in the shape of the 'you' provider's API ({"results": {"web": [...]}}), after a
+latency drawn from a configurable distribution. A share of requests can be failed
+with a 500 or throttled with a 429 and a Retry-After header.
+
+Usage:
+    python benchmarks/mock_upstream.py [--port 9100] [--latency-ms 50] \\
+        [--latency-dist lognormal] [--results 10] [--error-rate 0.01] [--throttle-rate 0.01]
+
+Point a provider at it in ~/.search-api-webui/providers.yaml:
+
+    mock:
+      url: "http://127.0.0.1:9100/search"
+      params: {query: "{query}"}
+      response_mapping:
+        root_path: "results.web"
+        fields: {title: "title", url: "url", snippet: "snippets[0] || description"}
+"""
+
+import argparse
+import json
+import math
+import random
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+LATENCY_DISTRIBUTIONS = ('fixed', 'uniform', 'exponential', 'lognormal')
+
+
+def make_body(results, snippet_bytes):
+    """
+    Builds the JSON response body, once, so serving it costs no CPU per request.
+    """
+    filler = ('lorem ipsum dolor sit amet ' * (snippet_bytes // 27 + 1))[:snippet_bytes]
+    return json.dumps({
+        "results": {
+            "web": [
+                {
+                    "title": f"Mock result {i}",
+                    "url": f"https://example.com/mock/{i}",
+                    "description": filler,
+                    "snippets": [filler]
+                }
+                for i in range(results)
+            ]
+        }
+    }).encode('utf-8')
+
+
+class MockUpstream:
+    """
+    A threaded HTTP server playing a search API.
+
+    Usage:
+        upstream = MockUpstream(latency_ms=50, error_rate=0.01)
+        upstream.start()              # Binds an ephemeral port unless one is given
+        ... upstream.url ...
+        upstream.stop()
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency_ms=50.0, latency_dist='lognormal',
+                 jitter=0.5, results=10, snippet_bytes=200, error_rate=0.0,
+                 throttle_rate=0.0, retry_after=1, seed=None):
+        """
+        Args:
+            latency_ms (float): Median response latency (the mean for 'exponential').
+            latency_dist (str): One of LATENCY_DISTRIBUTIONS.
+            jitter (float): Spread of the distribution: the sigma of 'lognormal', or the
+                relative half-width of 'uniform'.
+            results (int): Results per response.
+            snippet_bytes (int): Length of each result's description and snippet.
+            error_rate (float): Share of requests answered with a 500.
+            throttle_rate (float): Share of requests answered with a 429.
+            retry_after (int): Retry-After seconds sent with a 429.
+            seed (int): Seed for reproducible latencies and failures.
+        """
+        if latency_dist not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution: {latency_dist}")
+        self.latency_ms = latency_ms
+        self.latency_dist = latency_dist
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.body = make_body(results, snippet_bytes)
+        self.requests = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _draw(self):
+        """
+        Returns:
+            tuple: (delay in seconds, HTTP status) for the next request.
+        """
+        with self._lock:
+            self.requests += 1
+            if self.latency_dist == 'fixed':
+                latency_ms = self.latency_ms
+            elif self.latency_dist == 'uniform':
+                spread = self.latency_ms * self.jitter
+                latency_ms = self._rng.uniform(self.latency_ms - spread, self.latency_ms + spread)
+            elif self.latency_dist == 'exponential':
+                latency_ms = self._rng.expovariate(1 / self.latency_ms) if self.latency_ms else 0
+            else:
+                latency_ms = self._rng.lognormvariate(math.log(max(self.latency_ms, 0.001)),
+                                                      self.jitter)
+            roll = self._rng.random()
+        if roll < self.error_rate:
+            status = 500
+        elif roll < self.error_rate + self.throttle_rate:
+            status = 429
+        else:
+            status = 200
+        return max(latency_ms, 0) / 1000, status
+
+    def _handler_class(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # Keep-alive, like real search APIs
+
+            def setup(self):
+                super().setup()
+                # Headers and body are written separately; without this, Nagle's
+                # algorithm and delayed ACKs add ~40 ms to every response
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            def do_GET(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+                delay, status = upstream._draw()
+                time.sleep(delay)
+                if status == 200:
+                    body = upstream.body
+                else:
+                    body = json.dumps({"error": f"Mock upstream returned {status}"}).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                if status == 429:
+                    self.send_header('Retry-After', str(upstream.retry_after))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_POST = do_GET
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def start(self):
+        """
+        Serves on a daemon thread and returns the upstream.
+        """
+        self._thread = threading.Thread(
+            target=self.serve_forever, name='mock-upstream', daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def add_arguments(parser):
+    """
+    Adds the mock's settings to an argument parser (shared with bench_loadtest.py).
+    """
+    parser.add_argument("--latency-ms", type=float, default=50,
+                        help="Median upstream latency in milliseconds")
+    parser.add_argument("--latency-dist", choices=LATENCY_DISTRIBUTIONS, default='lognormal',
+                        help="Distribution of upstream latencies")
+    parser.add_argument("--jitter", type=float, default=0.5,
+                        help="Spread of the latency distribution (lognormal sigma)")
+    parser.add_argument("--results", type=int, default=10, help="Results per response")
+    parser.add_argument("--snippet-bytes", type=int, default=200,
+                        help="Size of each result's snippet, to scale the payload")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Share of upstream requests failed with a 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0,
+                        help="Share of upstream requests throttled with a 429")
+    parser.add_argument("--seed", type=int, help="Seed for reproducible runs")
+
+
+def to_arguments(args):
+    """
+    Returns:
+        list[str]: Command line options reproducing the mock settings in `args`.
+    """
+    argv = ['--latency-ms', str(args.latency_ms), '--latency-dist', args.latency_dist,
+            '--jitter', str(args.jitter), '--results', str(args.results),
+            '--snippet-bytes', str(args.snippet_bytes), '--error-rate', str(args.error_rate),
+            '--throttle-rate', str(args.throttle_rate)]
+    if args.seed is not None:
+        argv += ['--seed', str(args.seed)]
+    return argv
+
+
+def from_arguments(args, port=0):
+    return MockUpstream(
+        port=port, latency_ms=args.latency_ms, latency_dist=args.latency_dist,
+        jitter=args.jitter, results=args.results, snippet_bytes=args.snippet_bytes,
+        error_rate=args.error_rate, throttle_rate=args.throttle_rate, seed=args.seed
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=9100, help="Port to listen on")
+    add_arguments(parser)
+    args = parser.parse_args()
+
+    upstream = from_arguments(args, args.port)
+    print(f"Mock search upstream listening on {upstream.url} "
+          f"({args.latency_dist} latency, median {args.latency_ms:g} ms)")
+    try:
+        upstream.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        upstream.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -20,7 +20,7 @@
  * DEALINGS IN THE SOFTWARE.
  */
 
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { useNavigate } from 'react-router-dom';
 import {
     ArrowLeft,
@@ -52,6 +52,10 @@ function ArenaPage() {
     const [leftResult, setLeftResult] = useState(null);
     const [rightResult, setRightResult] = useState(null);
 
+    // The arena stream in progress, closed when a new comparison starts or on unmount
+    const sourceRef = useRef(null);
+    useEffect(() => () => sourceRef.current?.close(), []);
+
     // Initial Load
     useEffect(() => {
         fetch('/api/providers')
@@ -69,35 +73,21 @@ function ArenaPage() {
             .catch(console.error);
     }, []);
 
-    const performSearch = async (provider, queryText) => {
-        try {
-            const start = performance.now();
-            const res = await fetch('/api/search', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ query: queryText, provider: provider }),
-            });
-            const data = await res.json();
-            const end = performance.now();
-            
-            // Client-side measured latency fallback if server doesn't provide it
-            const clientLatency = Math.round(end - start);
-            
-            if (data.error) return { error: data.error };
-            
-            return {
-                results: data.results || [],
-                metrics: {
-                    latency_ms: data.metrics?.latency_ms || clientLatency,
-                    size_bytes: data.metrics?.size_bytes || 0
-                }
-            };
-        } catch (err) {
-            return { error: 'Network Error' };
-        }
+    const normalizeResult = (data, clientLatency) => {
+        if (!data || data.error) return { error: data?.error || 'Unknown Error' };
+
+        return {
+            results: data.results || [],
+            metrics: {
+                ...data.metrics,
+                latency_ms: data.metrics?.latency_ms || clientLatency,
+                size_bytes: data.metrics?.size_bytes || 0,
+                cache_hit: data.metrics?.cache_hit || false
+            }
+        };
     };
 
-    const handleCompare = async (e) => {
+    const handleCompare = (e) => {
         e.preventDefault();
         if (!query.trim()) return;
 
@@ -105,15 +95,43 @@ function ArenaPage() {
         setLeftResult(null);
         setRightResult(null);
 
-        // Run in parallel
-        const [res1, res2] = await Promise.all([
-            performSearch(leftProvider, query),
-            performSearch(rightProvider, query)
-        ]);
+        // Both providers are searched concurrently on the server; each column is
+        // filled in as soon as its provider answers
+        const params = new URLSearchParams({ query: query });
+        params.append('providers', leftProvider);
+        params.append('providers', rightProvider);
+
+        sourceRef.current?.close();
+        const start = performance.now();
+        const source = new EventSource(`/api/arena/stream?${params}`);
+        sourceRef.current = source;
+        const setters = [setLeftResult, setRightResult];
 
-        setLeftResult(res1);
-        setRightResult(res2);
-        setLoading(false);
+        const finish = () => {
+            source.close();
+            if (sourceRef.current === source) sourceRef.current = null;
+            setLoading(false);
+        };
+
+        source.addEventListener('result', (event) => {
+            const data = JSON.parse(event.data);
+            // Client-side measured latency fallback if server doesn't provide it
+            const clientLatency = Math.round(performance.now() - start);
+            setters[data.index]?.(normalizeResult(data, clientLatency));
+        });
+        source.addEventListener('done', finish);
+        source.addEventListener('failed', (event) => {
+            const { error } = JSON.parse(event.data);
+            setLeftResult({ error });
+            setRightResult({ error });
+            finish();
+        });
+        source.onerror = () => {
+            // Fired when the connection drops; fill in columns that are still waiting
+            setLeftResult((prev) => prev || { error: 'Network Error' });
+            setRightResult((prev) => prev || { error: 'Network Error' });
+            finish();
+        };
     };
 
     return (
@@ -157,7 +175,7 @@ function ArenaPage() {
                     onSelect={setLeftProvider}
                     result={leftResult}
                     opponentResult={rightResult}
-                    loading={loading}
+                    loading={loading && !leftResult}
                 />
 
                 {/* Right Column */}
@@ -168,7 +186,7 @@ function ArenaPage() {
                     onSelect={setRightProvider}
                     result={rightResult}
                     opponentResult={leftResult}
-                    loading={loading}
+                    loading={loading && !rightResult}
                 />
             </div>
         </div>
@@ -230,6 +248,12 @@ function ArenaColumn({ side, providers, selected, onSelect, result, opponentResu
                                 </span>
                             </div>
                         </div>
+
+                        <PhaseBreakdown metrics={result.metrics} />
+
+                        {result.metrics.cache_hit && (
+                            <Badge variant="success">Cached</Badge>
+                        )}
                     </div>
                 )}
             </Card>
@@ -264,4 +288,37 @@ function ArenaColumn({ side, providers, selected, onSelect, result, opponentResu
     );
 }
 
+const PHASES = [
+    ['dns_ms', 'DNS'],
+    ['tcp_ms', 'TCP'],
+    ['tls_ms', 'TLS'],
+    ['ttfb_ms', 'TTFB'],
+    ['download_ms', 'Download'],
+    ['decode_ms', 'Decode'],
+    ['normalize_ms', 'Normalize'],
+];
+
+function PhaseBreakdown({ metrics }) {
+    // Only providers whose HTTP calls are instrumented report phase timings
+    if (metrics.ttfb_ms === undefined) return null;
+
+    return (
+        <div className="grid grid-cols-2 gap-x-4 gap-y-1 text-xs text-gray-600 pt-2 border-t border-gray-100">
+            {PHASES.map(([key, label]) => (
+                <div key={key} className="flex justify-between">
+                    <span>{label}</span>
+                    <span className="font-mono text-gray-900">{metrics[key] ?? 0}ms</span>
+                </div>
+            ))}
+            <div className="flex justify-between">
+                <span>Wire</span>
+                <span className="font-mono text-gray-900">{metrics.wire_bytes ?? 0} B</span>
+            </div>
+            <div className="col-span-2 text-gray-400">
+                {metrics.connection_reused ? 'Reused connection' : 'New connection'}
+            </div>
+        </div>
+    );
+}
+
 export default ArenaPage;
@@ -306,6 +306,9 @@ function SearchPage() {
                                         <Database className="w-3 h-3" />
                                         {metrics.size_bytes} B
                                     </Badge>
+                                    {metrics.cache_hit && (
+                                        <Badge variant="success">Cached</Badge>
+                                    )}
                                 </div>
                             )}
                         </div>
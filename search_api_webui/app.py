@@ -18,13 +18,22 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-import json
 import os
-import webbrowser
+import sys
+import time
 from pathlib import Path
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, abort, request, jsonify, send_from_directory
 from flask_cors import CORS
+from search_api_webui.cache import DiskCache, MemoryCache, ResultCache
+from search_api_webui.compression import compress_response_body, negotiate_encoding
+from search_api_webui.config_store import ConfigStore
+from search_api_webui.dispatcher import DEFAULT_MAX_WORKERS, SearchDispatcher, SearchJob
+from search_api_webui.fusion import DEFAULT_RRF_K, fuse_results
+from search_api_webui.history import DEFAULT_PAGE_SIZE, SearchHistory, parse_duration
+from search_api_webui.jsonutil import DefaultJSONProvider, FastJSONProvider, dumps_str
 from search_api_webui.providers import load_providers
+from search_api_webui.static_assets import StaticAssets
+from search_api_webui.telemetry import CONTENT_TYPE as METRICS_CONTENT_TYPE, SearchTelemetry
 
 CURRENT_DIR = Path(__file__).resolve().parent
 
@@ -34,53 +43,162 @@ if not STATIC_FOLDER.exists():
     if DEV_FRONTEND_DIST.exists():
         STATIC_FOLDER = DEV_FRONTEND_DIST
 
+static_assets = StaticAssets(STATIC_FOLDER)
+
 app = Flask(__name__, static_folder='static')
+if DefaultJSONProvider is not None:
+    app.json = FastJSONProvider(app)
 CORS(app)
 
 PROVIDERS_YAML = CURRENT_DIR / 'providers.yaml'
 USER_CONFIG_DIR = Path.home() / '.search-api-webui'
 USER_CONFIG_JSON = USER_CONFIG_DIR / 'config.json'
+USER_CACHE_DB = USER_CONFIG_DIR / 'cache.sqlite3'
+USER_PROVIDERS_YAML = USER_CONFIG_DIR / 'providers.yaml'
+USER_RECORDINGS = USER_CONFIG_DIR / 'recordings.jsonl.gz'
+USER_HISTORY_DB = USER_CONFIG_DIR / 'history.sqlite3'
 
 if not USER_CONFIG_DIR.exists():
     USER_CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
-if PROVIDERS_YAML.exists():
-    provider_map = load_providers(str(PROVIDERS_YAML))
-else:
-    print(f"Error: Configuration file not found at {PROVIDERS_YAML}")
-    provider_map = {}
+# Providers are imported and instantiated on first use, and reloaded when
+# providers.yaml or the user's override file changes
+provider_map = load_providers(str(PROVIDERS_YAML), str(USER_PROVIDERS_YAML))
+
+dispatcher = SearchDispatcher(provider_map, cache=ResultCache(), telemetry=SearchTelemetry())
+
+config_store = ConfigStore(USER_CONFIG_JSON)
+
 
 def get_stored_config():
-    if not USER_CONFIG_JSON.exists():
-        return {}
-    try:
-        with open(USER_CONFIG_JSON, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Error reading config: {e}")
-        return {}
+    return config_store.get()
+
 
 def save_stored_config(config_dict):
-    try:
-        with open(USER_CONFIG_JSON, 'w', encoding='utf-8') as f:
-            json.dump(config_dict, f, indent=2)
-    except Exception as e:
-        print(f"Error saving config: {e}")
+    config_store.save(config_dict)
+
+
+def get_provider_settings(stored_config, provider_name):
+    """
+    Returns the user's stored settings for a provider as a dict.
+    Older config files stored a bare API key string per provider.
+    """
+    provider_config = stored_config.get(provider_name, {})
+    if isinstance(provider_config, str):
+        provider_config = {'api_key': provider_config}
+    return provider_config
+
+
+def requires_api_key(provider_name):
+    """
+    Whether searches need a configured API key; replay providers, for one, do not.
+    """
+    if provider_name not in provider_map:
+        return True
+    return provider_map.config(provider_name).get('requires_api_key', True)
+
+
+def build_search_kwargs(provider_config):
+    return {
+        'api_url': provider_config.get('api_url'),
+        'limit': provider_config.get('limit'),
+        'language': provider_config.get('language')
+    }
+
+
+def reload_providers():
+    """
+    Replaces every provider instance, and with it every connection pool, in place.
+    Called in each forked server worker so no socket or keep-alive thread state is
+    shared with the parent process. The old instances are dropped without being
+    closed: their connections belong to the parent.
+    """
+    provider_map.reset()
+
+
+def close_providers():
+    """
+    Closes all provider connections and stops accepting searches, on shutdown.
+    Searches still queued for the history are written first.
+    """
+    dispatcher.shutdown(wait=False)
+    if dispatcher.history is not None:
+        dispatcher.history.close()
+    for provider in provider_map.instances():
+        provider.close()
+
+
+def configure_cache(cache_ttl, cache_size, disk_cache):
+    """
+    Installs the result cache described by the command line options.
+
+    Args:
+        cache_ttl (int): Seconds a result stays cached; 0 or less disables the cache.
+        cache_size (int): Maximum number of results kept in memory.
+        disk_cache (bool): Also persist results to USER_CACHE_DB.
+    """
+    if cache_ttl <= 0:
+        dispatcher.cache = None
+    else:
+        disk = DiskCache(USER_CACHE_DB, ttl=cache_ttl) if disk_cache else None
+        dispatcher.cache = ResultCache(MemoryCache(cache_size, cache_ttl), disk)
+
+
+def configure_history(enabled):
+    """
+    Starts recording every search to USER_HISTORY_DB, unless disabled.
+    Queued searches are written when the process exits.
+    """
+    if not enabled:
+        dispatcher.history = None
+        return
+    import atexit
+
+    dispatcher.history = SearchHistory(USER_HISTORY_DB)
+    atexit.register(dispatcher.history.close)
+
+
+def prewarm_providers(names=None):
+    """
+    Opens connections to every configured provider in the background, so the first
+    search does not pay for connection setup.
+
+    Args:
+        names (list[str]): Only warm these providers, if given.
+    """
+    stored_config = get_stored_config()
+    for name in (provider_map if names is None else names):
+        settings = get_provider_settings(stored_config, name)
+        provider = provider_map.get(name) if settings.get('api_key') else None
+        if provider:
+            provider.prewarm(settings.get('api_key'), settings.get('api_url'))
+
+
+def on_providers_reloaded(names):
+    """
+    Called after providers.yaml changed: drops cached results, which may have been
+    produced with an old response mapping, and warms the replaced providers.
+    """
+    if dispatcher.cache is not None:
+        dispatcher.cache.clear()
+    prewarm_providers([name for name in names if name in provider_map])
+
+
+provider_map.on_reload = on_providers_reloaded
+
 
 @app.route('/api/providers', methods=['GET'])
 def get_providers_list():
     stored_config = get_stored_config()
     providers_info = []
 
-    for name, provider_instance in provider_map.items():
-        config_details = provider_instance.config
+    for name in provider_map:
+        # Listing providers does not instantiate them
+        config_details = provider_map.config(name)
 
-        user_conf = stored_config.get(name, {})
-        
-        if isinstance(user_conf, str):
-            user_conf = {'api_key': user_conf}
+        user_conf = get_provider_settings(stored_config, name)
 
-        has_key = bool(user_conf.get('api_key'))
+        has_key = bool(user_conf.get('api_key')) or not requires_api_key(name)
 
         providers_info.append({
             "name": name,
@@ -94,6 +212,7 @@ def get_providers_list():
         })
     return jsonify(providers_info)
 
+
 @app.route('/api/config', methods=['POST'])
 def update_config():
     data = request.json
@@ -111,84 +230,594 @@ def update_config():
     limit = data.get('limit', '10')
     language = data.get('language', 'en-US')
 
-    all_config = get_stored_config()
+    def apply_update(all_config):
+        if provider_name in all_config and isinstance(all_config[provider_name], str):
+            all_config[provider_name] = {'api_key': all_config[provider_name]}
 
-    if provider_name in all_config and isinstance(all_config[provider_name], str):
-        all_config[provider_name] = {'api_key': all_config[provider_name]}
+        if not api_key:
+            if provider_name in all_config:
+                all_config[provider_name]['api_key'] = ""
+        else:
+            if provider_name not in all_config:
+                all_config[provider_name] = {}
 
-    if not api_key:
-        if provider_name in all_config:
-            all_config[provider_name]['api_key'] = ""
-    else:
-        if provider_name not in all_config:
-            all_config[provider_name] = {}
+            all_config[provider_name]['api_key'] = api_key
+            all_config[provider_name]['api_url'] = api_url
+            all_config[provider_name]['limit'] = limit
+            all_config[provider_name]['language'] = language
 
-        all_config[provider_name]['api_key'] = api_key
-        all_config[provider_name]['api_url'] = api_url
-        all_config[provider_name]['limit'] = limit
-        all_config[provider_name]['language'] = language
+    config_store.update(apply_update)
 
-    save_stored_config(all_config)
+    # Connect to the (possibly new) endpoint before the user's next search
+    provider = provider_map.get(provider_name)
+    if provider and api_key:
+        provider.prewarm(api_key, api_url)
     return jsonify({"status": "success"})
 
-@app.route('/api/search', methods=['POST'])
-def search_api():
-    data = request.json
+
+class ApiError(Exception):
+    """
+    A client-facing API error, rendered as {"error": message} with the given HTTP status.
+    """
+
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+@app.errorhandler(ApiError)
+def handle_api_error(e):
+    return jsonify({"error": e.message}), e.status
+
+
+def prepare_search(data):
+    """
+    Validates a /api/search request body and resolves the provider settings.
+    With "raw": true the upstream payload is returned as received (see raw_response),
+    bypassing the cache.
+
+    Returns:
+        SearchJob: The search to run.
+
+    Raises:
+        ApiError: If the API key is missing or the provider is unknown.
+    """
     query = data.get('query')
     provider_name = data.get('provider', 'querit')
 
     api_key = data.get('api_key')
 
     stored_config = get_stored_config()
-    provider_config = stored_config.get(provider_name, {})
-
-    if isinstance(provider_config, str):
-        provider_config = {'api_key': provider_config}
+    provider_config = get_provider_settings(stored_config, provider_name)
 
     if not api_key:
         api_key = provider_config.get('api_key')
 
-    if not api_key:
-        return jsonify({"error": f"API Key for {provider_name} is missing. Please configure it."}), 401
+    if not api_key and requires_api_key(provider_name):
+        raise ApiError(f"API Key for {provider_name} is missing. Please configure it.", 401)
 
     provider = provider_map.get(provider_name)
     if not provider:
-        return jsonify({"error": "Provider not found"}), 404
+        raise ApiError("Provider not found", 404)
 
-    search_kwargs = {
-        'api_url': provider_config.get('api_url'),
-        'limit': provider_config.get('limit'),
-        'language': provider_config.get('language')
+    search_kwargs = build_search_kwargs(provider_config)
+
+    use_cache = not data.get('no_cache', False)
+    if data.get('raw'):
+        search_kwargs['raw'] = True
+        use_cache = False
+
+    return SearchJob(provider_name, query, api_key, use_cache=use_cache, **search_kwargs)
+
+
+def raw_response(result):
+    """
+    Splits the result of a raw search into the upstream payload, unparsed and not
+    re-encoded, and headers carrying the content type and the metrics (as JSON in
+    X-Search-Metrics).
+
+    Returns:
+        tuple: (body bytes, headers dict), or None if the search failed or the
+        provider does not support raw payloads.
+    """
+    if 'raw_body' not in result:
+        return None
+    headers = {
+        'Content-Type': result.get('raw_content_type') or 'application/octet-stream',
+        'X-Search-Metrics': dumps_str(result.get('metrics', {}))
     }
+    return result['raw_body'], headers
+
+
+class ArenaPlan:
+    """
+    A validated /api/arena request: the searches to run and where their results go.
+    Providers that cannot be searched already have an error response in their slot.
+    """
+
+    def __init__(self, query, responses, jobs, job_slots):
+        self.query = query
+        self.responses = responses
+        self.jobs = jobs
+        self.job_slots = job_slots
+        self.start_time = time.perf_counter()
+
+    def _fill(self, results):
+        responses = list(self.responses)
+        for idx, result in zip(self.job_slots, results):
+            responses[idx] = result
+        return responses
+
+    def to_response(self, results):
+        """
+        Fills the job results into their slots and builds the response body.
+        """
+        return {
+            "query": self.query,
+            "responses": self._fill(results),
+            "elapsed_ms": self._elapsed_ms()
+        }
+
+    def to_fused_response(self, results, k=DEFAULT_RRF_K, max_results=None):
+        """
+        Builds the /api/search/fused response body: the providers' results merged
+        into one ranked list, with per-provider summaries and overlap statistics.
+        """
+        responses = self._fill(results)
+        # A provider may fill several slots (e.g., with different settings); each slot
+        # keeps its own list under a unique label
+        names = [response['provider'] for response in responses]
+        labels = [name if names.count(name) == 1 else f'{name}#{idx + 1}'
+                  for idx, name in enumerate(names)]
+        ranked_lists = {label: response.get('results') or []
+                        for label, response in zip(labels, responses)
+                        if not response.get('error')}
+
+        fusion_start = time.perf_counter()
+        fused = fuse_results(ranked_lists, k, max_results)
+        fusion_ms = round((time.perf_counter() - fusion_start) * 1000, 2)
+
+        providers = []
+        for label, response in zip(labels, responses):
+            summary = {
+                "provider": response['provider'],
+                "label": label,
+                "results": len(response.get('results') or []),
+                "latency_ms": response.get('metrics', {}).get('latency_ms', 0),
+                "elapsed_ms": response.get('elapsed_ms', 0)
+            }
+            if response.get('error'):
+                summary['error'] = response['error']
+            providers.append(summary)
+
+        return {
+            "query": self.query,
+            "results": fused['results'],
+            "providers": providers,
+            "overlap": fused['overlap'],
+            "metrics": {
+                "unique_results": fused['unique'],
+                "duplicates": fused['duplicates'],
+                "fusion_ms": fusion_ms
+            },
+            "elapsed_ms": self._elapsed_ms()
+        }
+
+    def _elapsed_ms(self):
+        return round((time.perf_counter() - self.start_time) * 1000, 2)
+
+    def initial_events(self):
+        """
+        Returns:
+            list[tuple]: ('result', response) events for providers that were rejected
+            up front; each response carries its slot as 'index'.
+        """
+        return [('result', dict(response, index=idx))
+                for idx, response in enumerate(self.responses) if response is not None]
+
+    def result_event(self, job_index, result):
+        return 'result', dict(result, index=self.job_slots[job_index])
+
+    def done_event(self):
+        return 'done', {"query": self.query, "elapsed_ms": self._elapsed_ms()}
+
+    def stream(self, completed):
+        """
+        Yields (event, payload) pairs: one 'result' per provider as soon as it is
+        available, then a 'done' summary.
+
+        Args:
+            completed: Iterable of (job index, result) pairs in completion order.
+        """
+        yield from self.initial_events()
+        for job_index, result in completed:
+            yield self.result_event(job_index, result)
+        yield self.done_event()
+
+
+def prepare_arena(data):
+    """
+    Validates a /api/arena request body and builds one search job per provider.
+
+    Returns:
+        ArenaPlan: The planned fan-out.
+
+    Raises:
+        ApiError: If the query or the provider list is missing.
+    """
+    query = data.get('query')
+    provider_names = data.get('providers')
+    use_cache = not data.get('no_cache', False)
+
+    if not query:
+        raise ApiError("Query is required", 400)
+    if not isinstance(provider_names, list) or not provider_names:
+        raise ApiError("A non-empty list of providers is required", 400)
+
+    # Read the stored config once for the whole fan-out
+    stored_config = get_stored_config()
+    responses = [None] * len(provider_names)
+    jobs = []
+    job_slots = []
+
+    for idx, provider_name in enumerate(provider_names):
+        provider_config = get_provider_settings(stored_config, provider_name)
+        api_key = provider_config.get('api_key')
+
+        if provider_name not in provider_map:
+            error = "Provider not found"
+        elif not api_key and requires_api_key(provider_name):
+            error = f"API Key for {provider_name} is missing. Please configure it."
+        else:
+            error = None
+
+        if error:
+            responses[idx] = {
+                "provider": provider_name,
+                "error": error,
+                "results": [],
+                "metrics": {"latency_ms": 0, "size_bytes": 0},
+                "elapsed_ms": 0
+            }
+            continue
+
+        search_kwargs = build_search_kwargs(provider_config)
+        jobs.append(SearchJob(provider_name, query, api_key, use_cache=use_cache, **search_kwargs))
+        job_slots.append(idx)
+
+    return ArenaPlan(query, responses, jobs, job_slots)
+
 
-    result = provider.search(query, api_key, **search_kwargs)
+@app.route('/api/search', methods=['POST'])
+def search_api():
+    job = prepare_search(request.json)
+    result = dispatcher.search(
+        job.provider_name, job.query, job.api_key, use_cache=job.use_cache, **job.kwargs
+    )
+    raw = raw_response(result)
+    if raw is not None:
+        body, headers = raw
+        return Response(body, headers=headers)
     return jsonify(result)
 
+
+@app.route('/api/arena', methods=['POST'])
+def arena_api():
+    """
+    Runs one query against several providers concurrently and returns all results
+    in a single response, in the order the providers were requested.
+    """
+    plan = prepare_arena(request.json or {})
+    return jsonify(plan.to_response(dispatcher.search_many(plan.jobs)))
+
+
+def fusion_options(data):
+    """
+    Reads the optional fusion settings of a /api/search/fused request body:
+    'k', the RRF constant, and 'max_results', the length of the fused list.
+
+    Returns:
+        tuple: (k, max_results)
+
+    Raises:
+        ApiError: If a setting is not a positive integer.
+    """
+    try:
+        k = int(data.get('k') or DEFAULT_RRF_K)
+        max_results = data.get('max_results')
+        max_results = int(max_results) if max_results else None
+    except (TypeError, ValueError):
+        raise ApiError("'k' and 'max_results' must be integers", 400)
+    if k < 1 or (max_results is not None and max_results < 1):
+        raise ApiError("'k' and 'max_results' must be positive", 400)
+    return k, max_results
+
+
+@app.route('/api/search/fused', methods=['POST'])
+def fused_search_api():
+    """
+    Runs one query against several providers concurrently, like /api/arena, and
+    merges their results into one list ranked by reciprocal rank fusion.
+    """
+    data = request.json or {}
+    k, max_results = fusion_options(data)
+    plan = prepare_arena(data)
+    return jsonify(plan.to_fused_response(dispatcher.search_many(plan.jobs), k, max_results))
+
+
+def format_sse(event, payload):
+    """
+    Encodes one Server-Sent Event with a JSON payload.
+    """
+    return f"event: {event}\ndata: {dumps_str(payload)}\n\n"
+
+
+SSE_HEADERS = {
+    'Cache-Control': 'no-cache',
+    # Keep reverse proxies such as nginx from buffering the stream
+    'X-Accel-Buffering': 'no'
+}
+
+
+def arena_stream_request(args):
+    """
+    Converts the query string of /api/arena/stream to an /api/arena request body.
+    EventSource can only send GET requests, so providers are repeated parameters:
+    ?query=...&providers=a&providers=b[&no_cache=1]
+    """
+    return {
+        'query': args.get('query'),
+        'providers': args.getlist('providers'),
+        'no_cache': args.get('no_cache', '').lower() in ('1', 'true', 'yes')
+    }
+
+
+@app.route('/api/arena/stream', methods=['GET'])
+def arena_stream_api():
+    """
+    Streaming variant of /api/arena using Server-Sent Events. Each provider's result
+    is sent as a 'result' event (with its position in 'index') the moment it
+    completes, followed by a 'done' event. Request errors are sent as a 'failed' event.
+    """
+    try:
+        plan = prepare_arena(arena_stream_request(request.args))
+    except ApiError as e:
+        body = format_sse('failed', {"error": e.message})
+        return Response(body, content_type='text/event-stream', headers=SSE_HEADERS)
+
+    def generate():
+        for event, payload in plan.stream(dispatcher.search_as_completed(plan.jobs)):
+            yield format_sse(event, payload)
+
+    return Response(generate(), content_type='text/event-stream', headers=SSE_HEADERS)
+
+
+def history_store():
+    if dispatcher.history is None:
+        raise ApiError("Search history is disabled", 404)
+    return dispatcher.history
+
+
+def number_arg(args, name, convert=float):
+    """
+    Reads an optional numeric query string parameter.
+
+    Raises:
+        ApiError: If the parameter is not a number.
+    """
+    value = args.get(name)
+    if value in (None, ''):
+        return None
+    try:
+        return convert(value)
+    except ValueError:
+        raise ApiError(f"'{name}' must be a number", 400)
+
+
+@app.route('/api/history', methods=['GET'])
+def history_api():
+    """
+    Past searches, newest first, with their parameters, metrics and result URLs.
+    Filters: provider, query (exact), since/until (Unix time). Pass the last entry's
+    id as before_id to get the next page of at most `limit` entries.
+    """
+    history = history_store()
+    entries = history.entries(
+        provider=request.args.get('provider') or None,
+        query=request.args.get('query') or None,
+        since=number_arg(request.args, 'since'),
+        until=number_arg(request.args, 'until'),
+        before_id=number_arg(request.args, 'before_id', int),
+        limit=number_arg(request.args, 'limit', int) or DEFAULT_PAGE_SIZE
+    )
+    return jsonify({
+        "entries": entries,
+        "next_before_id": entries[-1]['id'] if entries else None
+    })
+
+
+@app.route('/api/stats', methods=['GET'])
+def stats_api():
+    """
+    Per-provider search counts, error rates and latency percentiles over the last
+    `window` (default 24h), optionally split into `bucket`-sized time buckets
+    (e.g., ?window=7d&bucket=1d). Parameters: provider, until (Unix time) and
+    include_cached=1 to count cache hits in the latency percentiles.
+    """
+    history = history_store()
+    try:
+        window = parse_duration(request.args.get('window') or '24h')
+        bucket = request.args.get('bucket')
+        return jsonify(history.stats(
+            window,
+            bucket=parse_duration(bucket) if bucket else None,
+            provider=request.args.get('provider') or None,
+            until=number_arg(request.args, 'until'),
+            include_cached=request.args.get('include_cached', '').lower() in ('1', 'true', 'yes')
+        ))
+    except ValueError as e:
+        raise ApiError(str(e), 400)
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics_api():
+    """
+    Search telemetry in the Prometheus text format, for scraping.
+    """
+    return Response(dispatcher.telemetry.render(), content_type=METRICS_CONTENT_TYPE)
+
+
+@app.after_request
+def compress_json(response):
+    """
+    Compresses large JSON responses with the best coding the client accepts.
+    """
+    if (response.mimetype != 'application/json' or response.direct_passthrough
+            or response.is_streamed or 'Content-Encoding' in response.headers):
+        return response
+    body, coding = compress_response_body(
+        response.get_data(), request.headers.get('Accept-Encoding')
+    )
+    response.vary.add('Accept-Encoding')
+    if coding is not None:
+        response.set_data(body)
+        response.headers['Content-Encoding'] = coding
+    return response
+
+
+def serve_from_disk(path):
+    if path != "" and (STATIC_FOLDER / path).exists():
+        return send_from_directory(str(STATIC_FOLDER), path)
+    else:
+        return send_from_directory(str(STATIC_FOLDER), 'index.html')
+
+
 # Host React Frontend
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
 def serve(path):
-    if path != "" and (STATIC_FOLDER / path).exists():
+    """
+    Serves the frontend from the in-memory asset table, precompressed and with
+    ETags. Unknown paths get index.html, so client-side routes can be reloaded.
+    """
+    if not static_assets.ready:
+        static_assets.load_in_background()
+        return serve_from_disk(path)
+    if path in static_assets.unbuffered:
         return send_from_directory(str(STATIC_FOLDER), path)
-    else:
-        return send_from_directory(str(STATIC_FOLDER), 'index.html')
+
+    asset = static_assets.get(path) or static_assets.get('index.html')
+    if asset is None:
+        abort(404)
+    status, body, headers = asset.respond(
+        negotiate_encoding(request.headers.get('Accept-Encoding'), asset.encodings),
+        request.headers.get('If-None-Match')
+    )
+    return Response(body, status, headers)
+
 
 def main():
     import argparse
+    import webbrowser
+    from search_api_webui import bench, serve
+
     parser = argparse.ArgumentParser(description="Search API WebUI")
     parser.add_argument("--port", type=int, default=8889, help="Port to run the server on")
     parser.add_argument("--host", type=str, default="127.0.0.1", help="Host to run the server on")
+    parser.add_argument("--asgi", action="store_true",
+                        help="Serve with uvicorn in ASGI mode (requires the 'async' extra)")
+    parser.add_argument("--serve", action="store_true",
+                        help="Serve with a production WSGI server (requires the 'serve' extra)")
+    parser.add_argument("--workers", type=int, default=serve.DEFAULT_WORKERS,
+                        help="Worker processes in --serve mode")
+    parser.add_argument("--threads", type=int, default=serve.DEFAULT_THREADS,
+                        help="Threads per worker process in --serve mode")
+    parser.add_argument("--no-browser", action="store_true",
+                        help="Don't open the WebUI in a browser on startup")
+    parser.add_argument("--cache-ttl", type=int, default=300,
+                        help="Seconds a search result stays cached (0 disables the cache)")
+    parser.add_argument("--cache-size", type=int, default=256,
+                        help="Maximum number of results kept in the in-memory cache")
+    parser.add_argument("--disk-cache", action="store_true",
+                        help=f"Also persist cached results to {USER_CACHE_DB}")
+    parser.add_argument("--record", metavar="PATH",
+                        help="Append upstream responses to a recordings file for replay "
+                             f"providers (e.g., {USER_RECORDINGS})")
+    parser.add_argument("--fanout-workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help="Threads per provider for concurrent arena and fused searches")
+    parser.add_argument("--no-history", action="store_true",
+                        help=f"Don't record searches to {USER_HISTORY_DB}")
+
+    subparsers = parser.add_subparsers(dest="command")
+    bench_parser = subparsers.add_parser(
+        "bench", help="Run a batch of queries against providers and report latency statistics"
+    )
+    bench.add_arguments(bench_parser)
+
     args = parser.parse_args()
 
+    if args.record:
+        # Installed before any provider session exists, and inherited by forked workers
+        from search_api_webui.providers.replay import record_responses
+        record_responses(args.record)
+        print(f"  - Recording upstream responses to: {args.record}")
+
+    def init_process():
+        # Provider pools are created on first use, so this applies to all of them
+        dispatcher.max_workers = max(1, args.fanout_workers)
+        configure_cache(args.cache_ttl, args.cache_size, args.disk_cache)
+        configure_history(not args.no_history)
+        prewarm_providers()
+        static_assets.load_in_background()
+
+    if args.command == "bench":
+        init_process()
+        sys.exit(bench.run(args))
+
     url = f"http://{args.host}:{args.port}"
-    print(f"Starting Search API WebUI...")
+
+    if args.serve:
+        # Workers set up their own cache and connections after forking
+        def init_worker():
+            reload_providers()
+            init_process()
+
+        print("Starting Search API WebUI (production mode)...")
+        print(f"  - Config Storage: {USER_CONFIG_JSON}")
+        print(f"  - Serving on: {url}")
+        sys.exit(serve.run(app, args.host, args.port, args.workers, args.threads,
+                           init_worker, close_providers))
+
+    init_process()
+
+    print("Starting Search API WebUI...")
     print(f"  - Config Storage: {USER_CONFIG_JSON}")
     print(f"  - Serving on: {url}")
 
+    if args.asgi:
+        try:
+            import uvicorn
+            from search_api_webui.asgi import application
+        except (ImportError, RuntimeError) as e:
+            print(f"Error: ASGI mode is unavailable ({e}). "
+                  f"Install it with: pip install search-api-webui[async]")
+            sys.exit(1)
+
+        if not args.no_browser:
+            webbrowser.open(url)
+        uvicorn.run(application, host=args.host, port=args.port)
+        return
+
     # Open browser automatically after a short delay to ensure server is ready
-    webbrowser.open(url)
+    if not args.no_browser:
+        webbrowser.open(url)
 
     app.run(host=args.host, port=args.port)
 
+
 if __name__ == "__main__":
+    # Run as `python -m search_api_webui.app`: register this module under its own name,
+    # so asgi.py uses it instead of importing a second copy of the app
+    sys.modules.setdefault('search_api_webui.app', sys.modules[__name__])
     main()
@@ -0,0 +1,210 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+ASGI serving mode.
+
+The search endpoints, including the streaming arena and fused search, are served
+natively on the event loop through the providers' `asearch()`, so hundreds of slow
+upstream searches can be in flight without a thread each. Every other route (config,
+providers, static frontend) is delegated to the Flask app through asgiref's WSGI adapter.
+
+Run with any ASGI server, e.g.:
+    uvicorn search_api_webui.asgi:application
+"""
+
+from urllib.parse import parse_qsl
+
+from werkzeug.datastructures import MultiDict
+
+from search_api_webui import app as webui
+from search_api_webui.compression import compress_response_body
+from search_api_webui.jsonutil import dumps, loads
+
+try:
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError:  # Optional: see the 'async' extra
+    WsgiToAsgi = None
+
+
+async def _read_json(receive):
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+    if not body:
+        return {}
+    return loads(body)
+
+
+async def _send_body(send, body, headers, status=200):
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-length', str(len(body)).encode('ascii')),
+            # Mirror flask-cors' default policy used by the WSGI routes
+            (b'access-control-allow-origin', b'*'),
+        ] + [(k.lower().encode('ascii'), v.encode('latin-1')) for k, v in headers.items()],
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def _header(scope, name):
+    for key, value in scope.get('headers', ()):
+        if key == name:
+            return value.decode('latin-1')
+    return None
+
+
+async def _send_json(send, payload, status=200, accept_encoding=None):
+    raw = webui.raw_response(payload) if isinstance(payload, dict) else None
+    if raw is not None:
+        body, headers = raw
+    else:
+        body, headers = dumps(payload), {'Content-Type': 'application/json'}
+    # Same policy as the Flask app's compress_json()
+    if headers['Content-Type'].startswith('application/json'):
+        body, coding = compress_response_body(body, accept_encoding)
+        headers = dict(headers, Vary='Accept-Encoding')
+        if coding is not None:
+            headers['Content-Encoding'] = coding
+    await _send_body(send, body, headers, status)
+
+
+async def _send_sse(send, events):
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [
+            (b'content-type', b'text/event-stream'),
+            (b'access-control-allow-origin', b'*'),
+        ] + [(k.lower().encode('ascii'), v.encode('ascii')) for k, v in webui.SSE_HEADERS.items()],
+    })
+    async for event, payload in events:
+        await send({
+            'type': 'http.response.body',
+            'body': webui.format_sse(event, payload).encode('utf-8'),
+            'more_body': True,
+        })
+    await send({'type': 'http.response.body', 'body': b''})
+
+
+async def search_endpoint(data):
+    job = webui.prepare_search(data)
+    return await webui.dispatcher.asearch(
+        job.provider_name, job.query, job.api_key, use_cache=job.use_cache, **job.kwargs
+    )
+
+
+async def arena_endpoint(data):
+    plan = webui.prepare_arena(data)
+    return plan.to_response(await webui.dispatcher.asearch_many(plan.jobs))
+
+
+async def fused_search_endpoint(data):
+    k, max_results = webui.fusion_options(data)
+    plan = webui.prepare_arena(data)
+    return plan.to_fused_response(await webui.dispatcher.asearch_many(plan.jobs), k, max_results)
+
+
+async def arena_stream_events(plan):
+    for event in plan.initial_events():
+        yield event
+    async for job_index, result in webui.dispatcher.asearch_as_completed(plan.jobs):
+        yield plan.result_event(job_index, result)
+    yield plan.done_event()
+
+
+async def _failed_events(message):
+    yield 'failed', {"error": message}
+
+
+class SearchAsgiApp:
+    """
+    ASGI application serving the search API natively and everything else via Flask.
+    """
+
+    routes = {
+        '/api/search': search_endpoint,
+        '/api/arena': arena_endpoint,
+        '/api/search/fused': fused_search_endpoint,
+    }
+
+    def __init__(self, flask_app):
+        if WsgiToAsgi is None:
+            raise RuntimeError(
+                "ASGI mode requires asgiref. Install it with: pip install search-api-webui[async]"
+            )
+        self._wsgi = WsgiToAsgi(flask_app)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            await self._lifespan(receive, send)
+            return
+
+        handler = self.routes.get(scope.get('path'))
+        if scope['type'] == 'http' and scope['method'] == 'POST' and handler:
+            accept_encoding = _header(scope, b'accept-encoding')
+            try:
+                data = await _read_json(receive)
+            except ValueError:
+                await _send_json(send, {"error": "Invalid JSON body"}, 400)
+                return
+            try:
+                payload = await handler(data or {})
+            except webui.ApiError as e:
+                await _send_json(send, {"error": e.message}, e.status)
+                return
+            await _send_json(send, payload, accept_encoding=accept_encoding)
+            return
+
+        if (scope['type'] == 'http' and scope['method'] == 'GET'
+                and scope.get('path') == '/api/arena/stream'):
+            await self._arena_stream(scope, send)
+            return
+
+        await self._wsgi(scope, receive, send)
+
+    async def _arena_stream(self, scope, send):
+        query_string = scope.get('query_string', b'').decode('latin-1')
+        args = MultiDict(parse_qsl(query_string, keep_blank_values=True))
+        try:
+            plan = webui.prepare_arena(webui.arena_stream_request(args))
+        except webui.ApiError as e:
+            await _send_sse(send, _failed_events(e.message))
+            return
+        await _send_sse(send, arena_stream_events(plan))
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                for provider in webui.provider_map.instances():
+                    await provider.aclose()
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+
+application = SearchAsgiApp(webui.app)
@@ -0,0 +1,229 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Headless batch benchmark: runs a file of queries against one or more providers
+and reports latency percentiles, throughput, error rate and payload size.
+"""
+
+import csv
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+from search_api_webui.stats import percentile
+
+REPORT_FIELDS = [
+    'provider', 'requests', 'errors', 'error_rate', 'duration_s', 'throughput_rps',
+    'latency_p50_ms', 'latency_p90_ms', 'latency_p99_ms', 'latency_max_ms',
+    'latency_mean_ms', 'size_bytes_mean', 'size_bytes_total'
+]
+
+
+def load_queries(file_path):
+    """
+    Reads benchmark queries from a file.
+    Each non-empty line is either a plain query or a JSON object with a 'query' field.
+
+    Args:
+        file_path (str): Path to the query file.
+
+    Returns:
+        list[str]: The queries in file order.
+    """
+    queries = []
+    with open(file_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith('{'):
+                try:
+                    query = json.loads(line).get('query')
+                except ValueError as e:
+                    raise ValueError(f"{file_path}:{line_no}: invalid JSON line ({e})")
+                if not query:
+                    raise ValueError(f"{file_path}:{line_no}: JSON line has no 'query' field")
+                queries.append(query)
+            else:
+                queries.append(line)
+    return queries
+
+
+def summarize(provider_name, samples, duration_s):
+    """
+    Aggregates raw per-request samples into a report row.
+
+    Args:
+        provider_name (str): Provider the samples belong to.
+        samples (list[dict]): Dicts with 'latency_ms', 'size_bytes' and 'error'.
+        duration_s (float): Wall-clock duration of the provider's run.
+
+    Returns:
+        dict: A report row keyed by REPORT_FIELDS.
+    """
+    total = len(samples)
+    ok = [s for s in samples if not s['error']]
+    latencies = sorted(s['latency_ms'] for s in ok)
+    sizes = [s['size_bytes'] for s in ok]
+
+    return {
+        'provider': provider_name,
+        'requests': total,
+        'errors': total - len(ok),
+        'error_rate': round((total - len(ok)) / total, 4) if total else 0.0,
+        'duration_s': round(duration_s, 3),
+        'throughput_rps': round(len(ok) / duration_s, 2) if duration_s > 0 else 0.0,
+        'latency_p50_ms': round(percentile(latencies, 50), 2),
+        'latency_p90_ms': round(percentile(latencies, 90), 2),
+        'latency_p99_ms': round(percentile(latencies, 99), 2),
+        'latency_max_ms': round(latencies[-1], 2) if latencies else 0.0,
+        'latency_mean_ms': round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+        'size_bytes_mean': round(sum(sizes) / len(sizes), 1) if sizes else 0.0,
+        'size_bytes_total': sum(sizes)
+    }
+
+
+def run_provider_benchmark(dispatcher, provider_name, queries, api_key, search_kwargs,
+                           concurrency=1, repetitions=1, use_cache=False):
+    """
+    Runs every query `repetitions` times against one provider.
+    Latency is measured client-side around each search, so it includes the
+    provider's own request building and response normalization. The result
+    cache is bypassed unless `use_cache` is set, so repetitions stay cold.
+
+    Returns:
+        dict: The summarized report row for the provider.
+    """
+    workload = [query for _ in range(repetitions) for query in queries]
+
+    def timed_search(query):
+        start_time = time.perf_counter()
+        result = dispatcher.search(
+            provider_name, query, api_key, use_cache=use_cache, **search_kwargs
+        )
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        return {
+            'latency_ms': latency_ms,
+            'size_bytes': result.get('metrics', {}).get('size_bytes', 0),
+            'error': result.get('error')
+        }
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        samples = list(executor.map(timed_search, workload))
+    duration_s = time.perf_counter() - start_time
+
+    return summarize(provider_name, samples, duration_s)
+
+
+def write_report(rows, fmt='json', output=None):
+    """
+    Writes report rows as JSON or CSV to a file, or to stdout if no file is given.
+    """
+    stream = open(output, 'w', encoding='utf-8', newline='') if output else sys.stdout
+    try:
+        if fmt == 'csv':
+            writer = csv.DictWriter(stream, fieldnames=REPORT_FIELDS)
+            writer.writeheader()
+            writer.writerows(rows)
+        else:
+            json.dump(rows, stream, indent=2)
+            stream.write('\n')
+    finally:
+        if output:
+            stream.close()
+
+
+def add_arguments(parser):
+    """
+    Registers the `bench` subcommand options on an argparse parser.
+    """
+    parser.add_argument("queries",
+                        help="Query file: one query per line, or JSONL with a 'query' field")
+    parser.add_argument("--providers", nargs='+', default=None,
+                        help="Providers to benchmark (default: all providers with an API key)")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Concurrent requests per provider")
+    parser.add_argument("--repeat", type=int, default=1, help="Times to run each query")
+    parser.add_argument("--use-cache", action="store_true",
+                        help="Allow cached results (measures warm rather than cold latency)")
+    parser.add_argument("--format", choices=['json', 'csv'], default='json',
+                        help="Report format")
+    parser.add_argument("--output", default=None,
+                        help="Write the report to this file instead of stdout")
+
+
+def run(args):
+    """
+    Entry point for `search-api-webui bench`.
+
+    Returns:
+        int: Process exit code.
+    """
+    from search_api_webui.app import (
+        build_search_kwargs, dispatcher, get_provider_settings, get_stored_config, provider_map,
+        requires_api_key
+    )
+
+    try:
+        queries = load_queries(args.queries)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 2
+    if not queries:
+        print(f"Error: No queries found in {args.queries}", file=sys.stderr)
+        return 2
+
+    stored_config = get_stored_config()
+    provider_names = args.providers or [
+        name for name in provider_map
+        if get_provider_settings(stored_config, name).get('api_key') or not requires_api_key(name)
+    ]
+
+    rows = []
+    # Providers log to stdout; keep it clean for the report
+    with redirect_stdout(sys.stderr):
+        for provider_name in provider_names:
+            if provider_name not in provider_map:
+                print(f"Skipping {provider_name}: provider not found", file=sys.stderr)
+                continue
+            provider_config = get_provider_settings(stored_config, provider_name)
+            api_key = provider_config.get('api_key')
+            if not api_key and requires_api_key(provider_name):
+                print(f"Skipping {provider_name}: API Key is missing", file=sys.stderr)
+                continue
+
+            print(f"Benchmarking {provider_name}: {len(queries)} queries x {args.repeat} "
+                  f"(concurrency {args.concurrency})", file=sys.stderr)
+            rows.append(run_provider_benchmark(
+                dispatcher, provider_name, queries, api_key, build_search_kwargs(provider_config),
+                concurrency=args.concurrency, repetitions=args.repeat,
+                use_cache=args.use_cache
+            ))
+
+    if not rows:
+        print("Error: No providers to benchmark", file=sys.stderr)
+        return 1
+
+    write_report(rows, fmt=args.format, output=args.output)
+    return 0
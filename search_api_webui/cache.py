@@ -0,0 +1,182 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from search_api_webui import jsonutil
+
+DEFAULT_TTL_SECONDS = 300
+DEFAULT_MAX_ENTRIES = 256
+
+
+def make_cache_key(provider_name, query, limit=None, language=None, api_url=None):
+    """
+    Builds the cache key for a search. The API key is deliberately not part of it:
+    the same query against the same endpoint returns the same results for any key.
+
+    Returns:
+        str: A stable string key.
+    """
+    return json.dumps([provider_name, query, limit, language, (api_url or '').strip()])
+
+
+class MemoryCache:
+    """
+    Thread-safe in-memory cache with LRU eviction and a per-entry TTL.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl=DEFAULT_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (value, stored_at)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns:
+            tuple | None: (value, stored_at) for a fresh entry, otherwise None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.time() - entry[1] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, value, stored_at=None):
+        with self._lock:
+            self._entries[key] = (value, stored_at if stored_at is not None else time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache:
+    """
+    SQLite-backed cache that survives restarts. Entries expire after the TTL and the
+    least recently used ones are pruned once the table grows past max_entries.
+    """
+
+    def __init__(self, path, max_entries=10000, ttl=DEFAULT_TTL_SECONDS):
+        self.path = str(path)
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+            " stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)"
+        )
+        self._conn.commit()
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, stored_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return jsonutil.loads(row[0]), row[1]
+
+    def set(self, key, value, stored_at=None):
+        now = time.time()
+        stored_at = stored_at if stored_at is not None else now
+        payload = jsonutil.dumps_str(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, stored_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, payload, stored_at, now)
+            )
+            self._conn.execute("DELETE FROM entries WHERE stored_at < ?", (now - self.ttl,))
+            self._conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                " SELECT key FROM entries ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+
+class ResultCache:
+    """
+    Two-tier search result cache: an in-memory LRU in front of an optional disk backend.
+    Disk hits are promoted into memory. Only successful results are stored.
+    Hits and misses are counted by SearchTelemetry, per provider, and exposed at /metrics.
+    """
+
+    def __init__(self, memory=None, disk=None):
+        """
+        Args:
+            memory (MemoryCache): Front tier. Created with defaults if omitted.
+            disk (DiskCache): Optional persistent back tier.
+        """
+        self.memory = memory if memory is not None else MemoryCache()
+        self.disk = disk
+
+    def get(self, key):
+        """
+        Returns:
+            tuple | None: (result, stored_at) on a hit, otherwise None.
+        """
+        entry = self.memory.get(key)
+        if entry is None and self.disk is not None:
+            entry = self.disk.get(key)
+            if entry is not None:
+                self.memory.set(key, entry[0], stored_at=entry[1])
+        return entry
+
+    def set(self, key, result):
+        if result.get('error'):
+            return
+        self.memory.set(key, result)
+        if self.disk is not None:
+            self.disk.set(key, result)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
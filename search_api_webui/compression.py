@@ -0,0 +1,122 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+HTTP response compression: Accept-Encoding negotiation and gzip/brotli encoders.
+Brotli is used only if the `brotli` package is installed (see the 'brotli' extra).
+"""
+
+import functools
+import gzip
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+MIN_COMPRESS_SIZE = 1024   # Bytes; smaller bodies are not worth the CPU or the header
+
+# Levels for bodies compressed once and served many times (static assets)...
+STATIC_LEVELS = {'br': 11, 'gzip': 9}
+# ...and for bodies compressed per response, where speed matters more than size
+DYNAMIC_LEVELS = {'br': 4, 'gzip': 5}
+
+COMPRESSIBLE_TYPES = frozenset((
+    'application/javascript', 'application/json', 'application/manifest+json',
+    'application/wasm', 'application/xml', 'image/svg+xml', 'image/x-icon',
+))
+
+
+def available_encodings():
+    """
+    Returns:
+        tuple: The content codings this process can produce, most preferred first.
+    """
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def is_compressible(mimetype):
+    return mimetype.startswith('text/') or mimetype in COMPRESSIBLE_TYPES
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_accept_encoding(header):
+    qualities = {}
+    for part in header.split(','):
+        coding, _, params = part.partition(';')
+        quality = 1.0
+        for param in params.split(';'):
+            name, _, value = param.strip().partition('=')
+            if name.lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    return qualities
+
+
+def negotiate_encoding(accept_encoding, encodings=None):
+    """
+    Picks the content coding for a response.
+
+    Args:
+        accept_encoding (str): The request's Accept-Encoding header, if any.
+        encodings (tuple): Codings the response is available in, most preferred
+            first; defaults to `available_encodings()`.
+
+    Returns:
+        str | None: The first of `encodings` the client accepts, or None to send
+        the response uncompressed.
+    """
+    if not accept_encoding:
+        return None
+    qualities = _parse_accept_encoding(accept_encoding)
+    for coding in encodings if encodings is not None else available_encodings():
+        if qualities.get(coding, qualities.get('*', 0.0)) > 0:
+            return coding
+    return None
+
+
+def compress(body, coding, levels=DYNAMIC_LEVELS):
+    """
+    Encodes `body` (bytes) with the given content coding ('br' or 'gzip').
+    """
+    if coding == 'br':
+        return brotli.compress(body, quality=levels['br'])
+    # A fixed mtime keeps the output, and so ETags, identical across restarts
+    return gzip.compress(body, compresslevel=levels['gzip'], mtime=0)
+
+
+def compress_response_body(body, accept_encoding):
+    """
+    Compresses a dynamic response body if it is large enough and the client accepts
+    one of the available codings.
+
+    Returns:
+        tuple: (body, content coding), where the coding is None if the body was
+        left as is.
+    """
+    if len(body) < MIN_COMPRESS_SIZE:
+        return body, None
+    coding = negotiate_encoding(accept_encoding)
+    if coding is None:
+        return body, None
+    return compress(body, coding), coding
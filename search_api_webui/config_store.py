@@ -0,0 +1,124 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import copy
+import json
+import os
+import tempfile
+import threading
+
+
+class ConfigStore:
+    """
+    Keeps the user's config.json parsed in memory.
+    The file is only re-read when its modification time or size changes (e.g., it
+    was edited by hand), and writes are serialized and atomic so concurrent readers
+    never observe a half-written file.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str | Path): Location of the JSON config file.
+        """
+        self.path = str(path)
+        self._config = {}
+        self._signature = None  # (mtime_ns, size) of the file backing self._config
+        self._lock = threading.Lock()
+
+    def _file_signature(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _reload_if_changed(self):
+        signature = self._file_signature()
+        if signature == self._signature:
+            return
+
+        if signature is None:
+            self._config = {}
+        else:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._config = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error reading config: {e}")
+                self._config = {}
+        self._signature = signature
+
+    def get(self):
+        """
+        Returns the current config. The returned dict is shared and must be
+        treated as read-only; use `update()` to change it.
+
+        Returns:
+            dict: The parsed config, or an empty dict if the file is missing or invalid.
+        """
+        with self._lock:
+            self._reload_if_changed()
+            return self._config
+
+    def _write(self, config_dict):
+        directory = os.path.dirname(self.path) or '.'
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.config-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(config_dict, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._config = config_dict
+        self._signature = self._file_signature()
+
+    def save(self, config_dict):
+        """
+        Atomically replaces the config file with `config_dict`.
+        """
+        with self._lock:
+            try:
+                self._write(copy.deepcopy(config_dict))
+            except OSError as e:
+                print(f"Error saving config: {e}")
+
+    def update(self, mutator):
+        """
+        Applies `mutator` to a private copy of the latest config and saves the result.
+        Holding the lock across read-modify-write keeps concurrent updates from
+        overwriting each other.
+
+        Args:
+            mutator (callable): Receives the config dict and modifies it in place.
+        """
+        with self._lock:
+            self._reload_if_changed()
+            config_dict = copy.deepcopy(self._config)
+            mutator(config_dict)
+            try:
+                self._write(config_dict)
+            except OSError as e:
+                print(f"Error saving config: {e}")
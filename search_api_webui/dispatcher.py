@@ -0,0 +1,437 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from search_api_webui.cache import make_cache_key
+from search_api_webui.providers.limits import queue_listener
+from search_api_webui.telemetry import SearchTelemetry
+
+DEFAULT_MAX_WORKERS = 32   # Fan-out threads per provider
+DEFAULT_FOLLOW_TIMEOUT = 30.0  # Seconds, for providers that don't report max_search_time()
+FOLLOW_MARGIN = 5.0        # Seconds a follower waits past the leader's longest search
+
+
+class SearchJob:
+    """
+    A single provider search to be executed by the dispatcher.
+    """
+
+    def __init__(self, provider_name, query, api_key, use_cache=True, **kwargs):
+        """
+        Args:
+            provider_name (str): Name of the provider as declared in providers.yaml.
+            query (str): The search keywords.
+            api_key (str): The API Key required for authentication.
+            use_cache (bool): Whether a cached result may be returned.
+            **kwargs: Extra search arguments forwarded to the provider (e.g., 'limit').
+        """
+        self.provider_name = provider_name
+        self.query = query
+        self.api_key = api_key
+        self.use_cache = use_cache
+        self.kwargs = kwargs
+
+
+class _Flight:
+    """
+    An upstream search in progress that identical concurrent searches wait on.
+    """
+
+    def __init__(self, future=None):
+        self.followers = 0
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+        self.future = future  # Awaited by async followers
+
+
+class SearchDispatcher:
+    """
+    Routes search requests to provider instances.
+    Multiple searches can be fanned out concurrently, so an N-way comparison costs
+    roughly as much as its slowest provider. Each provider has its own bounded thread
+    pool: concurrent fan-outs do not queue behind one another's searches, and a slow
+    or throttled provider only ties up its own threads.
+
+    Identical searches that arrive while one of them is already waiting on the
+    upstream are coalesced (single-flight): they wait for that search's result
+    instead of sending a request, and so cost no extra API quota. A follower waits
+    at most the provider's longest possible search plus FOLLOW_MARGIN, then searches
+    the upstream itself.
+    """
+
+    def __init__(self, provider_map, max_workers=DEFAULT_MAX_WORKERS, cache=None,
+                 telemetry=None, history=None):
+        """
+        Args:
+            provider_map (dict): Mapping of provider names to provider instances.
+            max_workers (int): Upper bound on concurrently running fan-out searches per
+                provider. Threads are started on demand.
+            cache (ResultCache): Optional result cache consulted before each search.
+            telemetry (SearchTelemetry): Metrics sink; a private one is created if omitted.
+            history (SearchHistory): Optional store every search is recorded in.
+        """
+        self.provider_map = provider_map
+        self.cache = cache
+        self.telemetry = telemetry or SearchTelemetry()
+        self.history = history
+        self._flights = {}
+        self._aflights = {}
+        self._flights_lock = threading.Lock()
+        self.max_workers = max_workers
+        self._executors = {}
+        self._executors_lock = threading.Lock()
+        self._shut_down = False
+
+    def _lookup(self, provider_name, query, use_cache, kwargs):
+        """
+        Resolves the provider and consults the cache.
+
+        Returns:
+            tuple: (provider, cache_key, result). `result` is set when the search is
+            already answered (cache hit or unknown provider) and must be returned as is.
+        """
+        provider = self.provider_map.get(provider_name)
+        if not provider:
+            return None, None, {
+                "error": "Provider not found",
+                "results": [],
+                "metrics": {"latency_ms": 0, "size_bytes": 0}
+            }
+
+        cache_key = None
+        if self.cache is not None and use_cache:
+            cache_key = make_cache_key(
+                provider_name, query,
+                kwargs.get('limit'), kwargs.get('language'), kwargs.get('api_url')
+            )
+            entry = self.cache.get(cache_key)
+            self.telemetry.search_received(provider_name, cache_hit=entry is not None)
+            if entry is not None:
+                cached_result, stored_at = entry
+                result = dict(cached_result)
+                result['metrics'] = dict(cached_result.get('metrics', {}))
+                result['metrics']['cache_hit'] = True
+                result['metrics']['cache_age_ms'] = round((time.time() - stored_at) * 1000, 2)
+                return provider, cache_key, result
+        else:
+            self.telemetry.search_received(provider_name)
+
+        return provider, cache_key, None
+
+    def _complete(self, cache_key, result):
+        if cache_key is not None:
+            self.cache.set(cache_key, result)
+
+        result = dict(result)
+        result['metrics'] = dict(result.get('metrics', {}))
+        result['metrics']['cache_hit'] = False
+        return result
+
+    def _record(self, provider, provider_name, query, kwargs, result):
+        # Searches for unknown providers never reached one and are not history
+        if self.history is not None and provider is not None:
+            self.history.record(provider_name, query, kwargs, result)
+        return result
+
+    @staticmethod
+    def _flight_key(provider_name, query, api_key, use_cache, kwargs):
+        # Searches that bypass the cache ask for an upstream call of their own (e.g., to
+        # measure cold latency), so only cacheable searches are coalesced
+        if not use_cache:
+            return None
+        return provider_name, query, api_key, tuple(sorted(kwargs.items()))
+
+    def _join(self, flights, key, create_future=None):
+        """
+        Joins the search in flight for `key`, or registers a new one.
+
+        Returns:
+            tuple: (flight, whether the caller leads it and must search the upstream).
+            The flight is None if the search is not coalesced.
+        """
+        if key is None:
+            return None, True
+        with self._flights_lock:
+            flight = flights.get(key)
+            if flight is not None:
+                flight.followers += 1
+                return flight, False
+            flight = flights[key] = _Flight(create_future() if create_future else None)
+            return flight, True
+
+    @staticmethod
+    def _follow_timeout(provider):
+        max_time = provider.max_search_time()
+        return (DEFAULT_FOLLOW_TIMEOUT if max_time is None else max_time) + FOLLOW_MARGIN
+
+    def _leave(self, flights, key, flight):
+        """
+        Stops following a flight that is taking too long.
+
+        Returns:
+            bool: False if the flight is already landing, so its result is moments away.
+        """
+        with self._flights_lock:
+            if flights.get(key) is not flight:
+                return False
+            flight.followers -= 1
+            return True
+
+    def _land(self, flights, key, flight, result=None, error=None):
+        """
+        Hands the leader's result, or the exception it raised, to the waiting followers.
+        """
+        if flight is None:
+            return
+        with self._flights_lock:
+            del flights[key]
+        # No follower can join any more, so the count is final
+        if result is not None and flight.followers:
+            result['metrics']['coalesced_count'] = flight.followers + 1
+        flight.result = result
+        flight.error = error
+        flight.done.set()
+        if flight.future is not None:
+            flight.future.set_result(None)
+
+    def _follow(self, provider_name, flight):
+        """
+        Returns:
+            dict: A copy of the leader's result, marked as coalesced.
+
+        Raises:
+            Exception: The exception the leader's search raised, if any.
+        """
+        if flight.error is not None:
+            raise flight.error
+        self.telemetry.search_coalesced(provider_name)
+        result = dict(flight.result)
+        result['metrics'] = dict(result['metrics'], coalesced=True)
+        return result
+
+    def search(self, provider_name, query, api_key, use_cache=True, **kwargs):
+        """
+        Execute a single search against the named provider.
+        Successful results are served from the cache while fresh, unless
+        `use_cache` is False (e.g., to measure cold upstream latency). A cacheable
+        search identical to one already in flight waits for that one's result.
+
+        Returns:
+            dict: The provider's standardized result dictionary. Its metrics
+            carry 'cache_hit' and, on a hit, the cached entry's 'cache_age_ms'.
+            When identical searches shared one upstream call, all of them carry
+            'coalesced_count', and those that waited carry 'coalesced': True.
+        """
+        provider, cache_key, result = self._lookup(provider_name, query, use_cache, kwargs)
+        if result is not None:
+            return self._record(provider, provider_name, query, kwargs, result)
+
+        key = self._flight_key(provider_name, query, api_key, use_cache, kwargs)
+        flight, leader = self._join(self._flights, key)
+        if not leader:
+            timeout = self._follow_timeout(provider)
+            if flight.done.wait(timeout) or not self._leave(self._flights, key, flight):
+                flight.done.wait()
+                return self._record(provider, provider_name, query, kwargs,
+                                    self._follow(provider_name, flight))
+            print(f"[{provider_name}] Identical search still running after {timeout:g} s, "
+                  f"searching separately")
+            flight = None
+
+        token = self.telemetry.upstream_started(provider_name)
+        listening = queue_listener.set(token.set_queued)
+        result = None
+        try:
+            result = provider.search(query, api_key, **kwargs)
+        except BaseException as e:
+            self._land(self._flights, key, flight, error=e)
+            raise
+        finally:
+            queue_listener.reset(listening)
+            self.telemetry.upstream_finished(provider_name, token, result)
+        result = self._complete(cache_key, result)
+        self._land(self._flights, key, flight, result=result)
+        return self._record(provider, provider_name, query, kwargs, result)
+
+    async def asearch(self, provider_name, query, api_key, use_cache=True, **kwargs):
+        """
+        Asynchronous variant of `search()` using the provider's `asearch()`.
+        """
+        import asyncio  # Only needed in ASGI mode; kept off the CLI's import path
+
+        provider, cache_key, result = self._lookup(provider_name, query, use_cache, kwargs)
+        if result is not None:
+            return self._record(provider, provider_name, query, kwargs, result)
+
+        key = self._flight_key(provider_name, query, api_key, use_cache, kwargs)
+        flight, leader = self._join(self._aflights, key, asyncio.get_running_loop().create_future)
+        if not leader:
+            timeout = self._follow_timeout(provider)
+            landed = True
+            try:
+                # Shielded, so a follower whose client went away does not cancel the others
+                await asyncio.wait_for(asyncio.shield(flight.future), timeout)
+            except asyncio.TimeoutError:
+                landed = not self._leave(self._aflights, key, flight)
+                if landed:
+                    await asyncio.shield(flight.future)
+            if landed:
+                if isinstance(flight.error, asyncio.CancelledError):
+                    # The leader's client went away; search on behalf of this one instead
+                    return await self.asearch(provider_name, query, api_key, use_cache, **kwargs)
+                return self._record(provider, provider_name, query, kwargs,
+                                    self._follow(provider_name, flight))
+            print(f"[{provider_name}] Identical search still running after {timeout:g} s, "
+                  f"searching separately")
+            flight = None
+
+        token = self.telemetry.upstream_started(provider_name)
+        listening = queue_listener.set(token.set_queued)
+        result = None
+        try:
+            result = await provider.asearch(query, api_key, **kwargs)
+        except BaseException as e:
+            self._land(self._aflights, key, flight, error=e)
+            raise
+        finally:
+            queue_listener.reset(listening)
+            self.telemetry.upstream_finished(provider_name, token, result)
+        result = self._complete(cache_key, result)
+        self._land(self._aflights, key, flight, result=result)
+        return self._record(provider, provider_name, query, kwargs, result)
+
+    @staticmethod
+    def _job_error(job, e):
+        # Providers report errors in-band; this only guards against bugs in one of them
+        # taking down the whole fan-out.
+        print(f"[{job.provider_name}] Unhandled search error: {e}")
+        return {
+            "error": f"Error: {str(e)}",
+            "results": [],
+            "metrics": {"latency_ms": 0, "size_bytes": 0}
+        }
+
+    @staticmethod
+    def _tag_job_result(job, result, start_time):
+        result = dict(result)
+        result['provider'] = job.provider_name
+        result['elapsed_ms'] = round((time.perf_counter() - start_time) * 1000, 2)
+        return result
+
+    def _run_job(self, job):
+        start_time = time.perf_counter()
+        try:
+            result = self.search(
+                job.provider_name, job.query, job.api_key, use_cache=job.use_cache, **job.kwargs
+            )
+        except Exception as e:
+            result = self._job_error(job, e)
+        return self._tag_job_result(job, result, start_time)
+
+    async def _arun_job(self, job):
+        start_time = time.perf_counter()
+        try:
+            result = await self.asearch(
+                job.provider_name, job.query, job.api_key, use_cache=job.use_cache, **job.kwargs
+            )
+        except Exception as e:
+            result = self._job_error(job, e)
+        return self._tag_job_result(job, result, start_time)
+
+    def _submit(self, job):
+        """
+        Runs the job on its provider's pool, creating the pool on first use.
+
+        Raises:
+            RuntimeError: After `shutdown()`.
+        """
+        with self._executors_lock:
+            if self._shut_down:
+                raise RuntimeError("cannot schedule new searches after shutdown")
+            executor = self._executors.get(job.provider_name)
+            if executor is None:
+                executor = self._executors[job.provider_name] = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f'search-{job.provider_name}'
+                )
+        return executor.submit(self._run_job, job)
+
+    def search_many(self, jobs):
+        """
+        Execute several searches concurrently.
+
+        Args:
+            jobs (list[SearchJob]): The searches to run.
+
+        Returns:
+            list[dict]: One result per job, in the same order as `jobs`. Each result
+            carries the provider name and the wall-clock 'elapsed_ms' of its job.
+        """
+        futures = [self._submit(job) for job in jobs]
+        return [future.result() for future in futures]
+
+    async def asearch_many(self, jobs):
+        """
+        Asynchronous variant of `search_many()`. All jobs run concurrently on the
+        event loop, so no worker thread is held while waiting on upstreams.
+        """
+        import asyncio  # Only needed in ASGI mode; kept off the CLI's import path
+
+        return await asyncio.gather(*(self._arun_job(job) for job in jobs))
+
+    def search_as_completed(self, jobs):
+        """
+        Execute several searches concurrently, yielding each result as soon as it is ready.
+
+        Args:
+            jobs (list[SearchJob]): The searches to run.
+
+        Yields:
+            tuple: (index of the job in `jobs`, result), fastest job first.
+        """
+        futures = {self._submit(job): idx for idx, job in enumerate(jobs)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    async def asearch_as_completed(self, jobs):
+        """
+        Asynchronous variant of `search_as_completed()`.
+        """
+        import asyncio
+
+        async def run(idx, job):
+            return idx, await self._arun_job(job)
+
+        for next_done in asyncio.as_completed([run(idx, job) for idx, job in enumerate(jobs)]):
+            yield await next_done
+
+    def shutdown(self, wait=True):
+        """
+        Stop accepting new searches and release the worker threads.
+        """
+        with self._executors_lock:
+            self._shut_down = True
+            executors = list(self._executors.values())
+        for executor in executors:
+            executor.shutdown(wait=wait)
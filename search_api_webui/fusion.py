@@ -0,0 +1,256 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Merging of several providers' normalized results into one ranked list.
+
+Results are matched across providers by canonical URL, fused with reciprocal rank
+fusion (RRF) and compared pairwise for overlap. Every step is a single pass over
+the results with dict lookups, so fusing four providers with 100 results each takes
+a few milliseconds (see benchmarks/bench_fusion.py).
+"""
+
+import functools
+import itertools
+
+DEFAULT_RRF_K = 60
+
+# Query parameters that only track the click, never select the page
+TRACKING_PARAMS = frozenset({
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'ref', 'ref_src', 'spm'
+})
+
+
+def _is_tracking_param(param):
+    name = param.partition('=')[0].lower()
+    return name.startswith('utm_') or name in TRACKING_PARAMS
+
+
+@functools.lru_cache(maxsize=65536)
+def canonicalize_url(url):
+    """
+    Reduces a URL to a key shared by all spellings of the same page: the scheme,
+    credentials, 'www.', default ports, fragments, trailing slashes and tracking
+    parameters are dropped, the host is lowercased and the remaining query parameters
+    are sorted. Works on the raw string with partition() rather than urllib.parse,
+    which is several times slower; query parameters keep their encoded form.
+
+    Args:
+        url (str): The URL as returned by a provider.
+
+    Returns:
+        str: The canonical key, e.g. 'example.com/a?b=1', or '' for an empty URL.
+    """
+    url = (url or '').strip()
+    if not url:
+        return ''
+    scheme_end = url.find('//')
+    has_authority = scheme_end == 0 or (
+        scheme_end != -1 and url[scheme_end - 1] == ':' and url[:scheme_end - 1].isalpha()
+    )
+    if has_authority:
+        url = url[scheme_end + 2:]
+
+    url = url.partition('#')[0]
+    url, _, query = url.partition('?')
+    host, _, path = url.partition('/')
+
+    if has_authority:
+        host = host.rpartition('@')[2]
+    host = host.lower()
+    if host.endswith((':80', ':443')):
+        host = host.rpartition(':')[0]
+    host = host.rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+
+    path = ('/' + path).rstrip('/') if path else ''
+    if query:
+        params = [param for param in query.split('&') if param and not _is_tracking_param(param)]
+        params.sort()
+        query = '&'.join(params)
+    return f'{host}{path}?{query}' if query else f'{host}{path}'
+
+
+def _result_key(item):
+    url = item.get('url')
+    key = canonicalize_url(url) if isinstance(url, str) else ''
+    if key:
+        return key
+    # Results without a URL can only be matched by title
+    title = item.get('title')
+    title = title.strip().lower() if isinstance(title, str) else ''
+    return f'title:{title}' if title else None
+
+
+def rank_map(results):
+    """
+    De-duplicates one provider's ranked results.
+
+    Args:
+        results (list[dict]): Normalized results, best first.
+
+    Returns:
+        dict: Canonical key -> (1-based rank, result) of each page's best-ranked result;
+        insertion order is rank order.
+    """
+    ranks = {}
+    for rank, item in enumerate(results, 1):
+        key = _result_key(item) if isinstance(item, dict) else None
+        if key is not None and key not in ranks:
+            ranks[key] = (rank, item)
+    return ranks
+
+
+def reciprocal_rank_fusion(ranked_lists, k=DEFAULT_RRF_K, limit=None):
+    """
+    Fuses ranked result lists: each page scores the sum of 1 / (k + rank) over the
+    providers that returned it, so pages found by several providers near the top
+    rise above pages only one provider ranks highly.
+
+    Args:
+        ranked_lists (dict): Provider name -> normalized results, best first.
+        k (int): RRF damping constant; larger values flatten the rank weights.
+        limit (int): Return at most this many results, if given.
+
+    Returns:
+        list[dict]: Fused results with 'title', 'url', 'snippet', the RRF 'score' and
+        the page's rank per provider in 'ranks', best first.
+    """
+    return _fuse(_rank_maps(ranked_lists), k, limit)
+
+
+def _rank_maps(ranked_lists, depth=None):
+    return {
+        provider: rank_map(results if depth is None else results[:depth])
+        for provider, results in ranked_lists.items()
+    }
+
+
+def _fuse(rank_maps, k, limit):
+    fused = {}
+    for provider, ranks in rank_maps.items():
+        for key, (rank, item) in ranks.items():
+            entry = fused.get(key)
+            if entry is None:
+                fused[key] = entry = {
+                    "title": item.get('title', ''),
+                    "url": item.get('url', ''),
+                    "snippet": item.get('snippet', ''),
+                    "score": 0.0,
+                    "ranks": {},
+                    "best_rank": rank
+                }
+            elif rank < entry['best_rank']:
+                # Show the version of the best-ranking provider
+                entry.update(title=item.get('title') or entry['title'],
+                             url=item.get('url') or entry['url'],
+                             snippet=item.get('snippet') or entry['snippet'],
+                             best_rank=rank)
+            elif not entry['snippet']:
+                entry['snippet'] = item.get('snippet', '')
+            entry['score'] += 1.0 / (k + rank)
+            entry['ranks'][provider] = rank
+
+    ordered = sorted(fused.values(), key=lambda e: (-e['score'], e['best_rank']))
+    if limit is not None:
+        ordered = ordered[:limit]
+    for entry in ordered:
+        entry['score'] = round(entry['score'], 6)
+        del entry['best_rank']
+    return ordered
+
+
+def _spearman(ranks_a, ranks_b):
+    """
+    Spearman's rank correlation of two rankings of the same n items (no ties).
+
+    Returns:
+        float: Between -1 and 1, or None for fewer than two items.
+    """
+    n = len(ranks_a)
+    if n < 2:
+        return None
+    # Re-rank within the shared items so both rankings run 0..n-1
+    order_a = [0] * n
+    order_b = [0] * n
+    for position, i in enumerate(sorted(range(n), key=ranks_a.__getitem__)):
+        order_a[i] = position
+    for position, i in enumerate(sorted(range(n), key=ranks_b.__getitem__)):
+        order_b[i] = position
+    d_squared = sum((a - b) ** 2 for a, b in zip(order_a, order_b))
+    return 1 - 6 * d_squared / (n * (n * n - 1))
+
+
+def overlap_stats(ranked_lists, depth=None):
+    """
+    Compares every pair of providers' results.
+
+    Args:
+        ranked_lists (dict): Provider name -> normalized results, best first.
+        depth (int): Only compare each provider's top `depth` results, if given.
+
+    Returns:
+        list[dict]: Per pair: 'providers', the number of 'shared' pages, the 'jaccard'
+        similarity of their page sets and the 'spearman' correlation of the shared
+        pages' ranks (None with fewer than two shared pages).
+    """
+    return _overlap(_rank_maps(ranked_lists, depth))
+
+
+def _overlap(rank_maps):
+    pairs = []
+    for (name_a, ranks_a), (name_b, ranks_b) in itertools.combinations(rank_maps.items(), 2):
+        shared = [key for key in ranks_a if key in ranks_b]
+        union = len(ranks_a) + len(ranks_b) - len(shared)
+        spearman = _spearman([ranks_a[key][0] for key in shared],
+                             [ranks_b[key][0] for key in shared])
+        pairs.append({
+            "providers": [name_a, name_b],
+            "shared": len(shared),
+            "jaccard": round(len(shared) / union, 4) if union else 0.0,
+            "spearman": round(spearman, 4) if spearman is not None else None
+        })
+    return pairs
+
+
+def fuse_results(ranked_lists, k=DEFAULT_RRF_K, limit=None):
+    """
+    Fuses the results and compares the providers, de-duplicating each list once.
+
+    Args:
+        ranked_lists (dict): Provider name -> normalized results, best first.
+        k (int): RRF damping constant, see `reciprocal_rank_fusion()`.
+        limit (int): Return at most this many fused results, if given.
+
+    Returns:
+        dict: 'results' (see `reciprocal_rank_fusion()`), 'overlap' (see
+        `overlap_stats()`), the number of 'unique' pages and of 'duplicates' dropped.
+    """
+    rank_maps = _rank_maps(ranked_lists)
+    results = _fuse(rank_maps, k, None)
+    total = sum(len(results) for results in ranked_lists.values())
+    return {
+        "results": results if limit is None else results[:limit],
+        "overlap": _overlap(rank_maps),
+        "unique": len(results),
+        "duplicates": total - len(results)
+    }
@@ -0,0 +1,411 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Persistent search history: every search handled by the dispatcher, with its
+parameters, metrics and result URLs, kept in a local SQLite database so provider
+latency can be compared across days.
+
+Searches are queued by the request threads and written in batches by a single
+background thread, so recording never waits on the disk. The database runs in WAL
+mode, which lets the history and stats endpoints read while a batch is written.
+"""
+
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import closing
+
+from search_api_webui.stats import percentile
+from search_api_webui.jsonutil import dumps_str, loads
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_FLUSH_INTERVAL = 1.0   # Seconds a queued search may wait for its batch
+DEFAULT_MAX_QUEUE = 10000      # Searches buffered before new ones are dropped
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_BUCKETS = 1000
+BUSY_TIMEOUT = 10              # Seconds to wait for another process' write lock
+
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+DURATION_UNITS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS searches ("
+    " id INTEGER PRIMARY KEY, ts REAL NOT NULL, provider TEXT NOT NULL, query TEXT,"
+    " params TEXT, latency_ms REAL, size_bytes INTEGER, cache_hit INTEGER NOT NULL,"
+    " result_count INTEGER, error TEXT, error_type TEXT, status_code INTEGER,"
+    " metrics TEXT, urls TEXT)",
+    # Covers every column /api/stats reads, so aggregation never touches the table
+    "CREATE INDEX IF NOT EXISTS searches_ts"
+    " ON searches (ts, provider, latency_ms, cache_hit, error_type)",
+    "CREATE INDEX IF NOT EXISTS searches_provider_ts ON searches (provider, ts)",
+    "CREATE INDEX IF NOT EXISTS searches_query_ts ON searches (query, ts)",
+)
+
+COLUMNS = ('ts', 'provider', 'query', 'params', 'latency_ms', 'size_bytes', 'cache_hit',
+           'result_count', 'error', 'error_type', 'status_code', 'metrics', 'urls')
+JSON_COLUMNS = ('params', 'metrics', 'urls')
+INSERT = (f"INSERT INTO searches ({', '.join(COLUMNS)})"
+          f" VALUES ({', '.join('?' * len(COLUMNS))})")
+
+_JSON_INDEXES = frozenset(COLUMNS.index(name) for name in JSON_COLUMNS)
+_STOP = object()
+
+
+def parse_duration(value):
+    """
+    Parses a duration such as "90s", "15m", "24h", "7d" or "2w"; a bare number is
+    taken as seconds.
+
+    Returns:
+        float: The duration in seconds.
+
+    Raises:
+        ValueError: If the value is not a positive duration.
+    """
+    text = str(value).strip().lower()
+    unit = DURATION_UNITS.get(text[-1:]) if text else None
+    try:
+        seconds = float(text[:-1] if unit else text) * (unit or 1)
+    except ValueError:
+        raise ValueError(f"Invalid duration: {value!r}")
+    if seconds <= 0:
+        raise ValueError(f"Duration must be positive: {value!r}")
+    return seconds
+
+
+def _search_params(kwargs):
+    params = {}
+    for name in ('limit', 'language', 'api_url'):
+        if kwargs.get(name):
+            params[name] = kwargs[name]
+    if 'api_url' in params:
+        # Custom endpoints may carry credentials in their query string
+        from search_api_webui.providers.replay import redact_url
+        params['api_url'] = redact_url(params['api_url'])
+    return params
+
+
+def _latency_summary(latencies):
+    """
+    Returns:
+        dict: Percentiles, mean and max of the sorted latencies, in milliseconds.
+    """
+    summary = {f'p{pct}': round(percentile(latencies, pct), 2) for pct in LATENCY_PERCENTILES}
+    summary['mean'] = round(sum(latencies) / len(latencies), 2) if latencies else 0.0
+    summary['max'] = round(latencies[-1], 2) if latencies else 0.0
+    return summary
+
+
+class _Aggregate:
+    """
+    Counters and latency samples of one provider, or one of its time buckets.
+    """
+
+    def __init__(self):
+        self.searches = 0
+        self.cache_hits = 0
+        self.errors = 0
+        self.latencies = []
+
+    def add(self, latency_ms, cache_hit, error_type, include_cached):
+        self.searches += 1
+        if cache_hit:
+            self.cache_hits += 1
+        elif error_type:
+            self.errors += 1
+        if latency_ms is not None and not error_type and (include_cached or not cache_hit):
+            self.latencies.append(latency_ms)
+
+    def to_dict(self):
+        upstream = self.searches - self.cache_hits
+        self.latencies.sort()
+        return {
+            "searches": self.searches,
+            "cache_hits": self.cache_hits,
+            "errors": self.errors,
+            "error_rate": round(self.errors / upstream, 4) if upstream else 0.0,
+            "latency_ms": _latency_summary(self.latencies)
+        }
+
+
+class SearchHistory:
+    """
+    SQLite store of past searches with a batched background writer.
+
+    Usage:
+        history = SearchHistory(path)
+        history.record(provider_name, query, kwargs, result)   # Never blocks
+        history.entries(provider='querit', limit=20)
+        history.stats(window=86400, bucket=3600)
+        history.close()                                         # Writes what is queued
+    """
+
+    def __init__(self, path, batch_size=DEFAULT_BATCH_SIZE,
+                 flush_interval=DEFAULT_FLUSH_INTERVAL, max_queue=DEFAULT_MAX_QUEUE):
+        """
+        Args:
+            path (str): The SQLite database file; created if missing.
+            batch_size (int): Maximum searches written per transaction.
+            flush_interval (float): Seconds the writer waits to fill a batch.
+            max_queue (int): Searches buffered in memory before new ones are dropped.
+        """
+        self.path = str(path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dropped = 0
+        self._queue = queue.Queue(max_queue)
+        self._closed = False
+        self._lock = threading.Lock()
+
+        with closing(self._connect()) as conn:
+            # WAL is a property of the database file, so this only needs to happen once
+            conn.execute("PRAGMA journal_mode=WAL")
+            for statement in SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+
+        self._thread = threading.Thread(target=self._run, name='search-history', daemon=True)
+        self._thread.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+        # Commits are not fsynced in WAL mode; a power loss may cost the last batches
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def record(self, provider_name, query, kwargs, result):
+        """
+        Queues a finished search for writing. Returns immediately; if the writer has
+        fallen too far behind, the search is dropped and counted in `dropped`.
+        Raw passthrough searches carry no parsed results and are not recorded.
+
+        Args:
+            provider_name (str): The provider searched.
+            query (str): The search keywords.
+            kwargs (dict): The search arguments ('limit', 'language', 'api_url').
+            result (dict): The standardized result, including its metrics.
+        """
+        if self._closed or kwargs.get('raw'):
+            return
+        metrics = result.get('metrics') or {}
+        results = result.get('results')
+        row = (
+            time.time(), provider_name, query, _search_params(kwargs),
+            metrics.get('latency_ms'), metrics.get('size_bytes'),
+            1 if metrics.get('cache_hit') else 0,
+            len(results) if isinstance(results, list) else None,
+            result.get('error'),
+            (result.get('error_type') or 'other') if result.get('error') else None,
+            result.get('status_code'),
+            metrics,
+            [item.get('url') for item in results or [] if isinstance(item, dict)]
+        )
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def _next_batch(self):
+        """
+        Waits for the next search, then collects more until the batch is full or the
+        flush interval has passed.
+
+        Returns:
+            tuple: (rows, flush events to set once written, whether to stop)
+        """
+        rows = []
+        events = []
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            if item is _STOP:
+                return rows, events, True
+            if isinstance(item, threading.Event):
+                events.append(item)
+                return rows, events, False
+            rows.append(item)
+            timeout = deadline - time.monotonic()
+            if len(rows) >= self.batch_size or timeout <= 0:
+                return rows, events, False
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                return rows, events, False
+
+    def _write(self, conn, rows):
+        # Encoding happens here rather than in record() to keep it off the request threads
+        encoded = [tuple(dumps_str(value) if index in _JSON_INDEXES else value
+                         for index, value in enumerate(row))
+                   for row in rows]
+        try:
+            with conn:
+                conn.executemany(INSERT, encoded)
+        except sqlite3.Error as e:
+            # History is best effort and must never affect searches
+            print(f"  [History] Failed to write {len(rows)} search(es): {e}")
+            with self._lock:
+                self.dropped += len(rows)
+
+    def _run(self):
+        with closing(self._connect()) as conn:
+            stop = False
+            while not stop:
+                rows, events, stop = self._next_batch()
+                if rows:
+                    self._write(conn, rows)
+                for event in events:
+                    event.set()
+
+    def flush(self, timeout=None):
+        """
+        Blocks until every search queued so far has been written.
+
+        Returns:
+            bool: False if `timeout` seconds passed first.
+        """
+        if self._closed:
+            return True
+        event = threading.Event()
+        self._queue.put(event)
+        return event.wait(timeout)
+
+    def close(self, timeout=5):
+        """
+        Writes the queued searches and stops the writer. Safe to call more than once.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def _select(self, sql, args):
+        with closing(sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)) as conn:
+            return conn.execute(sql, args).fetchall()
+
+    def entries(self, provider=None, query=None, since=None, until=None,
+                before_id=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        Past searches, newest first. Page through them by passing the 'id' of the
+        last entry returned as `before_id`.
+
+        Args:
+            provider (str): Only searches against this provider.
+            query (str): Only searches for exactly this query.
+            since (float): Only searches at or after this Unix time.
+            until (float): Only searches before this Unix time.
+            before_id (int): Only entries older than this one.
+            limit (int): Maximum entries returned (at most MAX_PAGE_SIZE).
+
+        Returns:
+            list[dict]: The matching searches.
+        """
+        conditions = []
+        args = []
+        for condition, value in (('provider = ?', provider), ('query = ?', query),
+                                 ('ts >= ?', since), ('ts < ?', until),
+                                 ('id < ?', before_id)):
+            if value is not None:
+                conditions.append(condition)
+                args.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        args.append(max(1, min(limit, MAX_PAGE_SIZE)))
+        rows = self._select(
+            f"SELECT id, {', '.join(COLUMNS)} FROM searches{where} ORDER BY id DESC LIMIT ?",
+            args
+        )
+
+        entries = []
+        for row in rows:
+            entry = dict(zip(('id',) + COLUMNS, row))
+            entry['cache_hit'] = bool(entry['cache_hit'])
+            for name in JSON_COLUMNS:
+                entry[name] = loads(entry[name]) if entry[name] else None
+            entries.append(entry)
+        return entries
+
+    def stats(self, window, bucket=None, provider=None, until=None, include_cached=False):
+        """
+        Aggregates the searches of the last `window` seconds per provider: search,
+        cache hit and error counts, and latency percentiles. Latency is taken from
+        successful upstream searches only, unless `include_cached` is set; the error
+        rate is relative to upstream searches.
+
+        Args:
+            window (float): Length of the aggregated period in seconds.
+            bucket (float): Also aggregate per time bucket of this many seconds.
+            provider (str): Only this provider.
+            until (float): End of the period as Unix time; defaults to now.
+            include_cached (bool): Count cache hits in the latency percentiles.
+
+        Returns:
+            dict: 'since', 'until', 'bucket_s' and one entry per provider under
+            'providers', with its time buckets (oldest first) under 'buckets'.
+
+        Raises:
+            ValueError: If the window would be split into more than MAX_BUCKETS buckets.
+        """
+        until = time.time() if until is None else until
+        since = until - window
+        if bucket is not None and window / bucket > MAX_BUCKETS:
+            raise ValueError(f"A stats window is split into at most {MAX_BUCKETS} buckets")
+
+        sql = ("SELECT provider, ts, latency_ms, cache_hit, error_type FROM searches"
+               " INDEXED BY searches_ts WHERE ts >= ? AND ts < ?")
+        args = [since, until]
+        if provider is not None:
+            sql += " AND provider = ?"
+            args.append(provider)
+
+        totals = {}
+        buckets = {}
+        for name, ts, latency_ms, cache_hit, error_type in self._select(sql, args):
+            total = totals.get(name)
+            if total is None:
+                total = totals[name] = _Aggregate()
+            total.add(latency_ms, cache_hit, error_type, include_cached)
+            if bucket is not None:
+                key = (name, int((ts - since) // bucket))
+                aggregate = buckets.get(key)
+                if aggregate is None:
+                    aggregate = buckets[key] = _Aggregate()
+                aggregate.add(latency_ms, cache_hit, error_type, include_cached)
+
+        providers = []
+        for name in sorted(totals):
+            summary = dict(provider=name, **totals[name].to_dict())
+            if bucket is not None:
+                summary['buckets'] = [
+                    dict(start=round(since + index * bucket, 3), **buckets[(name, index)].to_dict())
+                    for index in sorted(index for key, index in buckets if key == name)
+                ]
+            providers.append(summary)
+
+        return {
+            "since": round(since, 3),
+            "until": round(until, 3),
+            "bucket_s": bucket,
+            "providers": providers
+        }
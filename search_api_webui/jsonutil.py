@@ -0,0 +1,103 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+JSON encoding and decoding on the request path, with the fastest backend installed:
+orjson, then ujson, then the standard library (see the 'fast-json' extra).
+
+`dumps()` returns compact UTF-8 bytes ready to be written to a response, and
+`loads()` accepts bytes, so bodies are never converted to str in between.
+"""
+
+import json
+
+try:
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:  # Flask < 2.2 has no pluggable JSON provider
+    DefaultJSONProvider = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+def _stdlib_dumps(obj):
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+if orjson is not None:
+    BACKEND = 'orjson'
+    loads = orjson.loads
+
+    def dumps(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # e.g., integers beyond 64 bits, which orjson rejects
+            return _stdlib_dumps(obj)
+
+elif ujson is not None:
+    BACKEND = 'ujson'
+    loads = ujson.loads
+
+    def dumps(obj):
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode('utf-8')
+
+else:
+    BACKEND = 'json'
+    loads = json.loads
+    dumps = _stdlib_dumps
+
+
+def dumps_str(obj):
+    """
+    Encodes `obj` as a compact JSON string.
+    """
+    return dumps(obj).decode('utf-8')
+
+
+class FastJSONProvider(DefaultJSONProvider or object):
+    """
+    Flask JSON provider using the fast backend for `jsonify()` and `request.json`.
+    Keys are not sorted, unlike Flask's default, as sorting costs time on every response.
+    Only usable with Flask 2.2 or later.
+    """
+
+    sort_keys = False
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return dumps_str(obj)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype=self.mimetype)
@@ -18,37 +18,310 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import importlib
 import os
-import yaml
-from .generic import GenericProvider
-from .querit import QueritSdkProvider
+import threading
+import time
+from collections.abc import Mapping
 
-def load_providers(file_path='providers.yaml'):
+# Provider classes by the `type` key of providers.yaml, as "module:ClassName".
+# Modules are only imported once a provider of that type is first used.
+PROVIDER_TYPES = {
+    'generic': 'search_api_webui.providers.generic:GenericProvider',
+    'querit_sdk': 'search_api_webui.providers.querit:QueritSdkProvider',
+    'replay': 'search_api_webui.providers.replay:ReplayProvider',
+}
+DEFAULT_PROVIDER_TYPE = 'generic'
+
+RELOAD_CHECK_INTERVAL = 1.0   # Seconds between checks of the config files for changes
+RETIRE_DELAY = 60             # Seconds before a replaced provider's connections are closed
+
+
+def register_provider_type(type_name, target):
     """
-    Parses the YAML configuration file and instantiates the appropriate provider classes.
-    
+    Registers a provider class for a `type` value in providers.yaml.
+
     Args:
-        file_path (str): Path to the providers configuration file.
-        
+        type_name (str): The value of the `type` key.
+        target (str): Import path of the class, as "package.module:ClassName".
+    """
+    PROVIDER_TYPES[type_name] = target
+
+
+def get_provider_class(type_name):
+    """
+    Imports and returns the provider class registered for `type_name`.
+    Unknown types fall back to the generic provider.
+    """
+    target = PROVIDER_TYPES.get(type_name, PROVIDER_TYPES[DEFAULT_PROVIDER_TYPE])
+    module_name, class_name = target.split(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _read_yaml(file_path):
+    import yaml
+
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            configs = yaml.safe_load(f) or {}
+    except yaml.YAMLError as e:
+        raise ValueError(f"invalid YAML in {file_path}: {e}")
+    if not isinstance(configs, dict):
+        raise ValueError(f"{file_path} must map provider names to their settings")
+    for name, conf in configs.items():
+        if not isinstance(conf, dict):
+            raise ValueError(f"provider '{name}' in {file_path} must be a mapping of settings")
+    return configs
+
+
+def load_provider_configs(file_path='providers.yaml', override_path=None):
+    """
+    Parses the YAML configuration file and the optional override file.
+    A provider defined in the override file replaces the one of the same name.
+
+    A replay provider gets the configuration of the provider it replays as 'source'
+    and does not require an API key.
+
     Returns:
-        dict: A dictionary mapping provider names to their initialized instances.
+        dict: Provider names mapped to their configuration, with 'name' filled in.
+
+    Raises:
+        ValueError: If a file is not valid YAML, not a mapping, or a provider's
+            settings are not a mapping.
     """
-    if not os.path.exists(file_path):
+    if os.path.exists(file_path):
+        configs = _read_yaml(file_path)
+    else:
         print(f"Warning: Provider config file not found at {file_path}")
-        return {}
-        
-    with open(file_path, 'r', encoding='utf-8') as f:
-        configs = yaml.safe_load(f)
+        configs = {}
+
+    if override_path and os.path.exists(override_path):
+        configs.update(_read_yaml(override_path))
 
-    providers = {}
     for name, conf in configs.items():
         conf['name'] = name
-        provider_type = conf.get('type', 'generic')
+    for conf in configs.values():
+        if conf.get('type') == 'replay':
+            conf.setdefault('requires_api_key', False)
+            replays = conf.get('replays')
+            source = configs.get(replays) if isinstance(replays, str) else None
+            if source is not None:
+                conf['source'] = dict(source)
+    return configs
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _retire(providers):
+    """
+    Closes replaced providers once searches still using them have finished.
+    """
+    if not providers:
+        return
+
+    def close_all():
+        for provider in providers:
+            provider.close()
+
+    timer = threading.Timer(RETIRE_DELAY, close_all)
+    timer.daemon = True
+    timer.start()
+
+
+class ProviderMap(Mapping):
+    """
+    Read-only mapping of provider names to provider instances.
 
-        # Instantiate specific provider based on type or name
-        if provider_type == 'querit_sdk':
-            providers[name] = QueritSdkProvider(conf)
-        else:
-            providers[name] = GenericProvider(conf)
+    The configuration is loaded on first access, and each provider is only
+    imported and instantiated the first time it is looked up. Providers whose
+    configuration is invalid are reported and then treated as missing.
 
-    return providers
+    If `watch_paths` are given, the files are checked for changes at most once per
+    RELOAD_CHECK_INTERVAL during lookups. On a change, only providers whose settings
+    differ are replaced, so unchanged providers keep their warm connection pools.
+    """
+
+    def __init__(self, loader, watch_paths=(), on_reload=None):
+        """
+        Args:
+            loader (callable): Returns the provider configurations
+                (see load_provider_configs).
+            watch_paths (tuple[str]): Files whose changes trigger a reload.
+            on_reload (callable): Called with the names of the added, changed and
+                removed providers after a reload.
+        """
+        self._loader = loader
+        self._watch_paths = tuple(watch_paths)
+        self.on_reload = on_reload
+        self._configs = None
+        self._instances = {}
+        self._signature = None
+        self._failed_signature = None
+        self._next_check = 0.0
+        self._lock = threading.RLock()
+
+    def _files_signature(self):
+        return tuple(_file_signature(path) for path in self._watch_paths)
+
+    def _get_configs(self):
+        if self._configs is None:
+            with self._lock:
+                if self._configs is None:
+                    signature = self._files_signature()
+                    self._next_check = time.monotonic() + RELOAD_CHECK_INTERVAL
+                    self._configs = self._loader()
+                    self._signature = signature
+        elif self._watch_paths and time.monotonic() >= self._next_check:
+            self.reload_if_changed()
+        return self._configs
+
+    def _create(self, name, conf):
+        return get_provider_class(conf.get('type', DEFAULT_PROVIDER_TYPE))(conf)
+
+    def __getitem__(self, name):
+        self._get_configs()
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+
+        with self._lock:
+            configs = self._configs
+            if name in self._instances:
+                return self._instances[name]
+            conf = configs[name]
+            try:
+                instance = self._create(name, conf)
+            except ValueError as e:
+                # e.g., an invalid JMESPath expression in response_mapping
+                print(f"Error: Skipping provider '{name}', invalid configuration: {e}")
+                del configs[name]
+                raise KeyError(name)
+            self._instances[name] = instance
+            return instance
+
+    def __iter__(self):
+        return iter(list(self._get_configs()))
+
+    def __len__(self):
+        return len(self._get_configs())
+
+    def __contains__(self, name):
+        return name in self._get_configs()
+
+    def config(self, name):
+        """
+        Returns a provider's configuration without instantiating it.
+        """
+        return self._get_configs()[name]
+
+    def instances(self):
+        """
+        Returns:
+            list: The providers instantiated so far.
+        """
+        with self._lock:
+            return list(self._instances.values())
+
+    def reset(self, loader=None):
+        """
+        Drops all instances; the configuration is reloaded on next access.
+
+        Args:
+            loader (callable): Replaces the configuration loader, if given.
+        """
+        with self._lock:
+            if loader is not None:
+                self._loader = loader
+            self._configs = None
+            self._instances = {}
+
+    def reload_if_changed(self):
+        """
+        Reloads the configuration if a watched file changed since it was last read.
+
+        Returns:
+            bool: Whether any provider was added, changed or removed.
+        """
+        with self._lock:
+            self._next_check = time.monotonic() + RELOAD_CHECK_INTERVAL
+            signature = self._files_signature()
+            if self._configs is None or signature in (self._signature,
+                                                      self._failed_signature):
+                return False
+            try:
+                new_configs = self._loader()
+            except (OSError, ValueError) as e:
+                # Retried once the files change again; until then, report it only once
+                print(f"Error: Keeping the current providers, reload failed: {e}")
+                self._failed_signature = signature
+                return False
+            self._signature = signature
+            self._failed_signature = None
+            updated = self._swap(new_configs)
+
+        if updated and self.on_reload is not None:
+            self.on_reload(updated)
+        return bool(updated)
+
+    def _swap(self, new_configs):
+        old_configs, old_instances = self._configs, self._instances
+        instances = {}
+        updated = []
+
+        for name, conf in new_configs.items():
+            if old_configs.get(name) == conf:
+                if name in old_instances:
+                    instances[name] = old_instances[name]
+                continue
+            if name in old_instances:
+                # Replace providers in use right away, so their pools are warm again
+                # before the next search and a broken edit is reported now
+                try:
+                    instances[name] = self._create(name, conf)
+                except ValueError as e:
+                    print(f"Error: Keeping the current '{name}' provider, "
+                          f"invalid configuration: {e}")
+                    new_configs[name] = old_configs[name]
+                    instances[name] = old_instances[name]
+                    continue
+            updated.append(name)
+
+        removed = [name for name in old_configs if name not in new_configs]
+        retired = [instance for name, instance in old_instances.items()
+                   if instances.get(name) is not instance]
+
+        self._configs, self._instances = new_configs, instances
+        _retire(retired)
+
+        if updated or removed:
+            print(f"[Providers] Reloaded: updated {updated or 'none'}, "
+                  f"removed {removed or 'none'}")
+        return updated + removed
+
+
+def load_providers(file_path='providers.yaml', override_path=None, on_reload=None):
+    """
+    Returns the providers declared in a YAML configuration file.
+    Nothing is read or instantiated until the first lookup, and later edits of
+    either file are picked up without a restart.
+
+    Args:
+        file_path (str): Path to the providers configuration file.
+        override_path (str): Optional file whose providers replace or extend those
+            of `file_path`.
+        on_reload (callable): See ProviderMap.
+
+    Returns:
+        ProviderMap: A mapping of provider names to their (lazily created) instances.
+    """
+    watch_paths = (file_path,) + ((override_path,) if override_path else ())
+    return ProviderMap(
+        lambda: load_provider_configs(file_path, override_path),
+        watch_paths=watch_paths, on_reload=on_reload
+    )
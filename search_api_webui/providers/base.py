@@ -18,8 +18,79 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import asyncio
+import contextvars
+import functools
+import json
+import sys
 from abc import ABC, abstractmethod
 
+import requests
+from urllib3.exceptions import NewConnectionError, TimeoutError as Urllib3TimeoutError
+
+# 'throttled': the request was never sent, the provider's own limits were exhausted
+ERROR_TYPES = ('timeout', 'http', 'connection', 'parse', 'throttled', 'other')
+
+
+def classify_error(exc):
+    """
+    Maps an exception raised while searching to a coarse error class.
+
+    Returns:
+        str: One of ERROR_TYPES.
+    """
+    if isinstance(exc, (requests.Timeout, TimeoutError)):
+        return 'timeout'
+    if isinstance(exc, requests.ConnectionError) and exc.args:
+        # Read timeouts that exhausted the adapter's retries surface as a ConnectionError.
+        # urllib3 2 derives NewConnectionError (e.g., connection refused) from its
+        # TimeoutError, so that one is a connection failure
+        reason = getattr(exc.args[0], 'reason', None)
+        if (isinstance(reason, Urllib3TimeoutError)
+                and not isinstance(reason, NewConnectionError)):
+            return 'timeout'
+    if isinstance(exc, requests.HTTPError):
+        return 'http'
+    if isinstance(exc, (requests.ConnectionError, requests.exceptions.ChunkedEncodingError,
+                        ConnectionError)):
+        return 'connection'
+    # httpx is optional and imported lazily; its errors can only occur once it is loaded
+    httpx = sys.modules.get('httpx')
+    if httpx is not None:
+        if isinstance(exc, httpx.TimeoutException):
+            return 'timeout'
+        if isinstance(exc, httpx.HTTPStatusError):
+            return 'http'
+        if isinstance(exc, httpx.TransportError):
+            return 'connection'
+    if isinstance(exc, (json.JSONDecodeError, requests.exceptions.InvalidJSONError)):
+        return 'parse'
+    return 'other'
+
+
+def error_result(message, error_type='other', status_code=None, retry_after=None):
+    """
+    Builds the standard in-band error result returned by providers.
+
+    Args:
+        message (str): Error message shown to the user.
+        error_type (str): One of ERROR_TYPES, used for telemetry.
+        status_code (int): The upstream HTTP status, if the upstream answered.
+        retry_after (float): Seconds the upstream asked us to wait (Retry-After), if any.
+    """
+    result = {
+        "error": message,
+        "error_type": error_type,
+        "results": [],
+        "metrics": {"latency_ms": 0, "size_bytes": 0}
+    }
+    if status_code is not None:
+        result["status_code"] = status_code
+    if retry_after is not None:
+        result["retry_after_s"] = retry_after
+    return result
+
+
 class BaseProvider(ABC):
     """
     Abstract base class for all search providers.
@@ -41,5 +112,65 @@ class BaseProvider(ABC):
                 - 'results': List of dicts with 'title', 'url', 'snippet'.
                 - 'metrics': Dict with 'latency_ms' and 'size_bytes'.
                 - 'error': (Optional) Error message string if occurred.
+                - 'error_type': (Optional) Error class, see `classify_error()`.
+                - 'status_code': (Optional) Upstream HTTP status of a failed request.
+                - 'retry_after_s': (Optional) The upstream's Retry-After, in seconds.
+        """
+        pass
+
+    def prewarm(self, api_key=None, api_url=None):
+        """
+        Open connections to the provider ahead of the first search, in the background.
+        Called at startup and whenever the user's settings change. Must not block.
+
+        Args:
+            api_key (str): The configured API Key, if any.
+            api_url (str): The configured custom endpoint, if any.
+        """
+        pass
+
+    def close(self):
+        """
+        Release pooled connections and background resources.
+        """
+        pass
+
+    def max_search_time(self):
+        """
+        Returns:
+            float: Seconds a search can take at most, retries and waits under the
+            provider's limits included, or None if unknown.
+        """
+        return None
+
+    def mount_adapter(self, adapter):
+        """
+        Send all of the provider's HTTP requests through a `requests` transport
+        adapter instead of the network, e.g., to replay recorded responses.
+        Connections are no longer warmed, and async searches use `search()`.
+
+        Raises:
+            NotImplementedError: If the provider does not use `requests` sessions.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support custom transports")
+
+    async def asearch(self, query, api_key, **kwargs):
+        """
+        Asynchronous variant of `search()` with the same arguments and result format.
+
+        The default implementation offloads the blocking `search()` to the event
+        loop's thread pool. Providers with a native async client override it so an
+        in-flight upstream call does not occupy a thread.
+        """
+        loop = asyncio.get_running_loop()
+        # Run in a copy of the context, so listeners such as limits.queue_listener apply
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            None, functools.partial(context.run, self.search, query, api_key, **kwargs)
+        )
+
+    async def aclose(self):
+        """
+        Release resources held for asynchronous searches (e.g., async HTTP clients).
         """
         pass
@@ -0,0 +1,193 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import threading
+
+import requests
+
+from .timing import TimedHTTPAdapter, record_response
+
+DEFAULT_POOL_SIZE = 16            # Pooled connections per host
+DEFAULT_WARM_CONNECTIONS = 1      # Connections kept open ahead of demand
+DEFAULT_KEEPALIVE_INTERVAL = 30   # Seconds between keep-alive checks
+WARM_TIMEOUT = 5                  # Seconds allowed to open one connection
+
+# Response hooks added to every session created afterwards (see replay.record_responses)
+SESSION_RESPONSE_HOOKS = []
+
+
+def create_session(pool_size=DEFAULT_POOL_SIZE, **adapter_kwargs):
+    """
+    Creates a session whose connection pool is sized for `pool_size` concurrent requests
+    per host and whose requests report their phase timings (see timing.RequestTimer).
+    """
+    adapter = TimedHTTPAdapter(pool_connections=4, pool_maxsize=pool_size, **adapter_kwargs)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    # Timing runs first, so later hooks see the downloaded body
+    session.hooks['response'].append(record_response)
+    session.hooks['response'].extend(SESSION_RESPONSE_HOOKS)
+    return session
+
+
+def mount_adapter(session, adapter):
+    """
+    Sends all of the session's requests through `adapter`, closing its pooled connections.
+    Hooks from SESSION_RESPONSE_HOOKS are removed, so replayed responses are not recorded.
+    """
+    session.hooks['response'] = [
+        hook for hook in session.hooks['response'] if hook not in SESSION_RESPONSE_HOOKS
+    ]
+    session.close()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+def _connection_pool_for(session, url):
+    """
+    Returns the urllib3 pool the session would use for a request to `url`.
+    Resolves verify/proxy settings exactly like a real request so the warmed
+    pool is the one later searches pick up.
+    """
+    adapter = session.get_adapter(url)
+    settings = session.merge_environment_settings(url, {}, None, None, None)
+    if hasattr(adapter, 'get_connection_with_tls_context'):
+        prepared = requests.Request('GET', url).prepare()
+        pool = adapter.get_connection_with_tls_context(
+            prepared, settings['verify'], proxies=settings['proxies'], cert=settings['cert']
+        )
+    else:  # requests < 2.32
+        pool = adapter.get_connection(url, settings['proxies'])
+    adapter.cert_verify(pool, url, settings['verify'], settings['cert'])
+    return pool
+
+
+def warm_session(session, url, count=DEFAULT_WARM_CONNECTIONS):
+    """
+    Ensures `count` idle connections to the host of `url` are open in the session's pool.
+    Only the TCP/TLS handshake is performed; no HTTP request is sent, so this works
+    for APIs that reject HEAD and costs no API quota.
+
+    Returns:
+        int: Number of connections that had to be (re)opened.
+    """
+    pool = _connection_pool_for(session, url)
+    connections = []
+    opened = 0
+    try:
+        for _ in range(count):
+            # The pool discards connections the server has dropped before handing them out
+            conn = pool._get_conn(timeout=WARM_TIMEOUT)
+            connections.append(conn)
+            if getattr(conn, 'sock', None) is None:
+                conn.timeout = WARM_TIMEOUT
+                conn.connect()
+                opened += 1
+    finally:
+        for conn in connections:
+            pool._put_conn(conn)
+    return opened
+
+
+class ConnectionManager:
+    """
+    Owns a provider's HTTP session and keeps its connections warm in the background.
+
+    `warm(url)` opens connections to a new target without blocking the caller. A
+    daemon thread then re-checks the pool every `keepalive_interval` seconds and
+    reopens connections the server has closed. If `keepalive_method` is set (e.g.,
+    "HEAD"), it also sends that request so the server's idle timer is reset; any HTTP
+    status counts as alive.
+    """
+
+    def __init__(self, name, pool_size=DEFAULT_POOL_SIZE,
+                 warm_connections=DEFAULT_WARM_CONNECTIONS,
+                 keepalive_interval=DEFAULT_KEEPALIVE_INTERVAL, keepalive_method=None):
+        self.name = name
+        self.pool_size = pool_size
+        self.session = create_session(pool_size)
+        self.warm_connections = warm_connections
+        self.keepalive_interval = keepalive_interval
+        self.keepalive_method = keepalive_method
+        self._target_url = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._offline = False
+        self._thread = None
+
+    def mount(self, adapter):
+        """
+        Sends the session's requests through `adapter` (e.g., a replay adapter) from
+        now on. Connections are no longer warmed, as nothing is pooled any more.
+        """
+        with self._lock:
+            self._offline = True
+        mount_adapter(self.session, adapter)
+
+    def warm(self, url):
+        """
+        Makes `url` the target to keep warm and warms it in the background.
+        Returns immediately; a no-op if `url` is already the target.
+        """
+        if not url:
+            return
+        with self._lock:
+            if self._closed or self._offline or url == self._target_url:
+                return
+            self._target_url = url
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f'keepalive-{self.name}', daemon=True
+                )
+                self._thread.start()
+        self._wake.set()
+
+    def _check(self, url):
+        try:
+            opened = warm_session(self.session, url, self.warm_connections)
+            if opened:
+                print(f'  [Connection Pool] {self.name}: opened {opened} connection(s) to {url}')
+            if self.keepalive_method:
+                self.session.request(self.keepalive_method, url, timeout=WARM_TIMEOUT)
+        except Exception as e:
+            # Warm-up is best effort; a real search will surface the actual error
+            print(f'  [Connection Pool] {self.name}: warm-up of {url} failed: {e}')
+
+    def _run(self):
+        while True:
+            # Clear before checking so a warm() issued meanwhile triggers another pass
+            self._wake.clear()
+            with self._lock:
+                if self._closed or self._offline:
+                    return
+                url = self._target_url
+            self._check(url)
+            self._wake.wait(self.keepalive_interval)
+
+    def close(self):
+        """
+        Stops the keep-alive thread and closes all pooled connections.
+        """
+        with self._lock:
+            self._closed = True
+        self._wake.set()
+        self.session.close()
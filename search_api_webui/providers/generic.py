@@ -18,10 +18,107 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import asyncio
+import functools
 import time
-import requests
+from string import Formatter
+
 import jmespath
-from .base import BaseProvider
+from search_api_webui.jsonutil import loads
+from .base import BaseProvider, classify_error, error_result
+from .connection import (
+    ConnectionManager, DEFAULT_KEEPALIVE_INTERVAL, DEFAULT_POOL_SIZE, DEFAULT_WARM_CONNECTIONS,
+    SESSION_RESPONSE_HOOKS
+)
+from .limits import parse_retry_after
+from .resilience import ResiliencePolicy
+from .timing import AsyncRequestTrace, RequestTimer
+
+
+@functools.lru_cache(maxsize=None)
+def _import_httpx():
+    """
+    Imports httpx on first use, as only native async searches need it.
+
+    Returns:
+        module: The httpx module, or None if it is not installed (see the 'async' extra).
+    """
+    try:
+        import httpx
+    except ImportError:
+        return None
+    return httpx
+
+
+_FORMATTER = Formatter()
+
+
+def _constant(value):
+    return lambda context: value
+
+
+def _compile_string(template):
+    """
+    Compiles a str.format-style template into a render(context) callable.
+    Strings without placeholders are rendered once, up front.
+    """
+    try:
+        has_fields = any(field is not None for _, field, _, _ in _FORMATTER.parse(template))
+        if not has_fields:
+            # Still run format() so escaped braces ('{{') render the same as before
+            return _constant(template.format())
+    except ValueError:
+        # Malformed template (e.g., a lone '{'): send it verbatim
+        return _constant(template)
+
+    def render(context):
+        try:
+            return template.format_map(context)
+        except KeyError:
+            # Return original string if a placeholder key is missing in context
+            return template
+
+    return render
+
+
+def compile_path(path):
+    """
+    Compiles a JMESPath expression into a search(data) callable.
+    Plain field lookups (e.g., "title"), the most common mapping, bypass the
+    JMESPath interpreter and read the key directly.
+
+    Args:
+        path (str): The JMESPath expression.
+
+    Returns:
+        callable: search(data) returning the matched value or None.
+    """
+    expr = jmespath.compile(path)
+    if expr.parsed.get('type') == 'field':
+        key = expr.parsed['value']
+        return lambda data: data.get(key) if isinstance(data, dict) else None
+    return expr.search
+
+
+def compile_template(template_obj):
+    """
+    Compiles a template structure (dicts of strings, possibly nested) once, so each
+    request only substitutes values instead of re-walking and re-parsing it.
+
+    Args:
+        template_obj (dict | str): The structure containing placeholders like {query}.
+
+    Returns:
+        callable: render(context) returning the structure with placeholders replaced.
+        `context` must already map None values to ''.
+    """
+    if isinstance(template_obj, str):
+        return _compile_string(template_obj)
+    if isinstance(template_obj, dict):
+        items = [(k, compile_template(v)) for k, v in template_obj.items()]
+        return lambda context: {k: render(context) for k, render in items}
+    return _constant(template_obj)
+
 
 class GenericProvider(BaseProvider):
     """
@@ -37,69 +134,110 @@ class GenericProvider(BaseProvider):
             config (dict): Configuration containing url, headers, params, and mapping rules.
         """
         self.config = config
-        self.session = requests.Session()  # Persistent connection session
-        self._connection_ready = False     # Connection ready status
-        self._last_url = None              # Last used URL tracker
+        # Persistent, pre-warmed connection pool shared by all threads
+        self._connections = ConnectionManager(
+            config.get('name', 'generic'),
+            pool_size=config.get('pool_size', DEFAULT_POOL_SIZE),
+            warm_connections=config.get('warm_connections', DEFAULT_WARM_CONNECTIONS),
+            keepalive_interval=config.get('keepalive_interval', DEFAULT_KEEPALIVE_INTERVAL),
+            keepalive_method=config.get('keepalive_method')
+        )
+        self.session = self._connections.session
+        # Rate limits, hedging, retries and timeouts; only GET requests are retried
+        self._resilience = ResiliencePolicy(
+            config.get('name', 'generic'), config.get('resilience'),
+            idempotent=config.get('method', 'GET').upper() == 'GET',
+            limits=config.get('limits')
+        )
+        self._async_client = None          # httpx.AsyncClient bound to self._async_loop
+        self._async_loop = None
+        self._adapter_mounted = False
+
+        # Templates and JMESPath expressions are compiled once, not per request
+        self._headers_template = compile_template(config.get('headers', {}))
+        self._params_template = compile_template(config.get('params', {}))
+        self._payload_template = compile_template(config.get('payload', {}))
 
-    def _fill_template(self, template_obj, **kwargs):
+        mapping = config.get('response_mapping', {})
+        self._root_path = compile_path(mapping.get('root_path', '@'))
+        self._field_paths = [
+            (std_key, compile_path(source_path))
+            for std_key, source_path in mapping.get('fields', {}).items()
+        ]
+
+    def build_request(self, context):
         """
-        Recursively replaces placeholders (e.g., {query}) in dictionaries or strings 
-        with values provided in kwargs.
-        
+        Renders the configured headers, params and payload for one request.
+
         Args:
-            template_obj (dict | str): The structure containing placeholders.
-            **kwargs: Key-value pairs to inject into the template.
-            
+            context (dict): Values for the template placeholders.
+
         Returns:
-            The structure with placeholders replaced by actual values.
+            tuple: (headers, params, json_body) dictionaries.
         """
-        if isinstance(template_obj, str):
-            # Treat None values as empty strings to prevent "None" appearing in URLs
-            safe_kwargs = {k: (v if v is not None else '') for k, v in kwargs.items()}
-            try:
-                return template_obj.format(**safe_kwargs)
-            except KeyError:
-                # Return original string if a placeholder key is missing in kwargs
-                return template_obj
-        elif isinstance(template_obj, dict):
-            return {k: self._fill_template(v, **kwargs) for k, v in template_obj.items()}
-        return template_obj
+        # Treat None values as empty strings to prevent "None" appearing in URLs
+        safe_context = {k: (v if v is not None else '') for k, v in context.items()}
+        return (
+            self._headers_template(safe_context),
+            self._params_template(safe_context),
+            self._payload_template(safe_context)
+        )
 
-    def _ensure_connection(self, url, headers):
+    def normalize(self, raw_data):
         """
-        Pre-warm HTTPS connection and verify availability.
-        Uses lightweight HEAD request to verify connection without fetching response body.
+        Maps a decoded upstream response to the standard result format
+        using the precompiled response_mapping expressions.
 
         Args:
-            url (str): Target URL
-            headers (dict): Request headers
+            raw_data: The decoded JSON response body.
 
         Returns:
-            bool: Whether connection is ready
+            list[dict]: Normalized results keyed by the mapping's field names.
         """
-        # Re-warm if URL changed or connection not ready
-        if url != self._last_url or not self._connection_ready:
-            try:
-                # Verify connection using HEAD request (no response body)
-                self.session.head(url, headers=headers, timeout=5)
-                self._connection_ready = True
-                self._last_url = url
-                print(f'  [Connection Pool] Connected to: {url}')
-            except Exception as e:
-                self._connection_ready = False
-                print(f'  [Connection Pool] Connection warm-up failed: {e}')
-                raise
+        # Use JMESPath to find the list of results
+        root_list = self._root_path(raw_data) or []
+        field_paths = self._field_paths
 
-    def search(self, query, api_key, **kwargs):
+        normalized_results = []
+        for item in root_list:
+            entry = {}
+            # Map specific fields (title, url, etc.) based on config
+            for std_key, search_path in field_paths:
+                val = search_path(item)
+                entry[std_key] = val if val else ""
+            normalized_results.append(entry)
+        return normalized_results
+
+    def mount_adapter(self, adapter):
+        self._adapter_mounted = True
+        self._connections.mount(adapter)
+
+    def max_search_time(self):
+        return self._resilience.max_duration()
+
+    def prewarm(self, api_key=None, api_url=None):
+        """
+        Warms connections to the configured (or custom) endpoint in the background.
+        """
+        custom_url = (api_url or '').strip()
+        self._connections.warm(custom_url if custom_url else self.config.get('url'))
+
+    def _prepare_request(self, query, api_key, kwargs):
+        """
+        Resolves the target URL and renders the request components for a search.
+
+        Returns:
+            tuple: (url, method, headers, params, json_body)
+        """
         # 1. Extract parameters with defaults
         limit = kwargs.get('limit', '10')
         language = kwargs.get('language', 'en-US')
-        custom_url = kwargs.get('api_url', '').strip()
+        custom_url = (kwargs.get('api_url') or '').strip()
 
         # 2. Determine configuration
         url = custom_url if custom_url else self.config.get('url')
         method = self.config.get('method', 'GET')
-        
+
         # 3. Prepare context for template injection
         context = {
             'query': query,
@@ -109,78 +247,208 @@ class GenericProvider(BaseProvider):
         }
 
         # 4. construct request components
-        headers = self._fill_template(self.config.get('headers', {}), **context)
-        params = self._fill_template(self.config.get('params', {}), **context)
-        json_body = self._fill_template(self.config.get('payload', {}), **context)
+        headers, params, json_body = self.build_request(context)
 
         # Logging (Masking sensitive API keys)
         print(f'[{self.config.get("name", "Unknown")}] Search:')
         print(f'  URL: {url} | Method: {method}')
-        
-        # Ensure connection is pre-warmed (use HEAD request to verify availability)
-        # Pre-warming is not counted in request latency, only verifies connection
-        try:
-            self._ensure_connection(url, headers)
-        except Exception as e:
-            print(f"Connection Warm-up Error: {e}")
+
+        return url, method, headers, params, json_body
+
+    @staticmethod
+    def _error_result(e):
+        """
+        Builds the error result for a failed request.
+        Works with both `requests` and `httpx` exceptions.
+        """
+        print(f"Request Error: {e}")
+        response = getattr(e, 'response', None)
+        if response is None:
+            return error_result(str(e), classify_error(e))
+        return error_result(
+            str(e), classify_error(e), response.status_code,
+            parse_retry_after(response.headers.get('Retry-After'))
+        )
+
+    def _build_result(self, response, start_time, end_time, phases, raw=False):
+        """
+        Parses and normalizes a successful upstream response.
+        Works with both `requests` and `httpx` response objects.
+
+        Args:
+            response: The response, with its body already downloaded.
+            start_time (float): perf_counter() when the request started.
+            end_time (float): perf_counter() when the body was fully received.
+            phases (dict): Network phase timings of the request.
+            raw (bool): Return the body as received in 'raw_body' instead of
+                decoding and normalizing it.
+        """
+        content = response.content
+        metrics = {
+            "latency_ms": round((end_time - start_time) * 1000, 2),
+            "size_bytes": len(content)
+        }
+        metrics.update(phases)
+        if raw:
             return {
-                "error": f"Connection failed: {str(e)}",
                 "results": [],
-                "metrics": {"latency_ms": 0, "size_bytes": 0}
+                "metrics": metrics,
+                "raw_body": content,
+                "raw_content_type": response.headers.get('Content-Type')
             }
 
-        start_time = time.time()
+        decode_start = time.perf_counter()
+        try:
+            # Decode the bytes directly: response.json() would first build a str
+            raw_data = loads(content)
+        except Exception as e:
+            print(f"JSON Parse Error: {e}")
+            return error_result(f"Invalid JSON response: {e}", 'parse')
+
+        normalize_start = time.perf_counter()
+        normalized_results = self.normalize(raw_data)
+        normalize_end = time.perf_counter()
+
+        metrics["decode_ms"] = round((normalize_start - decode_start) * 1000, 2)
+        metrics["normalize_ms"] = round((normalize_end - normalize_start) * 1000, 2)
+
+        return {
+            "results": normalized_results,
+            "metrics": metrics
+        }
+
+    def search(self, query, api_key, **kwargs):
+        url, method, headers, params, json_body = self._prepare_request(query, api_key, kwargs)
+
+        # Keep this endpoint's connections warm for the following searches
+        self._connections.warm(url)
+
+        raw = bool(kwargs.get('raw'))
+        return self._resilience.call(
+            lambda timeout: self._send(url, method, headers, params, json_body, timeout, raw)
+        )
+
+    def _send(self, url, method, headers, params, json_body, timeout, raw=False):
+        """
+        Sends one request and builds its result; a single attempt of `search()`.
+        """
+        start_time = time.perf_counter()
 
         try:
-            req_args = {'headers': headers, 'timeout': 30}
+            req_args = {'headers': headers, 'timeout': timeout}
             if params:
                 req_args['params'] = params
             if json_body:
                 req_args['json'] = json_body
 
             # Use Session to send request (connection is reused)
-            if method.upper() == 'GET':
-                response = self.session.get(url, **req_args)
-            else:
-                response = self.session.post(url, **req_args)
+            with RequestTimer() as timer:
+                if method.upper() == 'GET':
+                    response = self.session.get(url, **req_args)
+                else:
+                    response = self.session.post(url, **req_args)
 
             response.raise_for_status()
         except Exception as e:
-            print(f"Request Error: {e}")
-            return {
-                "error": str(e),
-                "results": [],
-                "metrics": {"latency_ms": 0, "size_bytes": 0}
-            }
+            return self._error_result(e)
 
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         # 5. Parse and Normalize Response
+        return self._build_result(response, start_time, end_time, timer.phases(), raw)
+
+    def _get_async_client(self):
+        """
+        Returns the httpx.AsyncClient for the running event loop, creating it on first use.
+        An async client's connection pool is bound to the loop it was created in, and
+        is capped at the provider's pool_size connections like the sync session's.
+        """
+        httpx = _import_httpx()
+        loop = asyncio.get_running_loop()
+        if self._async_client is not None and self._async_loop is not loop:
+            self._discard_async_client()
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self._connections.pool_size,
+                                    max_keepalive_connections=self._connections.pool_size)
+            )
+            self._async_loop = loop
+        return self._async_client
+
+    async def asearch(self, query, api_key, **kwargs):
+        """
+        Native async search over httpx; falls back to the thread-offloaded
+        `search()` when httpx is not installed, and while the session's adapters or
+        hooks are customized (httpx would bypass them).
+        """
+        if _import_httpx() is None or self._adapter_mounted or SESSION_RESPONSE_HOOKS:
+            return await super().asearch(query, api_key, **kwargs)
+
+        url, method, headers, params, json_body = self._prepare_request(query, api_key, kwargs)
+        # Unlike search(), no warm(url): the keep-alive thread warms the requests session,
+        # while the async client's connections belong to the event loop and stay open
+        # between the searches that use them
+        client = self._get_async_client()
+        raw = bool(kwargs.get('raw'))
+
+        return await self._resilience.acall(
+            lambda timeout: self._asend(
+                client, url, method, headers, params, json_body, timeout, raw
+            )
+        )
+
+    async def _asend(self, client, url, method, headers, params, json_body, timeout,
+                     raw=False):
+        """
+        Asynchronous variant of `_send()`.
+        """
+        start_time = time.perf_counter()
+        trace = AsyncRequestTrace()
+
         try:
-            raw_data = response.json()
+            req_args = {'headers': headers, 'timeout': timeout, 'extensions': {'trace': trace}}
+            if params:
+                req_args['params'] = params
+            if json_body:
+                req_args['json'] = json_body
+
+            request = client.build_request(
+                'GET' if method.upper() == 'GET' else 'POST', url, **req_args
+            )
+            response = await client.send(request, stream=True)
+            try:
+                await trace.read_body(response)
+            finally:
+                await response.aclose()
+
+            response.raise_for_status()
         except Exception as e:
-            print(f"JSON Parse Error: {e}")
-            raw_data = {}
+            return self._error_result(e)
 
-        mapping = self.config.get('response_mapping', {})
-        # Use JMESPath to find the list of results
-        root_list = jmespath.search(mapping.get('root_path', '@'), raw_data) or []
+        end_time = time.perf_counter()
 
-        normalized_results = []
-        field_map = mapping.get('fields', {})
+        return self._build_result(response, start_time, end_time, trace.phases(), raw)
 
-        for item in root_list:
-            entry = {}
-            # Map specific fields (title, url, etc.) based on config
-            for std_key, source_path in field_map.items():
-                val = jmespath.search(source_path, item)
-                entry[std_key] = val if val else ""
-            normalized_results.append(entry)
+    def _discard_async_client(self):
+        """
+        Closes the async client on the loop it belongs to, if that loop still runs.
+        A closed loop's connections are unusable anyway and are freed with the client.
+        """
+        client, loop = self._async_client, self._async_loop
+        self._async_client = None
+        self._async_loop = None
+        if client is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
 
-        return {
-            "results": normalized_results,
-            "metrics": {
-                "latency_ms": round((end_time - start_time) * 1000, 2),
-                "size_bytes": len(response.content)
-            }
-        }
+    def close(self):
+        self._connections.close()
+        self._discard_async_client()
+
+    async def aclose(self):
+        if self._async_client is None or self._async_loop is not asyncio.get_running_loop():
+            self._discard_async_client()
+            return
+        client = self._async_client
+        self._async_client = None
+        self._async_loop = None
+        await client.aclose()
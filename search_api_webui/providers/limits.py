@@ -0,0 +1,310 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Per-provider rate and concurrency limits for upstream requests.
+
+Configured per provider with a `limits` block in providers.yaml:
+
+    limits:
+      rate: 5                # Requests per second, refilled continuously (token bucket)
+      burst: 10              # Requests that may be sent at once after an idle period
+      max_in_flight: 4       # Upstream requests in progress at the same time
+      max_queue_wait: 10     # Seconds a request may wait for its turn before failing
+
+Waiting requests are served strictly first come, first served, so a burst from one
+user or benchmark cannot starve the others. When the upstream answers 429 (or 503
+with Retry-After), the provider sends nothing more until the Retry-After delay has
+passed, or DEFAULT_RETRY_AFTER seconds without the header.
+
+A caller that wants to tell the wait apart from the request itself sets
+`queue_listener` to a callable; it is called with True when a request starts
+waiting for its turn and with False once the request is admitted.
+"""
+
+import contextvars
+import email.utils
+import threading
+import time
+from collections import deque
+
+DEFAULT_MAX_QUEUE_WAIT = 30    # Seconds
+DEFAULT_RETRY_AFTER = 1.0      # Seconds to pause after a 429 without Retry-After
+MAX_RETRY_AFTER = 300          # Longer Retry-After values are capped to this
+
+queue_listener = contextvars.ContextVar('queue_listener', default=None)
+
+
+def _notify_queued(queued):
+    listener = queue_listener.get()
+    if listener is not None:
+        listener(queued)
+
+
+class QueueTimeout(Exception):
+    """
+    Raised when a request could not be sent within the provider's max_queue_wait.
+    """
+
+
+def parse_retry_after(value):
+    """
+    Parses a Retry-After header given as seconds or as an HTTP date.
+
+    Returns:
+        float: Seconds to wait (capped to MAX_RETRY_AFTER), or None if absent or invalid.
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
+
+
+class _Waiter:
+    """
+    A queued request; woken from any thread, whether it waits in a thread or a coroutine.
+    """
+
+    def __init__(self, loop=None):
+        self.loop = loop
+        self.event = None if loop else threading.Event()
+        self.future = loop.create_future() if loop else None
+
+    def reset(self):
+        if self.loop is None:
+            self.event.clear()
+        elif self.future.done():
+            self.future = self.loop.create_future()
+
+    def wake(self):
+        if self.loop is None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._set_future)
+
+    def _set_future(self):
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class ProviderLimiter:
+    """
+    FIFO queue in front of a token bucket and a concurrency limit.
+
+    Usage:
+        waited = limiter.acquire()
+        result = None
+        try:
+            result = send_request()
+        finally:
+            limiter.release(result)
+    """
+
+    def __init__(self, name, config):
+        """
+        Args:
+            name (str): Provider name, for logging.
+            config (dict): The provider's `limits` block.
+
+        Raises:
+            ValueError: If the configuration holds invalid values.
+        """
+        self.name = name
+        try:
+            self.rate = float(config.get('rate') or 0)
+            self.burst = float(config.get('burst') or max(1.0, self.rate))
+            self.max_in_flight = int(config.get('max_in_flight') or 0)
+            self.max_queue_wait = float(config.get('max_queue_wait', DEFAULT_MAX_QUEUE_WAIT))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"invalid limits setting: {e}")
+        if self.rate < 0 or self.burst < 1 or self.max_in_flight < 0 or self.max_queue_wait < 0:
+            raise ValueError("limits rate, burst, max_in_flight or max_queue_wait out of range")
+
+        self._lock = threading.Lock()
+        self._waiters = deque()
+        self._in_flight = 0
+        self._tokens = self.burst
+        self._refilled_at = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now):
+        if self.rate:
+            self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate)
+        self._refilled_at = now
+
+    def _poll(self, waiter):
+        """
+        Grants the waiter its turn if possible. Must hold the lock.
+
+        Returns:
+            tuple: (granted, seconds until a retry may succeed, or None to wait for a wake-up)
+        """
+        if self._waiters[0] is not waiter:
+            return False, None
+        if self.max_in_flight and self._in_flight >= self.max_in_flight:
+            return False, None
+
+        now = time.monotonic()
+        self._refill(now)
+        wait = self._paused_until - now
+        if self.rate and self._tokens < 1:
+            wait = max(wait, (1 - self._tokens) / self.rate)
+        if wait > 0:
+            return False, wait
+
+        if self.rate:
+            self._tokens -= 1
+        self._in_flight += 1
+        self._waiters.popleft()
+        if self._waiters:
+            self._waiters[0].wake()
+        return True, 0.0
+
+    def _abandon(self, waiter):
+        with self._lock:
+            if waiter in self._waiters:
+                was_first = self._waiters[0] is waiter
+                self._waiters.remove(waiter)
+                if was_first and self._waiters:
+                    self._waiters[0].wake()
+
+    def _remaining(self, deadline, wait):
+        """
+        Returns:
+            float: Seconds to sleep before polling again.
+
+        Raises:
+            QueueTimeout: If the turn cannot come before the deadline.
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or (wait is not None and wait > remaining):
+            raise QueueTimeout(
+                f"{self.name}: no upstream capacity within {self.max_queue_wait:g} s"
+            )
+        return remaining if wait is None else wait
+
+    def acquire(self):
+        """
+        Blocks until this request may be sent.
+
+        Returns:
+            float: Seconds spent waiting.
+
+        Raises:
+            QueueTimeout: If waiting would exceed max_queue_wait.
+        """
+        start = time.monotonic()
+        deadline = start + self.max_queue_wait
+        waiter = _Waiter()
+        with self._lock:
+            self._waiters.append(waiter)
+        queued = False
+        try:
+            while True:
+                with self._lock:
+                    waiter.reset()
+                    granted, wait = self._poll(waiter)
+                if granted:
+                    if queued:
+                        _notify_queued(False)
+                    return time.monotonic() - start
+                timeout = self._remaining(deadline, wait)
+                if not queued:
+                    queued = True
+                    _notify_queued(True)
+                waiter.event.wait(timeout)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    def try_acquire(self):
+        """
+        Takes a turn only if one is free right now and nobody is queued.
+
+        Returns:
+            bool: Whether the request may be sent; if so, release() must follow.
+        """
+        waiter = _Waiter()
+        with self._lock:
+            if self._waiters:
+                return False
+            self._waiters.append(waiter)
+            granted, _ = self._poll(waiter)
+            if not granted:
+                self._waiters.popleft()
+        return granted
+
+    async def aacquire(self):
+        """
+        Asynchronous variant of `acquire()`.
+        """
+        import asyncio
+
+        start = time.monotonic()
+        deadline = start + self.max_queue_wait
+        waiter = _Waiter(asyncio.get_running_loop())
+        with self._lock:
+            self._waiters.append(waiter)
+        queued = False
+        try:
+            while True:
+                with self._lock:
+                    waiter.reset()
+                    granted, wait = self._poll(waiter)
+                if granted:
+                    if queued:
+                        _notify_queued(False)
+                    return time.monotonic() - start
+                timeout = self._remaining(deadline, wait)
+                if not queued:
+                    queued = True
+                    _notify_queued(True)
+                await asyncio.wait({waiter.future}, timeout=timeout)
+        except BaseException:
+            self._abandon(waiter)
+            raise
+
+    def release(self, result):
+        """
+        Frees the request's slot; pauses the provider if it was rate limited upstream.
+
+        Args:
+            result (dict): The provider's result, or None if the request raised.
+        """
+        retry_after = None
+        if result is not None and result.get('status_code') in (429, 503):
+            retry_after = result.get('retry_after_s')
+            if retry_after is None and result['status_code'] == 429:
+                retry_after = DEFAULT_RETRY_AFTER
+
+        with self._lock:
+            self._in_flight -= 1
+            if retry_after:
+                self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+            if self._waiters:
+                self._waiters[0].wake()
+        if retry_after:
+            print(f'  [Limits] {self.name}: rate limited upstream, pausing {retry_after:g} s')
@@ -18,12 +18,98 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
+import copy
 import time
-import json
+import threading
+
+from urllib3.util.retry import Retry
 from querit import QueritClient
 from querit.models.request import SearchRequest
 from querit.errors import QueritError
-from .base import BaseProvider
+from .base import BaseProvider, classify_error, error_result
+from .connection import create_session, mount_adapter, warm_session
+from .limits import parse_retry_after
+from .resilience import ResiliencePolicy
+from .timing import RequestTimer
+
+DEFAULT_IDLE_TIMEOUT = 300  # Seconds an unused client is kept before its connections are closed
+
+
+def _create_session(pool_size=10):
+    """
+    Creates an HTTP session mirroring the SDK's default: pooled connections and a single
+    retry on network-level failures only.
+    """
+    retry = Retry(
+        total=1,
+        connect=1,
+        read=1,
+        status=0,
+        allowed_methods={"POST"},
+        backoff_factor=0.05,
+        raise_on_status=False,
+    )
+    return create_session(pool_size, max_retries=retry)
+
+
+class QueritClientPool:
+    """
+    Thread-safe pool of QueritClient instances keyed by API key.
+    Each client owns a session, so its connections stay warm between searches.
+    Clients unused for longer than `idle_timeout` are evicted and their sessions closed.
+    """
+
+    def __init__(self, timeout=30, idle_timeout=DEFAULT_IDLE_TIMEOUT):
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+        self.adapter = None  # Transport adapter mounted on new sessions, if any
+        self._clients = {}  # api_key -> [client, last_used]
+        self._lock = threading.Lock()
+
+    def _evict_idle(self, now):
+        expired = [
+            key for key, (_, last_used) in self._clients.items()
+            if now - last_used > self.idle_timeout
+        ]
+        for key in expired:
+            client, _ = self._clients.pop(key)
+            client.session.close()
+
+    def acquire(self, api_key):
+        """
+        Returns the pooled client for an API key, creating it on first use.
+
+        Returns:
+            tuple: (client, reused) where `reused` is False if the client was just created.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._evict_idle(now)
+            entry = self._clients.get(api_key)
+            if entry is not None:
+                entry[1] = now
+                return entry[0], True
+
+            session = _create_session()
+            if self.adapter is not None:
+                mount_adapter(session, self.adapter)
+            client = QueritClient(
+                api_key=api_key,
+                timeout=self.timeout,
+                session=session
+            )
+            self._clients[api_key] = [client, now]
+            return client, False
+
+    def close(self):
+        """
+        Closes every pooled client's connections.
+        """
+        with self._lock:
+            for client, _ in self._clients.values():
+                client.session.close()
+            self._clients.clear()
+
 
 class QueritSdkProvider(BaseProvider):
     """
@@ -32,20 +118,67 @@ class QueritSdkProvider(BaseProvider):
 
     def __init__(self, config):
         self.config = config
+        self._clients = QueritClientPool(
+            idle_timeout=config.get('client_idle_timeout', DEFAULT_IDLE_TIMEOUT)
+        )
+        # Searches are POST requests, so they are hedged but never retried
+        self._resilience = ResiliencePolicy(
+            config.get('name', 'querit'), config.get('resilience'), idempotent=False,
+            limits=config.get('limits')
+        )
+
+    def mount_adapter(self, adapter):
+        # Clients created from now on use the adapter; existing ones are dropped
+        self._clients.close()
+        self._clients.adapter = adapter
+
+    def prewarm(self, api_key=None, api_url=None):
+        """
+        Opens a connection for the API key's pooled client in the background.
+        """
+        if not api_key or self._clients.adapter is not None:
+            return
+        client, _ = self._clients.acquire(api_key.strip())
+
+        def warm():
+            try:
+                warm_session(client.session, client.url)
+            except Exception as e:
+                print(f'  [Connection Pool] Querit warm-up failed: {e}')
+
+        threading.Thread(target=warm, name='warm-querit', daemon=True).start()
+
+    def close(self):
+        self._clients.close()
+
+    def max_search_time(self):
+        return self._resilience.max_duration()
 
     def search(self, query, api_key, **kwargs):
         """
         Executes a search using the Querit SDK.
         Handles the 'Bearer' prefix logic internally within the SDK.
         """
+        return self._resilience.call(
+            lambda timeout: self._search_once(query, api_key, kwargs, timeout)
+        )
+
+    def _search_once(self, query, api_key, kwargs, timeout):
+        """
+        A single attempt of `search()` with the given timeout in seconds.
+        """
+        timer = RequestTimer()
         try:
-            # Initialize client with the raw API key
-            client = QueritClient(
-                api_key=api_key.strip(),
-                timeout=30
-            )
+            # Reuse the pooled client (and its warm connections) for this API key
+            setup_start = time.perf_counter()
+            client, client_reused = self._clients.acquire(api_key.strip())
+            if client.timeout != timeout:
+                # A shallow copy shares the pooled session but not the timeout
+                client = copy.copy(client)
+                client.timeout = timeout
+            setup_ms = round((time.perf_counter() - setup_start) * 1000, 2)
 
-            limit = int(kwargs.get('limit', 10))
+            limit = int(kwargs.get('limit') or 10)
 
             request_model = SearchRequest(
                 query=query,
@@ -54,12 +187,14 @@ class QueritSdkProvider(BaseProvider):
 
             print(f'[Querit SDK] Searching: {query} (Limit: {limit})')
 
-            start_time = time.time()
-            
+            start_time = time.perf_counter()
+
             # Execute search via SDK
-            response = client.search(request_model)
-            
-            end_time = time.time()
+            with timer:
+                response = client.search(request_model)
+
+            end_time = time.perf_counter()
+            latency_ms = round((end_time - start_time) * 1000, 2)
 
             # Normalize results to standard format
             normalized_results = []
@@ -72,29 +207,44 @@ class QueritSdkProvider(BaseProvider):
                         # Fallback to description if snippet is missing
                         "snippet": getattr(item, 'snippet', '') or getattr(item, 'description', '')
                     })
+            normalize_ms = round((time.perf_counter() - end_time) * 1000, 2)
 
-            # Calculate estimated size for metrics (approximate JSON size)
-            estimated_size = len(json.dumps([r for r in normalized_results]))
+            metrics = {
+                "latency_ms": latency_ms,
+                # Real body size as received, measured by the session's response hook
+                "size_bytes": timer.body_bytes,
+                # Split of client/connection setup versus the request itself
+                "client_setup_ms": setup_ms,
+                "client_reused": client_reused,
+                "request_ms": round(latency_ms - timer.connect_ms, 2)
+            }
+            metrics.update(timer.phases())
+            # The SDK decodes JSON internally: time from body received to search() returning
+            if timer.headers_at is not None:
+                body_done = timer.headers_at + timer.download_s
+                metrics["decode_ms"] = round(max(end_time - body_done, 0.0) * 1000, 2)
+            metrics["normalize_ms"] = normalize_ms
 
-            return {
+            result = {
                 "results": normalized_results,
-                "metrics": {
-                    "latency_ms": round((end_time - start_time) * 1000, 2),
-                    "size_bytes": estimated_size
-                }
+                "metrics": metrics
             }
+            if kwargs.get('raw') and timer.body is not None:
+                # The SDK parses the body itself; hand back the bytes the session received
+                result["raw_body"] = timer.body
+                result["raw_content_type"] = timer.content_type
+            return result
 
         except QueritError as e:
             print(f"Querit SDK Error: {e}")
-            return {
-                "error": f"Querit SDK Error: {str(e)}",
-                "results": [],
-                "metrics": {"latency_ms": 0, "size_bytes": 0}
-            }
+            # The SDK turns timeouts and broken transfers into a ServerError raised while
+            # handling the original requests exception
+            cause = e.__context__
+            error_type = classify_error(cause) if cause is not None else 'http'
+            status_code = timer.status_code if error_type == 'http' else None
+            retry_after = parse_retry_after(timer.retry_after) if status_code else None
+            return error_result(f"Querit SDK Error: {str(e)}", error_type, status_code,
+                                retry_after)
         except Exception as e:
             print(f"Unexpected Error: {e}")
-            return {
-                "error": f"Error: {str(e)}",
-                "results": [],
-                "metrics": {"latency_ms": 0, "size_bytes": 0}
-            }
+            return error_result(f"Error: {str(e)}", classify_error(e))
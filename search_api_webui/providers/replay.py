@@ -0,0 +1,356 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Recording of upstream responses and their offline replay.
+
+`record_responses(path)` makes every provider session created afterwards append each
+upstream exchange (status, headers, body and timings) to a gzip-compressed JSON Lines
+file. Request headers are not stored and credentials in query strings and JSON bodies
+are masked, so recordings hold no API keys.
+
+A provider of type `replay` answers searches from such a file instead of the network:
+
+    you_offline:
+      type: replay
+      replays: you          # The recorded provider; its request and mapping settings are reused
+      recordings: ~/.search-api-webui/recordings.jsonl.gz
+      latency: recorded     # 'recorded' waits as long as the upstream did; 'none' answers at once
+      match: request        # 'request' serves recordings of the same request; 'any' cycles
+                            # through everything recorded for the endpoint
+
+The replayed provider runs unchanged on top of a transport adapter that serves the
+recordings, so its templating, JSON decoding and response mapping are all exercised.
+"""
+
+import base64
+import gzip
+import io
+import json
+import os
+import threading
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from .base import BaseProvider
+from .connection import SESSION_RESPONSE_HOOKS
+from .timing import _current_timer
+
+DEFAULT_RECORDINGS = os.path.join('~', '.search-api-webui', 'recordings.jsonl.gz')
+REDACTED = 'REDACTED'
+SENSITIVE_NAMES = ('key', 'token', 'secret', 'auth', 'password', 'signature')
+MATCH_MODES = ('request', 'any')
+LATENCY_MODES = ('none', 'recorded')
+REPLAY_API_KEY = 'replay'   # Passed to the replayed provider when no API key is configured
+
+# Stored bodies are already decoded, and connection state does not apply to a replay
+_DROPPED_HEADERS = {
+    'connection', 'content-encoding', 'content-length', 'keep-alive', 'set-cookie',
+    'transfer-encoding'
+}
+
+
+def _is_sensitive(name):
+    name = str(name).lower()
+    return any(part in name for part in SENSITIVE_NAMES)
+
+
+def redact_url(url):
+    """
+    Masks credentials in the query string and sorts its parameters.
+    """
+    parts = urlsplit(url)
+    if not parts.query:
+        return url
+    query = sorted(
+        (name, REDACTED if _is_sensitive(name) else value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    )
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _redact_json(data):
+    if isinstance(data, dict):
+        return {k: (REDACTED if _is_sensitive(k) else _redact_json(v)) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_redact_json(item) for item in data]
+    return data
+
+
+def redact_body(body):
+    """
+    Returns:
+        str: The request body as text with credentials masked at any depth of a JSON
+        document and its keys sorted, or None for requests without a (textual) body.
+    """
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', errors='replace')
+    if not isinstance(body, str) or not body:
+        return None
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    return json.dumps(_redact_json(data), sort_keys=True, separators=(',', ':'))
+
+
+def _request_key(method, url, body):
+    return (method.upper(), redact_url(url), redact_body(body))
+
+
+def _endpoint_key(method, url):
+    parts = urlsplit(url)
+    return (method.upper(), parts.scheme, parts.netloc, parts.path)
+
+
+def _exchange_entry(response):
+    """
+    Builds the stored form of a response whose body has been downloaded.
+    """
+    request = response.request
+    content = response.content
+    try:
+        body, body_encoding = content.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        body, body_encoding = base64.b64encode(content).decode('ascii'), 'base64'
+
+    timer = _current_timer()
+    if timer is not None and timer.headers_at is not None:
+        timings = timer.phases()
+        elapsed_s = timer.headers_at - timer.start + timer.download_s
+    else:
+        # Without a RequestTimer only the time up to the response headers is known
+        timings = {}
+        elapsed_s = response.elapsed.total_seconds()
+    timings['elapsed_ms'] = round(elapsed_s * 1000, 2)
+
+    return {
+        "method": request.method,
+        "url": redact_url(request.url),
+        "request_body": redact_body(request.body),
+        "status": response.status_code,
+        "reason": response.reason,
+        "headers": {k: v for k, v in response.headers.items()
+                    if k.lower() not in _DROPPED_HEADERS},
+        "body": body,
+        "body_encoding": body_encoding,
+        "timings": timings,
+        "recorded_at": round(time.time(), 3)
+    }
+
+
+class ResponseRecorder:
+    """
+    `requests` response hook appending every exchange to a recordings file.
+
+    Each exchange is written as its own gzip member with a single O_APPEND write, so
+    the threads and server worker processes of one run can share a file.
+    """
+
+    def __init__(self, path):
+        self.path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+
+    def __call__(self, response, *args, **kwargs):
+        try:
+            line = json.dumps(_exchange_entry(response), ensure_ascii=False) + '\n'
+            os.write(self._fd, gzip.compress(line.encode('utf-8')))
+        except Exception as e:
+            # Recording is best effort; the search itself goes on
+            print(f'  [Record] Could not record {redact_url(response.url)}: {e}')
+        return response
+
+    def close(self):
+        os.close(self._fd)
+
+
+def record_responses(path=DEFAULT_RECORDINGS):
+    """
+    Records the upstream responses of every provider session created from now on.
+    Call before providers are instantiated (or reset them afterwards).
+
+    Args:
+        path (str): The recordings file; new recordings are appended.
+
+    Returns:
+        ResponseRecorder: The installed hook.
+    """
+    recorder = ResponseRecorder(path)
+    SESSION_RESPONSE_HOOKS.append(recorder)
+    return recorder
+
+
+def read_recordings(path):
+    """
+    Yields the exchanges stored in a recordings file, oldest first.
+    A record cut short by an interrupted write ends the file.
+    """
+    with gzip.open(os.path.expanduser(path), 'rt', encoding='utf-8') as f:
+        try:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        except (EOFError, gzip.BadGzipFile, json.JSONDecodeError) as e:
+            print(f'  [Replay] Ignoring the damaged end of {path}: {e}')
+
+
+class Recordings:
+    """
+    In-memory index of a recordings file. Requests recorded several times are served
+    their recordings in turn, so replays reproduce the recorded latency distribution.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._by_request = {}
+        self._by_endpoint = {}
+        self._turns = {}
+        self._lock = threading.Lock()
+        for entry in read_recordings(path):
+            self._by_request.setdefault(
+                _request_key(entry['method'], entry['url'], entry.get('request_body')), []
+            ).append(entry)
+            self._by_endpoint.setdefault(
+                _endpoint_key(entry['method'], entry['url']), []
+            ).append(entry)
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._by_request.values())
+
+    def find(self, request, match='request'):
+        """
+        Returns:
+            dict: The next recorded exchange for a prepared request, or None.
+        """
+        if match == 'any':
+            key = _endpoint_key(request.method, request.url)
+            entries = self._by_endpoint.get(key)
+        else:
+            key = _request_key(request.method, request.url, request.body)
+            entries = self._by_request.get(key)
+        if not entries:
+            return None
+        with self._lock:
+            turn = self._turns.get((match, key), 0)
+            self._turns[(match, key)] = turn + 1
+        return entries[turn % len(entries)]
+
+
+class ReplayAdapter(HTTPAdapter):
+    """
+    Transport adapter answering requests from recordings instead of the network.
+    Requests without a recording fail with a ConnectionError.
+    """
+
+    def __init__(self, recordings, match='request', latency='none'):
+        super().__init__()
+        self.recordings = recordings
+        self.match = match
+        self.latency = latency
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None,
+             proxies=None):
+        entry = self.recordings.find(request, self.match)
+        if entry is None:
+            raise requests.ConnectionError(
+                f"No recorded response for {request.method} {redact_url(request.url)}",
+                request=request
+            )
+
+        if self.latency == 'recorded':
+            delay = entry.get('timings', {}).get('elapsed_ms', 0) / 1000
+            read_timeout = timeout[1] if isinstance(timeout, tuple) else timeout
+            if read_timeout is not None and delay > read_timeout:
+                time.sleep(read_timeout)
+                raise requests.ReadTimeout(
+                    f"Replayed response took longer than {read_timeout} s", request=request
+                )
+            time.sleep(delay)
+
+        if entry.get('body_encoding') == 'base64':
+            content = base64.b64decode(entry['body'])
+        else:
+            content = entry['body'].encode('utf-8')
+        raw = HTTPResponse(
+            body=io.BytesIO(content), headers=entry.get('headers', {}),
+            status=entry['status'], reason=entry.get('reason'),
+            preload_content=False, decode_content=False, request_url=request.url
+        )
+        return self.build_response(request, raw)
+
+
+class ReplayProvider(BaseProvider):
+    """
+    Serves the recorded responses of another provider (see the module docstring).
+    """
+
+    def __init__(self, config):
+        """
+        Args:
+            config (dict): The replay settings; 'source' holds the replayed provider's
+                configuration (filled in by load_provider_configs from 'replays').
+
+        Raises:
+            ValueError: If the settings are invalid or the recordings file is missing.
+        """
+        from . import DEFAULT_PROVIDER_TYPE, get_provider_class
+
+        self.config = config
+        source = config.get('source')
+        if not isinstance(source, dict):
+            raise ValueError("'replays' must name a provider configured in providers.yaml")
+        if source.get('type') == 'replay':
+            raise ValueError("a replay provider cannot replay another replay provider")
+
+        match = config.get('match', 'request')
+        latency = config.get('latency', 'none')
+        if match not in MATCH_MODES:
+            raise ValueError(f"'match' must be one of {', '.join(MATCH_MODES)}")
+        if latency not in LATENCY_MODES:
+            raise ValueError(f"'latency' must be one of {', '.join(LATENCY_MODES)}")
+
+        path = os.path.expanduser(config.get('recordings', DEFAULT_RECORDINGS))
+        if not os.path.exists(path):
+            raise ValueError(f"recordings file not found: {path}")
+        self.recordings = Recordings(path)
+        print(f'  [Replay] {config.get("name")}: {len(self.recordings)} recorded '
+              f'responses of {config.get("replays")} from {path}')
+
+        provider_class = get_provider_class(source.get('type', DEFAULT_PROVIDER_TYPE))
+        # The upstream's rate limits don't apply offline, unless set on the replay itself
+        self._provider = provider_class(
+            dict(source, name=config.get('name', 'replay'), limits=config.get('limits'))
+        )
+        self._provider.mount_adapter(ReplayAdapter(self.recordings, match, latency))
+
+    def search(self, query, api_key, **kwargs):
+        # Recordings hold no credentials, so any key is accepted
+        return self._provider.search(query, api_key or REPLAY_API_KEY, **kwargs)
+
+    def close(self):
+        self._provider.close()
+
+    def max_search_time(self):
+        return self._provider.max_search_time()
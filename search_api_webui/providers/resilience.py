@@ -0,0 +1,467 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Hedging, retries and adaptive timeouts for upstream searches.
+
+Configured per provider with a `resilience` block in providers.yaml:
+
+    resilience:
+      timeout: 30              # Seconds; the upper bound when adaptive_timeout is on
+      adaptive_timeout: true   # Derive the timeout from recent latencies
+      hedge: true              # Send a duplicate request once the p95 latency has passed
+      hedge_percentile: 95
+      hedge_budget: 0.1        # Hedge at most this share of searches
+      retries: 2               # Extra attempts after timeouts, connection errors and 5xx
+      retry_backoff: 0.1       # Base delay in seconds, doubled per retry, fully jittered
+
+Without the block a provider makes a single attempt with a 30 second timeout.
+Hedging and adaptive timeouts only start once the latency window holds MIN_SAMPLES
+successful searches. Retries are only made for idempotent (GET) providers.
+
+The hedge delay is counted from the moment the first attempt is actually sent. No
+hedge is sent while the shared hedge pool has no free worker, since the process is
+then saturated and a duplicate request would only add load.
+
+Every attempt, retries included, first takes its turn under the provider's `limits`
+(see limits.py); the time spent queued is reported as 'queue_wait_ms' and left out
+of the latencies above. The wait happens in the calling thread, which belongs to
+the provider's own fan-out pool, so a throttled provider never ties up the shared
+hedge pool. A hedge is only sent if the limits allow it without waiting.
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from .base import error_result
+from .limits import ProviderLimiter, QueueTimeout
+
+DEFAULT_TIMEOUT = 30           # Seconds
+WINDOW_SIZE = 200              # Recent successful latencies kept per provider
+MIN_SAMPLES = 20               # Samples needed before percentiles are trusted
+TIMEOUT_MULTIPLIER = 3         # Adaptive timeout = p99 * multiplier ...
+MIN_TIMEOUT = 1.0              # ... but never below this many seconds
+MIN_HEDGE_DELAY = 0.05         # Seconds; don't hedge sooner than this
+HEDGE_WORKERS = 32
+DEFAULT_HEDGE_BUDGET = 0.1     # Hedges per search, on average...
+HEDGE_BUDGET_BURST = 10        # ...saved up for at most this many at once
+
+_hedge_executor = None
+_hedge_executor_lock = threading.Lock()
+# One slot per hedge pool worker: work is only submitted when a worker is free, so
+# attempts never queue in the pool
+_hedge_slots = threading.BoundedSemaphore(HEDGE_WORKERS)
+
+
+def _get_hedge_executor():
+    # Shared by all providers; threads are only started once hedging is enabled somewhere
+    global _hedge_executor
+    with _hedge_executor_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(
+                max_workers=HEDGE_WORKERS, thread_name_prefix='hedge'
+            )
+        return _hedge_executor
+
+
+def _submit_to_free_worker(fn, *args):
+    """
+    Runs `fn(*args)` on the hedge pool if one of its workers is free.
+
+    Returns:
+        Future | None: None if every worker is busy.
+    """
+    if not _hedge_slots.acquire(blocking=False):
+        return None
+    try:
+        future = _get_hedge_executor().submit(fn, *args)
+    except BaseException:
+        _hedge_slots.release()
+        raise
+    future.add_done_callback(lambda _: _hedge_slots.release())
+    return future
+
+
+class HedgeBudget:
+    """
+    Token bucket limiting hedges to a share of searches: every search deposits
+    `ratio` tokens (up to `burst`), and every hedge spends one.
+    """
+
+    def __init__(self, ratio=DEFAULT_HEDGE_BUDGET, burst=HEDGE_BUDGET_BURST):
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.ratio)
+
+    def withdraw(self):
+        """
+        Returns:
+            bool: Whether a hedge may be sent.
+        """
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class LatencyWindow:
+    """
+    Thread-safe rolling window of recent latencies, in seconds.
+    """
+
+    def __init__(self, size=WINDOW_SIZE):
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._samples)
+
+    def add(self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, pct):
+        """
+        Returns:
+            float: The `pct` percentile (nearest rank), or None with fewer than
+            MIN_SAMPLES samples.
+        """
+        with self._lock:
+            if len(self._samples) < MIN_SAMPLES:
+                return None
+            ordered = sorted(self._samples)
+        rank = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+        return ordered[rank]
+
+
+def _is_retryable(result):
+    if not result.get('error'):
+        return False
+    if result.get('error_type') in ('timeout', 'connection'):
+        return True
+    # A 429 is retried once the limiter's Retry-After pause is over
+    status_code = result.get('status_code') or 0
+    return result.get('error_type') == 'http' and (status_code == 429 or status_code >= 500)
+
+
+class ResiliencePolicy:
+    """
+    Runs one provider search as one or more attempts.
+
+    An attempt is a callable taking the timeout in seconds and returning the
+    provider's result dict (errors in-band, see base.error_result). The final result's
+    metrics gain 'attempts', 'hedged' and 'timeout_s', plus 'queue_wait_ms' when the
+    provider has limits.
+    """
+
+    def __init__(self, name, config=None, idempotent=True, limits=None):
+        """
+        Args:
+            name (str): Provider name, for logging.
+            config (dict): The provider's `resilience` block, if any.
+            idempotent (bool): Whether failed requests may be retried (GET providers).
+            limits (dict): The provider's `limits` block, if any.
+
+        Raises:
+            ValueError: If the configuration holds invalid values.
+        """
+        config = config or {}
+        self.name = name
+        try:
+            self.max_timeout = float(config.get('timeout', DEFAULT_TIMEOUT))
+            self.adaptive_timeout = bool(config.get('adaptive_timeout', False))
+            self.hedge = bool(config.get('hedge', False))
+            self.hedge_percentile = float(config.get('hedge_percentile', 95))
+            hedge_budget = float(config.get('hedge_budget', DEFAULT_HEDGE_BUDGET))
+            self.retries = int(config.get('retries', 0)) if idempotent else 0
+            self.retry_backoff = float(config.get('retry_backoff', 0.1))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"invalid resilience setting: {e}")
+        if self.max_timeout <= 0 or self.retries < 0 or not 0 < self.hedge_percentile <= 100:
+            raise ValueError("resilience timeout, retries or hedge_percentile out of range")
+        if not 0 <= hedge_budget <= 1:
+            raise ValueError("resilience hedge_budget must be between 0 and 1")
+        self.hedge_budget = HedgeBudget(hedge_budget)
+        self.latencies = LatencyWindow()
+        self.limiter = ProviderLimiter(name, limits) if limits else None
+
+    def timeout(self):
+        """
+        Returns:
+            float: The timeout for the next attempt, in seconds.
+        """
+        if self.adaptive_timeout:
+            p99 = self.latencies.percentile(99)
+            if p99 is not None:
+                return min(self.max_timeout, max(MIN_TIMEOUT, p99 * TIMEOUT_MULTIPLIER))
+        return self.max_timeout
+
+    def hedge_delay(self):
+        """
+        Returns:
+            float: Seconds to wait before sending a hedge request, or None to not hedge.
+        """
+        if not self.hedge:
+            return None
+        delay = self.latencies.percentile(self.hedge_percentile)
+        return None if delay is None else max(delay, MIN_HEDGE_DELAY)
+
+    def max_duration(self):
+        """
+        Returns:
+            float: Seconds a call can take at most: every attempt waiting its longest
+            under the limits and then timing out, plus the longest backoffs.
+        """
+        queue_wait = self.limiter.max_queue_wait if self.limiter is not None else 0.0
+        backoff = sum(self.retry_backoff * (2 ** retry) for retry in range(self.retries))
+        return (queue_wait + self.max_timeout) * (self.retries + 1) + backoff
+
+    def _backoff(self, retry):
+        return random.uniform(0, self.retry_backoff * (2 ** retry))
+
+    def _finish(self, result, attempts, hedged, timeout, queue_wait_ms):
+        result['metrics'] = dict(result.get('metrics', {}))
+        result['metrics'].update({"attempts": attempts, "hedged": hedged, "timeout_s": timeout})
+        if self.limiter is not None:
+            result['metrics']['queue_wait_ms'] = round(queue_wait_ms, 2)
+        return result
+
+    def _queued(self, result, queue_wait):
+        result['metrics'] = dict(result.get('metrics', {}))
+        result['metrics']['queue_wait_ms'] = round(queue_wait * 1000, 2)
+        return result
+
+    def _throttled(self, e, queue_start):
+        print(f'  [Limits] {e}')
+        return self._queued(error_result(str(e), 'throttled'), time.monotonic() - queue_start)
+
+    def _may_hedge(self):
+        """
+        Returns:
+            bool: Whether the hedge budget and the provider's limits allow a hedge now.
+        """
+        if not self.hedge_budget.withdraw():
+            return False
+        return self.limiter is None or self.limiter.try_acquire()
+
+    def _cancel_hedge(self):
+        if self.limiter is not None:
+            self.limiter.release(None)
+
+    def _sent(self, result, start, queue_wait):
+        if not result.get('error'):
+            self.latencies.add(time.perf_counter() - start)
+        return result if queue_wait is None else self._queued(result, queue_wait)
+
+    # Synchronous searches
+
+    def _admit(self):
+        """
+        Waits in the calling thread until the provider's limits allow a request.
+
+        Returns:
+            tuple: (seconds queued, or None without limits; a 'throttled' error or None)
+        """
+        if self.limiter is None:
+            return None, None
+        queue_start = time.monotonic()
+        try:
+            return self.limiter.acquire(), None
+        except QueueTimeout as e:
+            return None, self._throttled(e, queue_start)
+
+    def _send(self, attempt, timeout, queue_wait):
+        """
+        Sends an admitted attempt and frees its turn under the limits.
+        """
+        start = time.perf_counter()
+        result = None
+        try:
+            result = attempt(timeout)
+        finally:
+            if self.limiter is not None:
+                self.limiter.release(result)
+        return self._sent(result, start, queue_wait)
+
+    def _timed(self, attempt, timeout):
+        queue_wait, throttled = self._admit()
+        return throttled or self._send(attempt, timeout, queue_wait)
+
+    def _hedged(self, attempt, timeout, delay):
+        """
+        Sends the attempt from the hedge pool; if it has not finished `delay` seconds
+        later, starts a duplicate and returns whichever succeeds first.
+        The slower request cannot be cancelled and finishes in the background.
+        Without a free worker, hedge budget or turn under the limits, the attempt
+        simply runs to completion.
+
+        Returns:
+            tuple: (result, number of requests sent)
+        """
+        queue_wait, throttled = self._admit()
+        if throttled:
+            return throttled, 1
+        primary = _submit_to_free_worker(self._send, attempt, timeout, queue_wait)
+        if primary is None:
+            return self._send(attempt, timeout, queue_wait), 1
+
+        done, _ = wait({primary}, timeout=delay)
+        if done or not self._may_hedge():
+            return primary.result(), 1
+        hedge_wait = None if queue_wait is None else 0.0
+        hedge = _submit_to_free_worker(self._send, attempt, timeout, hedge_wait)
+        if hedge is None:
+            self._cancel_hedge()
+            return primary.result(), 1
+
+        print(f'  [Hedge] {self.name}: no answer after {delay * 1000:.0f} ms, hedging')
+        pending = {primary, hedge}
+        result = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if not result.get('error'):
+                    return result, 2
+        return result, 2
+
+    def call(self, attempt):
+        """
+        Runs a synchronous search with this policy.
+
+        Args:
+            attempt (callable): attempt(timeout) -> result dict.
+        """
+        attempts = 0
+        hedged = False
+        queue_wait_ms = 0.0
+        if self.hedge:
+            self.hedge_budget.deposit()
+        for retry in range(self.retries + 1):
+            timeout = self.timeout()
+            delay = self.hedge_delay()
+            if delay is None:
+                result, sent = self._timed(attempt, timeout), 1
+            else:
+                result, sent = self._hedged(attempt, timeout, delay)
+            attempts += sent
+            hedged = hedged or sent > 1
+            queue_wait_ms += result.get('metrics', {}).get('queue_wait_ms', 0)
+            if retry == self.retries or not _is_retryable(result):
+                break
+            print(f'  [Retry] {self.name}: {result.get("error_type")} error, retrying')
+            time.sleep(self._backoff(retry))
+        return self._finish(result, attempts, hedged, timeout, queue_wait_ms)
+
+    # Asynchronous searches
+
+    async def _aadmit(self):
+        """
+        Asynchronous variant of `_admit()`.
+        """
+        if self.limiter is None:
+            return None, None
+        queue_start = time.monotonic()
+        try:
+            return await self.limiter.aacquire(), None
+        except QueueTimeout as e:
+            return None, self._throttled(e, queue_start)
+
+    async def _asend(self, attempt, timeout, queue_wait):
+        start = time.perf_counter()
+        result = None
+        try:
+            result = await attempt(timeout)
+        finally:
+            if self.limiter is not None:
+                self.limiter.release(result)
+        return self._sent(result, start, queue_wait)
+
+    async def _atimed(self, attempt, timeout):
+        queue_wait, throttled = await self._aadmit()
+        return throttled or await self._asend(attempt, timeout, queue_wait)
+
+    async def _ahedged(self, attempt, timeout, delay):
+        """
+        Asynchronous variant of `_hedged()`; the losing request is cancelled.
+        """
+        queue_wait, throttled = await self._aadmit()
+        if throttled:
+            return throttled, 1
+        pending = {asyncio.ensure_future(self._asend(attempt, timeout, queue_wait))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=delay)
+            if done:
+                return done.pop().result(), 1
+            if not self._may_hedge():
+                return await pending.pop(), 1
+
+            print(f'  [Hedge] {self.name}: no answer after {delay * 1000:.0f} ms, hedging')
+            hedge_wait = None if queue_wait is None else 0.0
+            pending.add(asyncio.ensure_future(self._asend(attempt, timeout, hedge_wait)))
+            result = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    result = task.result()
+                    if not result.get('error'):
+                        return result, 2
+            return result, 2
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def acall(self, attempt):
+        """
+        Runs an asynchronous search with this policy.
+
+        Args:
+            attempt (callable): attempt(timeout) -> awaitable result dict.
+        """
+        attempts = 0
+        hedged = False
+        queue_wait_ms = 0.0
+        if self.hedge:
+            self.hedge_budget.deposit()
+        for retry in range(self.retries + 1):
+            timeout = self.timeout()
+            delay = self.hedge_delay()
+            if delay is None:
+                result, sent = await self._atimed(attempt, timeout), 1
+            else:
+                result, sent = await self._ahedged(attempt, timeout, delay)
+            attempts += sent
+            hedged = hedged or sent > 1
+            queue_wait_ms += result.get('metrics', {}).get('queue_wait_ms', 0)
+            if retry == self.retries or not _is_retryable(result):
+                break
+            print(f'  [Retry] {self.name}: {result.get("error_type")} error, retrying')
+            await asyncio.sleep(self._backoff(retry))
+        return self._finish(result, attempts, hedged, timeout, queue_wait_ms)
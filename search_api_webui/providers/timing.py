@@ -0,0 +1,284 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Phase-level request timing for provider HTTP calls.
+
+Sessions built with `TimedHTTPAdapter` (see connection.create_session) report the DNS,
+TCP and TLS time of every new connection, and their `record_response` hook reports
+when response headers arrived, how long the body took to download and how many bytes
+crossed the wire. Timings are collected per thread: a provider wraps one search in
+`RequestTimer` and reads the phases afterwards.
+
+`AsyncRequestTrace` collects the same phases from httpx's trace extension.
+"""
+
+import socket
+import threading
+import time
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+_local = threading.local()
+
+
+def _ms(seconds):
+    return round(seconds * 1000, 2)
+
+
+def _current_timer():
+    return getattr(_local, 'timer', None)
+
+
+class RequestTimer:
+    """
+    Collects the phases of the HTTP requests made by the current thread.
+
+    Usage:
+        with RequestTimer() as timer:
+            response = session.get(url)
+        metrics.update(timer.phases())
+    """
+
+    def __init__(self):
+        self.start = None
+        self.new_connections = 0
+        self.dns_s = 0.0
+        self.tcp_s = 0.0
+        self.tls_s = 0.0
+        self.headers_at = None
+        self.status_code = None
+        self.retry_after = None      # Raw Retry-After header of the last response
+        self.download_s = 0.0
+        self.wire_bytes = 0
+        self.body_bytes = 0
+        self.body = None             # Body of the last response, as received
+        self.content_type = None
+
+    def __enter__(self):
+        self._previous = _current_timer()
+        _local.timer = self
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        _local.timer = self._previous
+        return False
+
+    @property
+    def connect_s(self):
+        return self.dns_s + self.tcp_s + self.tls_s
+
+    @property
+    def connect_ms(self):
+        return _ms(self.connect_s)
+
+    @property
+    def connection_reused(self):
+        return self.new_connections == 0
+
+    def phases(self):
+        """
+        Returns:
+            dict: Phase metrics in milliseconds. 'ttfb_ms' is the wait for response
+            headers once the connection was ready; 'wire_bytes' is the body size as
+            transferred (before decompression).
+        """
+        ttfb_s = 0.0
+        if self.headers_at is not None:
+            ttfb_s = max(self.headers_at - self.start - self.connect_s, 0.0)
+        return {
+            "connection_reused": self.connection_reused,
+            "dns_ms": _ms(self.dns_s),
+            "tcp_ms": _ms(self.tcp_s),
+            "tls_ms": _ms(self.tls_s),
+            "connect_ms": self.connect_ms,
+            "ttfb_ms": _ms(ttfb_s),
+            "download_ms": _ms(self.download_s),
+            "wire_bytes": self.wire_bytes
+        }
+
+
+def record_response(response, *args, **kwargs):
+    """
+    `requests` response hook: downloads the body, timing it and counting wire bytes.
+    Hooks run as soon as the response headers are parsed, before requests reads the
+    body itself, so the hook's entry time marks time-to-first-byte.
+    """
+    timer = _current_timer()
+    if timer is None:
+        return response
+
+    timer.headers_at = time.perf_counter()
+    timer.status_code = response.status_code
+    timer.retry_after = response.headers.get('Retry-After')
+    content = response.content
+    timer.download_s += time.perf_counter() - timer.headers_at
+    timer.body_bytes += len(content)
+    timer.body = content
+    timer.content_type = response.headers.get('Content-Type')
+    raw = response.raw
+    timer.wire_bytes += raw.tell() if hasattr(raw, 'tell') else len(content)
+    return response
+
+
+class _TimedConnectionMixin:
+    """
+    Splits connection setup into DNS, TCP and TLS. DNS is resolved here so it can be
+    timed on its own; each resolved address is then tried in order, as urllib3 would.
+    """
+
+    def _new_conn(self):
+        timer = _current_timer()
+        if timer is None:
+            return super()._new_conn()
+
+        host = self._dns_host
+        dns_start = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(host, self.port, allowed_gai_family(),
+                                           socket.SOCK_STREAM)
+        except (socket.gaierror, UnicodeError):
+            addresses = []
+        if not addresses:
+            # Let urllib3 raise its usual resolution error
+            return super()._new_conn()
+        tcp_start = time.perf_counter()
+        timer.dns_s += tcp_start - dns_start
+
+        last_error = None
+        try:
+            for address in dict.fromkeys(info[4][0] for info in addresses):
+                self._dns_host = address
+                try:
+                    sock = super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    last_error = e
+                    continue
+                timer.tcp_s += time.perf_counter() - tcp_start
+                timer.new_connections += 1
+                return sock
+        finally:
+            self._dns_host = host
+        raise last_error
+
+    def connect(self):
+        timer = _current_timer()
+        if timer is None:
+            return super().connect()
+
+        start = time.perf_counter()
+        setup_before = timer.dns_s + timer.tcp_s
+        super().connect()
+        # Whatever connect() spent beyond opening the socket is the TLS handshake
+        handshake_s = (time.perf_counter() - start) - (timer.dns_s + timer.tcp_s - setup_before)
+        if isinstance(self, HTTPSConnection):
+            timer.tls_s += max(handshake_s, 0.0)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose connections report their setup phases to the active RequestTimer.
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+
+class AsyncRequestTrace:
+    """
+    httpx trace callback collecting the same phases as RequestTimer.
+    httpcore resolves DNS inside its TCP connect, so DNS time is reported as part of
+    'tcp_ms' and 'dns_ms' stays 0.
+
+    Usage:
+        trace = AsyncRequestTrace()
+        response = await client.send(request_with_trace_extension, stream=True)
+        await trace.read_body(response)
+        metrics.update(trace.phases())
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        self._events = {}
+        self.headers_at = None
+        self.download_s = 0.0
+        self.wire_bytes = 0
+
+    async def __call__(self, event_name, info):
+        self._events[event_name] = time.perf_counter()
+
+    def _span(self, step):
+        started = self._events.get(f'{step}.started')
+        completed = self._events.get(f'{step}.complete')
+        if started is None or completed is None:
+            return 0.0
+        return completed - started
+
+    async def read_body(self, response):
+        """
+        Downloads the body of a streamed httpx response, timing it.
+        """
+        self.headers_at = time.perf_counter()
+        await response.aread()
+        self.download_s = time.perf_counter() - self.headers_at
+        self.wire_bytes = response.num_bytes_downloaded
+
+    def phases(self):
+        tcp_s = self._span('connection.connect_tcp')
+        tls_s = self._span('connection.start_tls')
+        connect_s = tcp_s + tls_s
+        ttfb_s = 0.0
+        if self.headers_at is not None:
+            ttfb_s = max(self.headers_at - self.start - connect_s, 0.0)
+        return {
+            "connection_reused": 'connection.connect_tcp.started' not in self._events,
+            "dns_ms": 0.0,
+            "tcp_ms": _ms(tcp_s),
+            "tls_ms": _ms(tls_s),
+            "connect_ms": _ms(connect_s),
+            "ttfb_ms": _ms(ttfb_s),
+            "download_ms": _ms(self.download_s),
+            "wire_bytes": self.wire_bytes
+        }
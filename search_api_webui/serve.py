@@ -0,0 +1,129 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+Production serving mode (`search-api-webui --serve`).
+
+Where gunicorn is available the app is served by a pre-forking master with
+`workers` processes of `threads` threads each. Every worker initializes its own
+providers, connection pools and cache after the fork. On SIGTERM or SIGINT the
+workers finish in-flight requests (up to GRACEFUL_TIMEOUT seconds) before exiting.
+
+Without gunicorn (e.g., on Windows) waitress serves the app from a single
+multi-threaded process.
+"""
+
+from importlib.util import find_spec
+
+DEFAULT_WORKERS = 2
+DEFAULT_THREADS = 8
+GRACEFUL_TIMEOUT = 30     # Seconds in-flight requests get to finish on shutdown
+WORKER_TIMEOUT = 90       # Seconds a silent worker is given before it is restarted
+
+
+def _run_gunicorn(app, host, port, workers, threads, init_worker, shutdown):
+    from gunicorn.app.base import BaseApplication
+
+    def post_fork(server, worker):
+        init_worker()
+
+    def worker_exit(server, worker):
+        shutdown()
+
+    class WebUIApplication(BaseApplication):
+
+        def load_config(self):
+            options = {
+                'bind': f'{host}:{port}',
+                'workers': workers,
+                'threads': threads,
+                'worker_class': 'gthread' if threads > 1 else 'sync',
+                'graceful_timeout': GRACEFUL_TIMEOUT,
+                'timeout': WORKER_TIMEOUT,
+                'post_fork': post_fork,
+                'worker_exit': worker_exit,
+            }
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    WebUIApplication().run()
+    return 0
+
+
+def _run_waitress(app, host, port, workers, threads, init_worker, shutdown):
+    import waitress
+
+    if workers > 1:
+        print("  - Note: waitress serves from a single process; --workers is ignored")
+    init_worker()
+    try:
+        waitress.serve(app, host=host, port=port, threads=threads)
+    finally:
+        shutdown()
+    return 0
+
+
+def _select_runner():
+    """
+    Returns:
+        callable: The runner of the preferred installed server, or None if there is none.
+    """
+    if find_spec('gunicorn') is not None:  # Unix only
+        return _run_gunicorn
+    if find_spec('waitress') is not None:
+        return _run_waitress
+    return None
+
+
+def run(app, host, port, workers=DEFAULT_WORKERS, threads=DEFAULT_THREADS,
+        init_worker=None, shutdown=None):
+    """
+    Serves the WSGI app until interrupted.
+
+    Args:
+        app: The WSGI application.
+        host (str): Interface to bind to.
+        port (int): Port to bind to.
+        workers (int): Worker processes (gunicorn only).
+        threads (int): Request threads per worker.
+        init_worker (callable): Sets up per-process state; run in each worker after
+            the fork, or once before serving when there is no fork.
+        shutdown (callable): Releases per-process state when a worker exits.
+
+    Returns:
+        int: The process exit code.
+    """
+    init_worker = init_worker or (lambda: None)
+    shutdown = shutdown or (lambda: None)
+
+    if workers < 1 or threads < 1:
+        print("Error: --workers and --threads must be at least 1")
+        return 2
+
+    runner = _select_runner()
+    if runner is None:
+        print("Error: production mode requires gunicorn or waitress. "
+              "Install it with: pip install search-api-webui[serve]")
+        return 1
+
+    return runner(app, host, port, workers, threads, init_worker, shutdown)
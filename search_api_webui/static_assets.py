@@ -0,0 +1,172 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+In-memory table of the frontend bundle, served without touching the disk.
+
+Every file is read once, given a content-hash ETag and, if compressible, stored
+precompressed with each available coding (see compression.py). Vite writes hashed
+file names to assets/, so those are cached by browsers for a year as immutable;
+everything else (e.g., index.html) is revalidated with its ETag on each load.
+"""
+
+import hashlib
+import mimetypes
+import os
+import threading
+import time
+from pathlib import Path
+
+from search_api_webui.compression import (
+    MIN_COMPRESS_SIZE, STATIC_LEVELS, available_encodings, compress, is_compressible,
+)
+
+IMMUTABLE_PREFIX = 'assets/'
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+REVALIDATE_CACHE_CONTROL = 'no-cache'
+MAX_BUFFERED_SIZE = 8 * 1024 * 1024   # Larger files are served from disk
+
+
+def _matches(if_none_match, etags):
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        # If-None-Match uses the weak comparison
+        if tag == '*' or (tag[2:] if tag.startswith('W/') else tag) in etags:
+            return True
+    return False
+
+
+class StaticAsset:
+    """
+    One file of the bundle with its precompressed variants.
+    """
+
+    def __init__(self, path, data):
+        """
+        Args:
+            path (str): The URL path relative to the static folder, e.g., 'assets/app.js'.
+            data (bytes): The file's content.
+        """
+        self.path = path
+        self.mimetype = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self.content_type = self.mimetype
+        if self.mimetype.startswith('text/') or self.mimetype == 'application/javascript':
+            self.content_type += '; charset=utf-8'
+        self.cache_control = (IMMUTABLE_CACHE_CONTROL if path.startswith(IMMUTABLE_PREFIX)
+                              else REVALIDATE_CACHE_CONTROL)
+
+        digest = hashlib.blake2b(data, digest_size=12).hexdigest()
+        # content coding (None for identity) -> (body, ETag); each variant needs its own tag
+        self.variants = {None: (data, f'"{digest}"')}
+        if is_compressible(self.mimetype) and len(data) >= MIN_COMPRESS_SIZE:
+            for coding in available_encodings():
+                encoded = compress(data, coding, STATIC_LEVELS)
+                if len(encoded) < len(data):
+                    self.variants[coding] = (encoded, f'"{digest}-{coding}"')
+        self.encodings = tuple(coding for coding in self.variants if coding is not None)
+        self.etags = frozenset(etag for _, etag in self.variants.values())
+
+    def respond(self, coding, if_none_match=None):
+        """
+        Builds the response for a request.
+
+        Args:
+            coding (str): The negotiated content coding (one of `encodings`), or None.
+            if_none_match (str): The request's If-None-Match header, if any.
+
+        Returns:
+            tuple: (status, body, headers). The status is 304, with an empty body,
+            if the client's copy is current.
+        """
+        if coding not in self.variants:
+            coding = None
+        body, etag = self.variants[coding]
+        headers = {'ETag': etag, 'Cache-Control': self.cache_control}
+        if self.encodings:
+            headers['Vary'] = 'Accept-Encoding'
+        if _matches(if_none_match, self.etags):
+            return 304, b'', headers
+        headers['Content-Type'] = self.content_type
+        if coding is not None:
+            headers['Content-Encoding'] = coding
+        return 200, body, headers
+
+
+class StaticAssets:
+    """
+    The table of every file under a static folder, built once in the background.
+    Until it is ready, and for files over MAX_BUFFERED_SIZE, callers serve from disk.
+    """
+
+    def __init__(self, folder):
+        self.folder = Path(folder)
+        self.ready = False
+        self.unbuffered = frozenset()  # Paths too large to keep in memory
+        self._assets = {}
+        self._lock = threading.Lock()
+        self._loader = None
+
+    def get(self, path):
+        """
+        Returns:
+            StaticAsset | None: The asset at the URL path, if it is in the table.
+        """
+        return self._assets.get(path)
+
+    def load(self):
+        """
+        Reads and precompresses every file under the folder. A missing folder
+        (e.g., the frontend was never built) yields an empty table.
+        """
+        start = time.perf_counter()
+        assets = {}
+        unbuffered = set()
+        for root, _, files in os.walk(self.folder):
+            for name in files:
+                file_path = Path(root) / name
+                path = file_path.relative_to(self.folder).as_posix()
+                try:
+                    if file_path.stat().st_size > MAX_BUFFERED_SIZE:
+                        unbuffered.add(path)
+                        continue
+                    assets[path] = StaticAsset(path, file_path.read_bytes())
+                except OSError as e:
+                    print(f"  [Static] Skipping {file_path}: {e}")
+
+        self._assets = assets
+        self.unbuffered = frozenset(unbuffered)
+        self.ready = True
+        if assets:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"  [Static] Loaded {len(assets)} file(s) from {self.folder} "
+                  f"in {elapsed_ms:.0f} ms")
+
+    def load_in_background(self):
+        """
+        Starts `load()` on a daemon thread; a no-op once started. Returns immediately.
+        """
+        with self._lock:
+            if self._loader is None:
+                self._loader = threading.Thread(
+                    target=self.load, name='static-assets', daemon=True
+                )
+                self._loader.start()
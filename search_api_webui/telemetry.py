@@ -0,0 +1,357 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+"""
+In-process search telemetry, exposed in the Prometheus text format.
+
+Metrics are plain dicts keyed by label values. Each update holds the metric's own
+lock for a single dict operation, so recording costs a few hundred nanoseconds and
+searches against different providers never wait on each other for long.
+"""
+
+import bisect
+import threading
+import time
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0, 10.0, 30.0)   # Seconds
+SIZE_BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576, 4194304)              # Bytes
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_sample(name, labelnames, labels, value):
+    if labelnames:
+        pairs = ','.join(f'{k}="{_escape(v)}"' for k, v in zip(labelnames, labels))
+        name = f'{name}{{{pairs}}}'
+    if isinstance(value, float):
+        value = '+Inf' if value == float('inf') else repr(value)
+    return f'{name} {value}'
+
+
+class _Metric:
+    kind = 'untyped'
+
+    def __init__(self, name, documentation, labelnames=()):
+        """
+        Args:
+            name (str): Metric name, e.g. 'search_requests_total'.
+            documentation (str): One-line help text.
+            labelnames (tuple[str]): Label names; updates pass values in the same order.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def samples(self):
+        """
+        Returns:
+            list[tuple]: (sample name, label names, label values, value) tuples.
+        """
+        raise NotImplementedError
+
+    def render(self):
+        lines = [
+            f'# HELP {self.name} {self.documentation}',
+            f'# TYPE {self.name} {self.kind}',
+        ]
+        lines.extend(_format_sample(*sample) for sample in self.samples())
+        return lines
+
+
+class Counter(_Metric):
+    """
+    A monotonically increasing value per label set.
+    """
+
+    kind = 'counter'
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames)
+        self._values = {}
+
+    def inc(self, labels=(), amount=1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def get(self, labels=()):
+        return self._values.get(labels, 0)
+
+    def values(self):
+        with self._lock:
+            return dict(self._values)
+
+    def samples(self):
+        return [(self.name, self.labelnames, labels, value)
+                for labels, value in sorted(self.values().items())]
+
+
+class Gauge(Counter):
+    """
+    A value per label set that can go up and down.
+    """
+
+    kind = 'gauge'
+
+    def dec(self, labels=(), amount=1):
+        self.inc(labels, -amount)
+
+    def set(self, labels=(), value=0):
+        with self._lock:
+            self._values[labels] = value
+
+
+class FunctionGauge(_Metric):
+    """
+    A gauge computed when metrics are scraped.
+    """
+
+    kind = 'gauge'
+
+    def __init__(self, name, documentation, labelnames, function):
+        """
+        Args:
+            function (callable): Returns a dict mapping label value tuples to values.
+        """
+        super().__init__(name, documentation, labelnames)
+        self._function = function
+
+    def samples(self):
+        return [(self.name, self.labelnames, labels, value)
+                for labels, value in sorted(self._function().items())]
+
+
+class Histogram(_Metric):
+    """
+    Counts observations into fixed cumulative buckets per label set.
+    """
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series = {}  # labels -> [per-bucket counts (last one is +Inf), sum]
+
+    def observe(self, labels, value):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def samples(self):
+        with self._lock:
+            snapshot = {labels: (list(counts), total)
+                        for labels, (counts, total) in self._series.items()}
+
+        samples = []
+        bucket_labelnames = self.labelnames + ('le',)
+        for labels, (counts, total) in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), counts):
+                cumulative += count
+                le = '+Inf' if bound == float('inf') else repr(float(bound))
+                samples.append((f'{self.name}_bucket', bucket_labelnames,
+                                labels + (le,), cumulative))
+            samples.append((f'{self.name}_sum', self.labelnames, labels, total))
+            samples.append((f'{self.name}_count', self.labelnames, labels, cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """
+    An ordered collection of metrics rendered together.
+    """
+
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        """
+        Returns:
+            str: All metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+class _UpstreamSearch:
+    """
+    Token of an upstream search, from `upstream_started()` to `upstream_finished()`.
+    """
+
+    def __init__(self, in_flight, labels):
+        self._in_flight = in_flight
+        self._labels = labels
+        self.started_at = time.perf_counter()
+        self.counted = True
+        in_flight.inc(labels)
+
+    def set_queued(self, queued):
+        if queued == self.counted:
+            self.counted = not queued
+            if queued:
+                self._in_flight.dec(self._labels)
+            else:
+                self._in_flight.inc(self._labels)
+
+
+class SearchTelemetry:
+    """
+    The search metrics recorded by SearchDispatcher.
+
+    Usage:
+        token = telemetry.upstream_started(provider_name)
+        result = None
+        try:
+            result = provider.search(...)
+        finally:
+            telemetry.upstream_finished(provider_name, token, result)
+
+    While the search waits for its turn under the provider's limits, call
+    `token.set_queued(True)`, then `token.set_queued(False)` once it is admitted
+    (see limits.queue_listener), so the wait is not counted as in flight.
+    """
+
+    def __init__(self, registry=None):
+        self.registry = registry or MetricsRegistry()
+        register = self.registry.register
+
+        self.requests = register(Counter(
+            'search_requests_total',
+            'Searches handled per provider, including cache hits.', ('provider',)
+        ))
+        self.cache_lookups = register(Counter(
+            'search_cache_lookups_total',
+            'Result cache lookups per provider.', ('provider', 'result')
+        ))
+        register(FunctionGauge(
+            'search_cache_hit_ratio',
+            'Share of cache lookups answered from the cache.', ('provider',),
+            self._cache_hit_ratios
+        ))
+        self.coalesced = register(Counter(
+            'search_coalesced_total',
+            'Searches answered by an identical search already in flight.', ('provider',)
+        ))
+        self.upstream_requests = register(Counter(
+            'search_upstream_requests_total',
+            'Searches sent to the upstream provider.', ('provider',)
+        ))
+        self.upstream_errors = register(Counter(
+            'search_upstream_errors_total',
+            'Failed upstream searches by error class and HTTP status.',
+            ('provider', 'class', 'status')
+        ))
+        self.in_flight = register(Gauge(
+            'search_upstream_in_flight',
+            'Upstream searches currently in progress, not counting those queued under '
+            'the provider\'s limits.', ('provider',)
+        ))
+        self.latency = register(Histogram(
+            'search_upstream_latency_seconds',
+            'Wall-clock time of upstream searches, including failed ones and excluding '
+            'time queued under the provider\'s limits.', ('provider',),
+            LATENCY_BUCKETS
+        ))
+        self.queue_wait = register(Histogram(
+            'search_queue_wait_seconds',
+            'Time upstream searches waited for the provider\'s rate and concurrency limits.',
+            ('provider',), LATENCY_BUCKETS
+        ))
+        self.response_size = register(Histogram(
+            'search_upstream_response_size_bytes',
+            'Body size of successful upstream responses.', ('provider',),
+            SIZE_BUCKETS
+        ))
+
+    def _cache_hit_ratios(self):
+        lookups = self.cache_lookups.values()
+        ratios = {}
+        for provider, result in lookups:
+            hits = lookups.get((provider, 'hit'), 0)
+            misses = lookups.get((provider, 'miss'), 0)
+            ratios[(provider,)] = round(hits / (hits + misses), 4)
+        return ratios
+
+    def search_received(self, provider_name, cache_hit=None):
+        """
+        Records a search for a known provider.
+
+        Args:
+            cache_hit (bool): Outcome of the cache lookup, or None if the cache was skipped.
+        """
+        self.requests.inc((provider_name,))
+        if cache_hit is not None:
+            self.cache_lookups.inc((provider_name, 'hit' if cache_hit else 'miss'))
+
+    def search_coalesced(self, provider_name):
+        """
+        Records a search that shared another search's upstream call.
+        """
+        self.coalesced.inc((provider_name,))
+
+    def upstream_started(self, provider_name):
+        """
+        Returns:
+            A token to pass to `upstream_finished()`.
+        """
+        self.upstream_requests.inc((provider_name,))
+        return _UpstreamSearch(self.in_flight, (provider_name,))
+
+    def upstream_finished(self, provider_name, token, result):
+        """
+        Args:
+            token: The value returned by `upstream_started()`.
+            result (dict): The provider's result, or None if the provider raised.
+        """
+        elapsed = time.perf_counter() - token.started_at
+        labels = (provider_name,)
+        if token.counted:
+            self.in_flight.dec(labels)
+
+        queue_wait_ms = result.get('metrics', {}).get('queue_wait_ms') if result else None
+        if queue_wait_ms is not None:
+            self.queue_wait.observe(labels, queue_wait_ms / 1000)
+            elapsed -= queue_wait_ms / 1000
+        self.latency.observe(labels, max(elapsed, 0.0))
+
+        if result is None or result.get('error'):
+            error_type = result.get('error_type', 'other') if result else 'other'
+            status = result.get('status_code') if result else None
+            self.upstream_errors.inc((provider_name, error_type, status or ''))
+        else:
+            self.response_size.observe(labels, result.get('metrics', {}).get('size_bytes', 0))
+
+    def render(self):
+        return self.registry.render()
@@ -0,0 +1,109 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import json
+
+import pytest
+
+from search_api_webui import app as webui
+from search_api_webui.cache import ResultCache
+from search_api_webui.dispatcher import SearchDispatcher
+from search_api_webui.providers import ProviderMap
+
+
+def parse_sse(body):
+    """
+    Returns:
+        list[tuple]: (event, payload) pairs in the order they were sent.
+    """
+    events = []
+    for block in body.split('\n\n'):
+        if not block:
+            continue
+        event_line, data_line = block.split('\n')
+        events.append((event_line[len('event: '):], json.loads(data_line[len('data: '):])))
+    return events
+
+
+@pytest.fixture
+def client(local_server, monkeypatch):
+    """
+    A test client whose providers all search the local server, without API keys.
+    """
+    local_server.payload = {"results": [{"title": "T", "url": "https://example.com/"}]}
+    configs = {
+        name: {'name': name, 'url': local_server.url + '/' + name, 'requires_api_key': False,
+               'response_mapping': {'root_path': 'results',
+                                    'fields': {'title': 'title', 'url': 'url'}}}
+        for name in ('alpha', 'beta')
+    }
+    provider_map = ProviderMap(lambda: dict(configs))
+    dispatcher = SearchDispatcher(provider_map, cache=ResultCache())
+    monkeypatch.setattr(webui, 'provider_map', provider_map)
+    monkeypatch.setattr(webui, 'dispatcher', dispatcher)
+    monkeypatch.setattr(webui, 'get_stored_config', lambda: {})
+    yield webui.app.test_client()
+    dispatcher.shutdown()
+    for provider in provider_map.instances():
+        provider.close()
+
+
+def test_stream_sends_every_result_then_done(client, local_server):
+    response = client.get('/api/arena/stream?query=q&providers=alpha&providers=unknown'
+                          '&providers=beta&providers=alpha')
+
+    assert response.status_code == 200
+    assert response.mimetype == 'text/event-stream'
+    assert response.headers['Cache-Control'] == 'no-cache'
+    events = parse_sse(response.get_data(as_text=True))
+    names = [event for event, _ in events]
+    assert names == ['result'] * 4 + ['done']
+
+    # The rejected provider is reported before any search completes
+    first = events[0][1]
+    assert (first['index'], first['provider'], first['error']) == (1, 'unknown',
+                                                                   'Provider not found')
+    results = {payload['index']: payload for _, payload in events[1:-1]}
+    assert sorted(results) == [0, 2, 3]
+    for payload in results.values():
+        assert payload['results'][0]['title'] == 'T'
+        assert 'error' not in payload
+    assert events[-1][1]['query'] == 'q'
+    assert events[-1][1]['elapsed_ms'] >= 0
+    # The duplicate slot shares alpha's search
+    assert sorted(path for _, path in local_server.requests) == ['/alpha', '/beta']
+
+
+def test_stream_reports_a_bad_request_as_failed(client):
+    response = client.get('/api/arena/stream?providers=alpha')
+
+    assert response.status_code == 200
+    assert parse_sse(response.get_data(as_text=True)) == [
+        ('failed', {"error": "Query is required"})
+    ]
+
+
+def test_no_cache_flag_is_read_from_the_query_string(client, local_server):
+    for _ in range(2):
+        client.get('/api/arena/stream?query=q&providers=alpha&no_cache=1').get_data()
+    client.get('/api/arena/stream?query=q&providers=alpha').get_data()
+    client.get('/api/arena/stream?query=q&providers=alpha').get_data()
+
+    assert len(local_server.requests) == 3
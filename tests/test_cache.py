@@ -0,0 +1,84 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import time
+
+from search_api_webui.cache import DiskCache, MemoryCache, ResultCache, make_cache_key
+
+
+def test_cache_key_ignores_api_url_whitespace():
+    assert make_cache_key('you', 'q', 10, 'en', ' https://x/ ') == \
+        make_cache_key('you', 'q', 10, 'en', 'https://x/')
+    assert make_cache_key('you', 'q', 10) != make_cache_key('you', 'q', 20)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryCache(max_entries=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a')[0] == 1  # 'a' is now the most recently used
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a')[0] == 1
+    assert cache.get('c')[0] == 3
+
+
+def test_memory_cache_expires_entries_after_ttl():
+    cache = MemoryCache(max_entries=10, ttl=60)
+    cache.set('fresh', 1)
+    cache.set('stale', 2, stored_at=time.time() - 61)
+
+    assert cache.get('fresh')[0] == 1
+    assert cache.get('stale') is None
+
+
+def test_disk_cache_round_trip_and_ttl(tmp_path):
+    cache = DiskCache(tmp_path / 'cache.sqlite3', max_entries=10, ttl=60)
+    cache.set('key', {'results': [{'title': 'T'}]})
+    cache.set('old', {'results': []}, stored_at=time.time() - 61)
+
+    value, stored_at = cache.get('key')
+    assert value == {'results': [{'title': 'T'}]}
+    assert stored_at <= time.time()
+    assert cache.get('old') is None
+
+
+def test_disk_cache_prunes_beyond_max_entries(tmp_path):
+    cache = DiskCache(tmp_path / 'cache.sqlite3', max_entries=2, ttl=60)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, {'key': key})
+        time.sleep(0.01)  # Distinct access times
+
+    assert cache.get('a') is None
+    assert cache.get('c') is not None
+
+
+def test_result_cache_skips_errors_and_promotes_disk_hits(tmp_path):
+    disk = DiskCache(tmp_path / 'cache.sqlite3', ttl=60)
+    cache = ResultCache(MemoryCache(ttl=60), disk)
+
+    cache.set('failed', {'error': 'boom', 'results': []})
+    assert cache.get('failed') is None
+
+    disk.set('on-disk', {'results': [1]})
+    assert cache.memory.get('on-disk') is None
+    assert cache.get('on-disk')[0] == {'results': [1]}
+    assert cache.memory.get('on-disk')[0] == {'results': [1]}
@@ -0,0 +1,159 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import gzip
+import types
+
+import pytest
+
+from search_api_webui import compression
+from search_api_webui.compression import (
+    MIN_COMPRESS_SIZE, compress_response_body, negotiate_encoding,
+)
+from search_api_webui.static_assets import (
+    IMMUTABLE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, StaticAsset, StaticAssets,
+)
+
+BODY = b'{"results": [' + b'{"title": "a", "url": "https://example.com/"}, ' * 64 + b'{}]}'
+
+
+@pytest.fixture
+def with_brotli(monkeypatch):
+    """
+    Makes brotli available, with an encoder that tags rather than compresses its input.
+    """
+    fake = types.SimpleNamespace(compress=lambda data, quality: b'br:' + data[:16])
+    monkeypatch.setattr(compression, 'brotli', fake)
+
+
+@pytest.mark.parametrize('accept, expected', [
+    (None, None),
+    ('', None),
+    ('identity', None),
+    ('gzip', 'gzip'),
+    ('deflate, gzip;q=0.5', 'gzip'),
+    ('gzip;q=0', None),
+    ('*', 'gzip'),
+    ('*, gzip;q=0', None),
+    ('br, gzip', 'gzip'),
+])
+def test_negotiation_without_brotli(monkeypatch, accept, expected):
+    monkeypatch.setattr(compression, 'brotli', None)
+
+    assert negotiate_encoding(accept) == expected
+
+
+@pytest.mark.parametrize('accept, expected', [
+    ('gzip, br', 'br'),
+    ('br;q=0, gzip', 'gzip'),
+    ('gzip', 'gzip'),
+    ('*', 'br'),
+])
+def test_negotiation_prefers_brotli(with_brotli, accept, expected):
+    assert negotiate_encoding(accept) == expected
+
+
+def test_bodies_below_the_threshold_are_not_compressed():
+    small = BODY[:MIN_COMPRESS_SIZE - 1]
+
+    assert compress_response_body(small, 'gzip') == (small, None)
+
+
+def test_bodies_at_the_threshold_are_compressed():
+    body = BODY[:MIN_COMPRESS_SIZE]
+    encoded, coding = compress_response_body(body, 'gzip')
+
+    assert coding == 'gzip'
+    assert gzip.decompress(encoded) == body
+    assert compress_response_body(body, 'identity') == (body, None)
+
+
+def test_brotli_is_used_when_installed(with_brotli):
+    assert compress_response_body(BODY, 'gzip, br') == (b'br:' + BODY[:16], 'br')
+
+
+def test_asset_etag_and_not_modified():
+    asset = StaticAsset('index.html', BODY)
+    status, body, headers = asset.respond(None)
+
+    assert status == 200
+    assert body == BODY
+    assert headers['Cache-Control'] == REVALIDATE_CACHE_CONTROL
+    assert headers['Content-Type'] == 'text/html; charset=utf-8'
+    assert 'Content-Encoding' not in headers
+    etag = headers['ETag']
+
+    for if_none_match in (etag, f'W/{etag}', f'"other", {etag}', '*'):
+        status, body, headers = asset.respond(None, if_none_match)
+        assert status == 304
+        assert body == b''
+        assert headers['ETag'] == etag
+        assert 'Content-Type' not in headers
+    assert asset.respond(None, '"other"')[0] == 200
+
+
+def test_asset_variants_have_their_own_etags(monkeypatch):
+    monkeypatch.setattr(compression, 'brotli', None)
+    asset = StaticAsset('assets/app-1a2b.js', BODY)
+    status, body, headers = asset.respond('gzip')
+
+    assert asset.encodings == ('gzip',)
+    assert status == 200
+    assert gzip.decompress(body) == BODY
+    assert headers['Content-Encoding'] == 'gzip'
+    assert headers['Vary'] == 'Accept-Encoding'
+    assert headers['Cache-Control'] == IMMUTABLE_CACHE_CONTROL
+    identity_etag = asset.respond(None)[2]['ETag']
+    assert headers['ETag'] != identity_etag
+    # A cached copy of either variant is still current
+    assert asset.respond('gzip', identity_etag)[0] == 304
+    # A coding the asset was not stored in falls back to identity
+    assert asset.respond('br')[2]['ETag'] == identity_etag
+
+
+def test_small_and_binary_assets_are_not_precompressed():
+    assert StaticAsset('index.html', b'<html></html>').encodings == ()
+    assert StaticAsset('logo.png', BODY).encodings == ()
+    assert 'Vary' not in StaticAsset('logo.png', BODY).respond(None)[2]
+
+
+def test_assets_table(tmp_path, monkeypatch):
+    monkeypatch.setattr(compression, 'brotli', None)
+    monkeypatch.setattr('search_api_webui.static_assets.MAX_BUFFERED_SIZE', 2048)
+    (tmp_path / 'assets').mkdir()
+    (tmp_path / 'index.html').write_bytes(b'<html></html>')
+    (tmp_path / 'assets' / 'app.js').write_bytes(BODY[:1500])
+    (tmp_path / 'assets' / 'big.js').write_bytes(BODY * 2)
+    assets = StaticAssets(tmp_path)
+    assets.load()
+
+    assert assets.ready
+    assert assets.get('index.html').respond(None)[1] == b'<html></html>'
+    assert assets.get('assets/app.js').encodings == ('gzip',)
+    assert assets.get('assets/big.js') is None
+    assert assets.unbuffered == {'assets/big.js'}
+
+
+def test_missing_folder_yields_an_empty_table(tmp_path):
+    assets = StaticAssets(tmp_path / 'dist')
+    assets.load()
+
+    assert assets.ready
+    assert assets.get('index.html') is None
@@ -0,0 +1,70 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import json
+import os
+
+from search_api_webui.config_store import ConfigStore
+
+
+def test_missing_file_reads_as_empty(tmp_path):
+    assert ConfigStore(tmp_path / 'config.json').get() == {}
+
+
+def test_save_round_trip(tmp_path):
+    path = tmp_path / 'config.json'
+    store = ConfigStore(path)
+    store.save({'you': {'api_key': 'k'}})
+
+    assert store.get() == {'you': {'api_key': 'k'}}
+    assert ConfigStore(path).get() == {'you': {'api_key': 'k'}}
+    # The temporary file was renamed into place
+    assert os.listdir(tmp_path) == ['config.json']
+
+
+def test_external_edit_is_picked_up(tmp_path):
+    path = tmp_path / 'config.json'
+    store = ConfigStore(path)
+    store.save({'you': {'api_key': 'old'}})
+    assert store.get()['you']['api_key'] == 'old'
+
+    path.write_text(json.dumps({'you': {'api_key': 'edited by hand'}}), encoding='utf-8')
+    stat = os.stat(path)
+    # Guarantee a new mtime even on filesystems with coarse timestamps
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert store.get()['you']['api_key'] == 'edited by hand'
+
+
+def test_invalid_json_reads_as_empty(tmp_path):
+    path = tmp_path / 'config.json'
+    path.write_text('{not json', encoding='utf-8')
+    assert ConfigStore(path).get() == {}
+
+
+def test_update_applies_mutator_to_a_copy(tmp_path):
+    store = ConfigStore(tmp_path / 'config.json')
+    store.save({'you': {'api_key': 'k'}})
+    before = store.get()
+
+    store.update(lambda config: config.setdefault('querit', {}).update(api_key='q'))
+
+    assert 'querit' not in before
+    assert store.get() == {'you': {'api_key': 'k'}, 'querit': {'api_key': 'q'}}
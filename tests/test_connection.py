@@ -0,0 +1,101 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import socket
+import time
+
+import pytest
+
+from search_api_webui.providers.connection import ConnectionManager, warm_session
+from search_api_webui.providers.generic import GenericProvider
+
+
+def closed_port_url():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    return f'http://127.0.0.1:{port}/search'
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def manager():
+    manager = ConnectionManager('test', keepalive_interval=60)
+    yield manager
+    manager.close()
+
+
+def test_warm_session_opens_connections_once(local_server):
+    manager = ConnectionManager('test')
+
+    assert warm_session(manager.session, local_server.url, count=2) == 2
+    assert warm_session(manager.session, local_server.url, count=2) == 0
+    # Only handshakes; no HTTP request reaches the server
+    assert local_server.requests == []
+    manager.close()
+
+
+def test_keepalive_request_is_sent(local_server, manager):
+    manager.keepalive_method = 'HEAD'
+    manager.warm(local_server.url + '/search')
+
+    # The first pass may be followed by a second one, woken by warm() itself
+    assert wait_for(lambda: local_server.requests)
+    assert set(local_server.requests) == {('HEAD', '/search')}
+
+
+@pytest.mark.parametrize('url', [closed_port_url(), 'http://', 'not a url'])
+def test_warming_a_bad_url_fails_quietly(url, manager, capsys):
+    start = time.perf_counter()
+    manager.warm(url)
+
+    assert time.perf_counter() - start < 0.5
+    assert wait_for(lambda: 'warm-up of' in capsys.readouterr().out)
+    assert manager._thread.is_alive()
+
+
+def test_warm_is_a_no_op_without_a_target_or_once_closed(manager):
+    manager.warm('')
+    manager.warm(None)
+    assert manager._thread is None
+
+    manager.close()
+    manager.warm(closed_port_url())
+    assert manager._thread is None
+
+
+def test_search_reports_the_bad_url_after_warm_up_fails(capsys):
+    provider = GenericProvider({'name': 'down', 'url': closed_port_url()})
+    provider.prewarm()
+    assert wait_for(lambda: 'warm-up of' in capsys.readouterr().out)
+
+    result = provider.search('q', 'key')
+    provider.close()
+
+    assert result['error_type'] == 'connection'
+    assert result['results'] == []
@@ -0,0 +1,213 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from search_api_webui import dispatcher as dispatcher_module
+from search_api_webui.dispatcher import SearchDispatcher, SearchJob
+from search_api_webui.providers.base import BaseProvider
+from search_api_webui.providers.resilience import ResiliencePolicy
+
+UPSTREAM_S = 0.3
+
+
+class SlowProvider(BaseProvider):
+    """
+    Stands in for a provider whose upstream takes UPSTREAM_S to answer.
+    """
+
+    def __init__(self, delay=UPSTREAM_S, error=None, max_time=None):
+        self.delay = delay
+        self.error = error
+        self.max_time = max_time
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def max_search_time(self):
+        return self.max_time
+
+    def search(self, query, api_key, **kwargs):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return {"results": [{"title": query, "url": "https://example.com/", "snippet": ""}],
+                "metrics": {"latency_ms": self.delay * 1000, "size_bytes": 1}}
+
+
+def run_concurrently(count, target):
+    threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def test_concurrent_arenas_do_not_serialize():
+    providers = {f'p{i}': SlowProvider() for i in range(6)}
+    dispatcher = SearchDispatcher(providers)
+    results = {}
+
+    def arena(i):
+        jobs = [SearchJob(name, f'query {i}', 'key', use_cache=False) for name in providers]
+        results[i] = dispatcher.search_many(jobs)
+
+    elapsed = run_concurrently(3, arena)
+    dispatcher.shutdown()
+
+    assert elapsed < UPSTREAM_S * 1.8
+    assert all(len(responses) == 6 for responses in results.values())
+    assert all(not response.get('error') for responses in results.values()
+               for response in responses)
+
+
+def test_slow_provider_does_not_delay_others():
+    providers = {'slow': SlowProvider(delay=1.0), 'fast': SlowProvider(delay=0.05)}
+    dispatcher = SearchDispatcher(providers, max_workers=2)
+    # Saturate the slow provider's pool
+    backlog = [SearchJob('slow', f'q{i}', 'key', use_cache=False) for i in range(4)]
+    pending = threading.Thread(target=dispatcher.search_many, args=(backlog,))
+    pending.start()
+    time.sleep(0.05)
+
+    start = time.perf_counter()
+    [result] = dispatcher.search_many([SearchJob('fast', 'q', 'key', use_cache=False)])
+    elapsed = time.perf_counter() - start
+
+    assert not result.get('error')
+    assert elapsed < 0.5
+    pending.join()
+    dispatcher.shutdown()
+
+
+def test_identical_searches_share_one_upstream_call():
+    provider = SlowProvider()
+    dispatcher = SearchDispatcher({'p': provider})
+    results = [None] * 8
+
+    def search(i):
+        results[i] = dispatcher.search('p', 'same query', 'key')
+
+    run_concurrently(8, search)
+    assert provider.calls == 1
+    assert all(r['metrics']['coalesced_count'] == 8 for r in results)
+    assert sum(bool(r['metrics'].get('coalesced')) for r in results) == 7
+
+
+def test_leader_error_reaches_followers():
+    provider = SlowProvider(error=RuntimeError('upstream bug'))
+    dispatcher = SearchDispatcher({'p': provider})
+    errors = []
+
+    def search(i):
+        try:
+            dispatcher.search('p', 'same query', 'key')
+        except RuntimeError as e:
+            errors.append(e)
+
+    run_concurrently(4, search)
+    assert provider.calls == 1
+    assert len(errors) == 4
+
+
+def test_flight_is_released_after_completion():
+    provider = SlowProvider(delay=0.01)
+    dispatcher = SearchDispatcher({'p': provider})
+    dispatcher.search('p', 'same query', 'key')
+    assert not dispatcher._flights
+    dispatcher.search('p', 'same query', 'key')
+    assert provider.calls == 2
+
+    failing = SearchDispatcher({'p': SlowProvider(delay=0, error=RuntimeError())})
+    with pytest.raises(RuntimeError):
+        failing.search('p', 'same query', 'key')
+    assert not failing._flights
+
+
+def test_follower_searches_itself_after_timeout(monkeypatch):
+    monkeypatch.setattr(dispatcher_module, 'FOLLOW_MARGIN', 0.05)
+    provider = SlowProvider(delay=0.5, max_time=0)
+    dispatcher = SearchDispatcher({'p': provider})
+    results = [None] * 2
+
+    def search(i):
+        time.sleep(i * 0.05)
+        results[i] = dispatcher.search('p', 'same query', 'key')
+
+    elapsed = run_concurrently(2, search)
+    assert provider.calls == 2
+    assert elapsed < 0.5 * 2
+    assert not any('coalesced' in r['metrics'] or 'coalesced_count' in r['metrics']
+                   for r in results)
+
+
+def test_identical_async_searches_share_one_upstream_call():
+    provider = SlowProvider(delay=0.1)
+    dispatcher = SearchDispatcher({'p': provider})
+
+    async def search_all():
+        return await asyncio.gather(
+            *(dispatcher.asearch('p', 'same query', 'key') for _ in range(5))
+        )
+
+    results = asyncio.run(search_all())
+    assert provider.calls == 1
+    assert all(r['metrics']['coalesced_count'] == 5 for r in results)
+    assert not dispatcher._aflights
+
+
+class LimitedProvider(SlowProvider):
+    """
+    A SlowProvider that sends one request at a time.
+    """
+
+    def __init__(self, delay=UPSTREAM_S):
+        super().__init__(delay)
+        self.policy = ResiliencePolicy('limited', limits={'max_in_flight': 1})
+
+    def search(self, query, api_key, **kwargs):
+        return self.policy.call(lambda timeout: SlowProvider.search(self, query, api_key))
+
+
+def test_queue_wait_is_not_upstream_time():
+    dispatcher = SearchDispatcher({'p': LimitedProvider(delay=0.2)})
+    in_flight = []
+
+    def search(i):
+        dispatcher.search('p', f'query {i}', 'key', use_cache=False)
+
+    searches = threading.Thread(target=run_concurrently, args=(2, search))
+    searches.start()
+    time.sleep(0.1)
+    in_flight.append(dispatcher.telemetry.in_flight.get(('p',)))
+    searches.join()
+
+    # One search was sent while the other waited its turn
+    assert in_flight == [1]
+    assert dispatcher.telemetry.in_flight.get(('p',)) == 0
+    [(_, total)] = dispatcher.telemetry.latency._series.values()
+    assert total < 0.2 * 2 + 0.1
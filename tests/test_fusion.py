@@ -0,0 +1,108 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import pytest
+
+from search_api_webui.fusion import (
+    canonicalize_url, fuse_results, overlap_stats, reciprocal_rank_fusion,
+)
+
+
+def results(*urls):
+    return [{'title': url, 'url': url, 'snippet': ''} for url in urls]
+
+
+def test_canonicalize_url_ignores_spelling_differences():
+    canonical = canonicalize_url('https://example.com/page')
+    assert canonicalize_url('http://www.example.com/page/') == canonical
+    assert canonicalize_url('https://example.com:443/page#section') == canonical
+    assert canonicalize_url('https://example.com/page?utm_source=x') == canonical
+    assert canonicalize_url('https://example.com/page?b=2&a=1') == \
+        canonicalize_url('https://example.com/page?a=1&b=2')
+    assert canonicalize_url('https://example.com/other') != canonical
+
+
+def test_reciprocal_rank_fusion_scores():
+    fused = reciprocal_rank_fusion({
+        'a': results('https://x.com/1', 'https://x.com/2'),
+        'b': results('https://x.com/2', 'https://x.com/3'),
+    }, k=60)
+
+    assert [entry['url'] for entry in fused] == \
+        ['https://x.com/2', 'https://x.com/1', 'https://x.com/3']
+    assert fused[0]['score'] == pytest.approx(1 / 62 + 1 / 61, abs=1e-6)
+    assert fused[0]['ranks'] == {'a': 2, 'b': 1}
+    assert fused[1]['score'] == pytest.approx(1 / 61, abs=1e-6)
+
+
+def test_overlap_stats_jaccard_and_spearman():
+    [same] = overlap_stats({
+        'a': results('https://x.com/1', 'https://x.com/2', 'https://x.com/3'),
+        'b': results('https://x.com/1', 'https://x.com/2', 'https://x.com/3'),
+    })
+    assert same == {'providers': ['a', 'b'], 'shared': 3, 'jaccard': 1.0, 'spearman': 1.0}
+
+    [reversed_] = overlap_stats({
+        'a': results('https://x.com/1', 'https://x.com/2', 'https://x.com/3'),
+        'b': results('https://x.com/3', 'https://x.com/2', 'https://x.com/1', 'https://y.com/'),
+    })
+    assert reversed_['shared'] == 3
+    assert reversed_['jaccard'] == 0.75
+    assert reversed_['spearman'] == -1.0
+
+
+def test_overlap_stats_without_shared_pages():
+    [pair] = overlap_stats({'a': results('https://x.com/1'), 'b': results('https://y.com/1')})
+    assert pair['shared'] == 0
+    assert pair['jaccard'] == 0.0
+    assert pair['spearman'] is None
+
+
+def test_fuse_results_counts_duplicates():
+    fused = fuse_results({
+        'a': results('https://x.com/1', 'http://www.x.com/1/', 'https://x.com/2'),
+        'b': results('https://x.com/2'),
+    }, limit=1)
+
+    assert fused['unique'] == 2
+    assert fused['duplicates'] == 2
+    assert len(fused['results']) == 1
+
+
+def test_results_without_string_url_are_matched_by_title_or_skipped():
+    fused = reciprocal_rank_fusion({
+        'a': [{'title': 'Page', 'url': None}, {'title': None, 'url': 42}, 'junk'],
+        'b': [{'title': 'page', 'url': ''}],
+    })
+    assert len(fused) == 1
+    assert fused[0]['ranks'] == {'a': 1, 'b': 1}
+
+
+def test_same_provider_twice_keeps_both_lists():
+    from search_api_webui.app import ArenaPlan
+
+    plan = ArenaPlan('q', [None, None], [], [0, 1])
+    fused = plan.to_fused_response([
+        dict(provider='you', results=results('https://x.com/1'), metrics={}),
+        dict(provider='you', results=results('https://x.com/2'), metrics={}),
+    ])
+    assert [p['label'] for p in fused['providers']] == ['you#1', 'you#2']
+    assert fused['overlap'][0]['providers'] == ['you#1', 'you#2']
+    assert fused['metrics']['unique_results'] == 2
@@ -0,0 +1,51 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from search_api_webui.history import SearchHistory
+from search_api_webui.stats import percentile
+
+
+def result(latency_ms, urls=()):
+    return {"results": [{"title": "", "url": url, "snippet": ""} for url in urls],
+            "metrics": {"latency_ms": latency_ms, "size_bytes": 100}}
+
+
+def test_percentile():
+    assert percentile([], 50) == 0.0
+    assert percentile([10.0], 99) == 10.0
+    assert percentile([10.0, 20.0], 50) == 15.0
+    assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 100) == 5.0
+
+
+def test_raw_searches_are_not_recorded(tmp_path):
+    history = SearchHistory(str(tmp_path / 'history.db'))
+    try:
+        history.record('p', 'parsed', {'limit': 5}, result(100.0, ['https://a.example/']))
+        history.record('p', 'raw', {'limit': 5, 'raw': True},
+                       dict(result(5.0), raw_body='{}', raw_content_type='application/json'))
+        assert history.flush(5)
+
+        entries = history.entries()
+        assert [entry['query'] for entry in entries] == ['parsed']
+        assert entries[0]['result_count'] == 1
+        [stats] = history.stats(3600)['providers']
+        assert stats['searches'] == 1
+    finally:
+        history.close()
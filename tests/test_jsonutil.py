@@ -0,0 +1,130 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import importlib
+import json
+import sys
+
+import pytest
+
+from search_api_webui import jsonutil
+from search_api_webui.app import raw_response
+from search_api_webui.providers.generic import GenericProvider
+
+DOCUMENT = {
+    "query": "café ☕ \"quoted\" </script>",
+    "results": [{"title": "Ünïcode", "url": "https://example.com/a?b=1&c=2", "rank": 1,
+                 "score": 0.5, "tags": [], "extra": None, "fresh": True}],
+    "metrics": {"latency_ms": 12.5, "size_bytes": 2048},
+}
+
+
+@pytest.fixture
+def stdlib_jsonutil(monkeypatch):
+    """
+    jsonutil reloaded as if neither orjson nor ujson were installed.
+    """
+    monkeypatch.setitem(sys.modules, 'orjson', None)
+    monkeypatch.setitem(sys.modules, 'ujson', None)
+    yield importlib.reload(jsonutil)
+    monkeypatch.undo()
+    importlib.reload(jsonutil)
+
+
+def test_stdlib_fallback(stdlib_jsonutil):
+    assert stdlib_jsonutil.BACKEND == 'json'
+    encoded = stdlib_jsonutil.dumps(DOCUMENT)
+
+    assert isinstance(encoded, bytes)
+    assert encoded == json.dumps(DOCUMENT, ensure_ascii=False,
+                                 separators=(',', ':')).encode('utf-8')
+    assert stdlib_jsonutil.loads(encoded) == DOCUMENT
+    assert stdlib_jsonutil.dumps_str(DOCUMENT) == encoded.decode('utf-8')
+
+
+def test_backend_matches_stdlib():
+    expected = json.dumps(DOCUMENT, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    assert jsonutil.loads(jsonutil.dumps(DOCUMENT)) == DOCUMENT
+    assert jsonutil.loads(expected) == DOCUMENT
+    if jsonutil.BACKEND == 'orjson':
+        # Both are compact and leave non-ASCII characters unescaped
+        assert jsonutil.dumps(DOCUMENT) == expected
+
+
+def test_values_the_fast_backend_rejects_are_still_encoded():
+    document = {1: 'non-str key', 'big': 2 ** 70}
+
+    assert json.loads(jsonutil.dumps(document)) == {'1': 'non-str key', 'big': 2 ** 70}
+
+
+def provider_config(url):
+    return {
+        'name': 'local',
+        'url': url + '/search',
+        'payload': {'q': '{query}'},
+        'response_mapping': {
+            'root_path': 'results',
+            'fields': {'title': 'title', 'url': 'url', 'snippet': 'snippet'},
+        },
+    }
+
+
+def test_raw_search_passes_the_body_through(local_server):
+    local_server.payload = DOCUMENT
+    sent = json.dumps(DOCUMENT).encode('utf-8')
+    provider = GenericProvider(provider_config(local_server.url))
+    result = provider.search('q', 'key', raw=True)
+    provider.close()
+
+    assert result['raw_body'] == sent
+    assert result['results'] == []
+    body, headers = raw_response(result)
+    assert body is result['raw_body']
+    assert headers['Content-Type'] == 'application/json'
+    assert json.loads(headers['X-Search-Metrics'])['size_bytes'] == len(sent)
+
+
+def test_async_raw_search_passes_the_body_through(local_server):
+    pytest.importorskip('httpx')
+    local_server.payload = DOCUMENT
+    provider = GenericProvider(provider_config(local_server.url))
+
+    async def search():
+        try:
+            return await provider.asearch('q', 'key', raw=True)
+        finally:
+            await provider.aclose()
+
+    result = asyncio.run(search())
+    provider.close()
+
+    assert result['raw_body'] == json.dumps(DOCUMENT).encode('utf-8')
+
+
+def test_parsed_results_have_no_raw_response(local_server):
+    local_server.payload = DOCUMENT
+    provider = GenericProvider(provider_config(local_server.url))
+    result = provider.search('q', 'key')
+    provider.close()
+
+    assert result['results'][0]['title'] == 'Ünïcode'
+    assert raw_response(result) is None
@@ -0,0 +1,123 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import threading
+import time
+
+import pytest
+
+from search_api_webui.providers.limits import ProviderLimiter, QueueTimeout, parse_retry_after
+
+
+def queue_in_order(limiter, count, order):
+    """
+    Starts `count` threads that queue on the limiter one after the other.
+    """
+    threads = []
+    for i in range(count):
+        def run(i=i):
+            limiter.acquire()
+            order.append(i)
+            limiter.release({})
+        thread = threading.Thread(target=run)
+        thread.start()
+        threads.append(thread)
+        while len(limiter._waiters) < i + 1:
+            time.sleep(0.001)
+    return threads
+
+
+def test_waiters_are_served_first_come_first_served():
+    limiter = ProviderLimiter('test', {'max_in_flight': 1})
+    limiter.acquire()
+    order = []
+    threads = queue_in_order(limiter, 8, order)
+    limiter.release({})
+    for thread in threads:
+        thread.join()
+    assert order == list(range(8))
+
+
+def test_rate_is_enforced():
+    limiter = ProviderLimiter('test', {'rate': 20, 'burst': 1})
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.acquire()
+        limiter.release({})
+    # The first request uses the burst, the other four wait 50 ms each
+    assert time.monotonic() - start >= 0.19
+
+
+def test_max_in_flight_is_enforced():
+    limiter = ProviderLimiter('test', {'max_in_flight': 2})
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    def run():
+        limiter.acquire()
+        with lock:
+            in_flight.append(1)
+            peak.append(len(in_flight))
+        time.sleep(0.02)
+        with lock:
+            in_flight.pop()
+        limiter.release({})
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) == 2
+
+
+def test_retry_after_pauses_the_provider():
+    limiter = ProviderLimiter('test', {'max_in_flight': 1})
+    limiter.acquire()
+    limiter.release({'status_code': 429, 'retry_after_s': 0.2})
+    start = time.monotonic()
+    limiter.acquire()
+    assert time.monotonic() - start >= 0.19
+    limiter.release({})
+
+
+def test_queue_wait_is_bounded():
+    limiter = ProviderLimiter('test', {'max_in_flight': 1, 'max_queue_wait': 0.05})
+    limiter.acquire()
+    with pytest.raises(QueueTimeout):
+        limiter.acquire()
+    assert not limiter._waiters
+
+
+def test_try_acquire_does_not_wait_or_jump_the_queue():
+    limiter = ProviderLimiter('test', {'max_in_flight': 1})
+    assert limiter.try_acquire()
+    assert not limiter.try_acquire()
+    limiter.release({})
+    assert limiter.try_acquire()
+    limiter.release({})
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('2') == 2.0
+    assert parse_retry_after('-1') == 0.0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
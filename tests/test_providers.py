@@ -0,0 +1,196 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import asyncio
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from search_api_webui.providers import (
+    PROVIDER_TYPES, ProviderMap, get_provider_class, load_provider_configs, load_providers,
+    register_provider_type,
+)
+from search_api_webui.providers.generic import GenericProvider
+
+PROVIDERS = """
+alpha:
+  url: https://alpha.example.com/search
+beta:
+  url: https://beta.example.com/search
+"""
+
+
+def write(path, text, bump=0):
+    path.write_text(text, encoding='utf-8')
+    # Make sure the edit is seen even on filesystems with coarse timestamps
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump * 1_000_000_000))
+
+
+def test_reload_on_change(tmp_path):
+    path = tmp_path / 'providers.yaml'
+    write(path, PROVIDERS)
+    reloads = []
+    providers = load_providers(str(path), on_reload=reloads.append)
+    assert sorted(providers) == ['alpha', 'beta']
+    alpha, beta = providers['alpha'], providers['beta']
+    assert not providers.reload_if_changed()
+
+    write(path, PROVIDERS.replace('beta.example.com', 'beta2.example.com'), bump=1)
+    assert providers.reload_if_changed()
+    assert reloads == [['beta']]
+    assert providers.config('beta')['url'] == 'https://beta2.example.com/search'
+    # Unchanged providers keep their instance, and so their warm connections
+    assert providers['alpha'] is alpha
+    assert providers['beta'] is not beta
+    for provider in providers.instances() + [beta]:
+        provider.close()
+
+
+def test_broken_file_keeps_current_providers(tmp_path):
+    path = tmp_path / 'providers.yaml'
+    write(path, PROVIDERS)
+    providers = load_providers(str(path))
+    assert sorted(providers) == ['alpha', 'beta']
+
+    write(path, 'alpha: [unclosed', bump=1)
+    assert not providers.reload_if_changed()
+    assert sorted(providers) == ['alpha', 'beta']
+
+    # Fixing the file is picked up
+    write(path, PROVIDERS + 'gamma:\n  url: https://gamma.example.com/search\n', bump=2)
+    assert providers.reload_if_changed()
+    assert sorted(providers) == ['alpha', 'beta', 'gamma']
+
+
+def test_null_provider_entry(tmp_path):
+    path = tmp_path / 'providers.yaml'
+    write(path, PROVIDERS + 'gamma:\n')
+    with pytest.raises(ValueError, match="gamma"):
+        load_provider_configs(str(path))
+
+    write(path, PROVIDERS, bump=1)
+    providers = load_providers(str(path))
+    assert sorted(providers) == ['alpha', 'beta']
+    write(path, PROVIDERS + 'gamma:\n', bump=2)
+    assert not providers.reload_if_changed()
+    assert sorted(providers) == ['alpha', 'beta']
+
+
+def test_override_replaces_provider(tmp_path):
+    path = tmp_path / 'providers.yaml'
+    override = tmp_path / 'override.yaml'
+    write(path, PROVIDERS)
+    write(override, 'beta:\n  url: https://mirror.example.com/search\n')
+    configs = load_provider_configs(str(path), str(override))
+    assert configs['beta'] == {'url': 'https://mirror.example.com/search', 'name': 'beta'}
+    assert configs['alpha']['name'] == 'alpha'
+
+
+def test_async_client_of_previous_loop_is_closed():
+    provider = GenericProvider({'name': 'test', 'url': 'https://example.com/search'})
+
+    async def get_client():
+        return provider._get_async_client()
+
+    old_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=old_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        old_client = asyncio.run_coroutine_threadsafe(get_client(), old_loop).result(5)
+        new_client = asyncio.run(get_client())
+        assert new_client is not old_client
+        # Closed on its own loop
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), old_loop).result(5)
+        assert old_client.is_closed
+        assert not new_client.is_closed
+    finally:
+        old_loop.call_soon_threadsafe(old_loop.stop)
+        thread.join(5)
+        old_loop.close()
+        provider.close()
+
+
+def test_async_client_is_capped_at_pool_size():
+    provider = GenericProvider({'name': 'test', 'url': 'https://example.com/search',
+                                'pool_size': 3})
+
+    async def get_client():
+        client = provider._get_async_client()
+        await provider.aclose()
+        return client
+
+    pool = asyncio.run(get_client())._transport._pool
+    assert pool._max_connections == 3
+    assert pool._max_keepalive_connections == 3
+    provider.close()
+
+
+class CustomProvider(GenericProvider):
+    pass
+
+
+LAZY_IMPORT_CHECK = """
+import sys
+from search_api_webui.providers import load_providers
+
+def loaded():
+    return sorted(m for m in ('querit', 'search_api_webui.providers.generic',
+                              'search_api_webui.providers.querit') if m in sys.modules)
+
+providers = load_providers(sys.argv[1])
+print(sorted(providers), loaded())
+providers['alpha']
+print(loaded())
+"""
+
+
+def test_provider_modules_are_imported_on_first_use(tmp_path):
+    path = tmp_path / 'providers.yaml'
+    write(path, PROVIDERS + 'sdk:\n  type: querit_sdk\n')
+    output = subprocess.run(
+        [sys.executable, '-c', LAZY_IMPORT_CHECK, str(path)],
+        capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+
+    assert output == [
+        "['alpha', 'beta', 'sdk'] []",
+        "['search_api_webui.providers.generic']",
+    ]
+
+
+def test_registered_provider_type(monkeypatch):
+    # Recorded by monkeypatch first, so the registration is undone afterwards
+    monkeypatch.setitem(PROVIDER_TYPES, 'custom', f'{__name__}:CustomProvider')
+    register_provider_type('custom', f'{__name__}:CustomProvider')
+    providers = ProviderMap(lambda: {
+        'mine': {'name': 'mine', 'type': 'custom', 'url': 'https://example.com/'},
+        'other': {'name': 'other', 'type': 'unknown', 'url': 'https://example.com/'},
+    })
+
+    assert type(providers['mine']) is CustomProvider
+    # Unknown types fall back to the generic provider
+    assert type(providers['other']) is GenericProvider
+    assert get_provider_class('generic') is GenericProvider
+    for provider in providers.instances():
+        provider.close()
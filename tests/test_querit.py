@@ -0,0 +1,78 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from search_api_webui.providers import querit as querit_module
+from search_api_webui.providers.querit import QueritClientPool, QueritSdkProvider
+
+PAYLOAD = {"results": {"result": [
+    {"title": "Querit", "url": "https://querit.ai/", "snippet": "s"},
+]}}
+
+
+def test_client_is_reused_per_api_key():
+    pool = QueritClientPool()
+    first, first_reused = pool.acquire('key-a')
+    again, again_reused = pool.acquire('key-a')
+    other, _ = pool.acquire('key-b')
+
+    assert not first_reused
+    assert again_reused
+    assert again is first
+    assert other is not first
+    assert other.session is not first.session
+    pool.close()
+
+
+def test_idle_clients_are_evicted(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(querit_module.time, 'monotonic', lambda: now[0])
+    pool = QueritClientPool(idle_timeout=60)
+    stale, _ = pool.acquire('key-a')
+    closed = []
+    stale.session.close = lambda: closed.append('key-a')
+
+    now[0] += 30
+    assert pool.acquire('key-a') == (stale, True)
+    now[0] += 61
+    fresh, reused = pool.acquire('key-a')
+
+    assert not reused
+    assert fresh is not stale
+    assert closed == ['key-a']
+    pool.close()
+
+
+def test_searches_share_the_pooled_connection(local_server):
+    local_server.payload = PAYLOAD
+    provider = QueritSdkProvider({'name': 'querit'})
+    client, _ = provider._clients.acquire('key')
+    client.url = local_server.url + '/v1/search'
+
+    first = provider.search('one', ' key ')
+    second = provider.search('two', 'key')
+    provider.close()
+
+    assert first['results'] == [{"title": "Querit", "url": "https://querit.ai/",
+                                 "snippet": "s"}]
+    assert first['metrics']['client_reused']
+    assert not first['metrics']['connection_reused']
+    assert second['metrics']['client_reused']
+    assert second['metrics']['connection_reused']
+    assert local_server.requests == [('POST', '/v1/search')] * 2
@@ -0,0 +1,99 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import gzip
+
+import pytest
+
+from search_api_webui.providers.connection import SESSION_RESPONSE_HOOKS
+from search_api_webui.providers.generic import GenericProvider
+from search_api_webui.providers.replay import (
+    REDACTED, ReplayProvider, read_recordings, record_responses, redact_body, redact_url,
+)
+
+SECRET = 'sk-very-secret'
+
+
+def provider_config(url):
+    return {
+        'name': 'local',
+        'url': url + '/search',
+        'method': 'POST',
+        'payload': {
+            'q': '{query}',
+            'options': {'api_key': '{api_key}', 'filters': [{'token': '{api_key}'}]},
+        },
+        'params': {'key': '{api_key}'},
+        'response_mapping': {
+            'root_path': 'results',
+            'fields': {'title': 'title', 'url': 'url', 'snippet': 'snippet'},
+        },
+    }
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    recorder = record_responses(str(tmp_path / 'recordings.jsonl.gz'))
+    yield recorder
+    SESSION_RESPONSE_HOOKS.remove(recorder)
+    recorder.close()
+
+
+def test_redact_url_masks_credentials_and_sorts():
+    assert redact_url('https://x.example/s?q=a&api_key=k') == \
+        f'https://x.example/s?api_key={REDACTED}&q=a'
+    assert redact_url('https://x.example/s') == 'https://x.example/s'
+
+
+def test_redact_body_masks_nested_credentials():
+    body = '{"q": "a", "options": {"api_key": "k", "list": [{"token": "t"}]}}'
+    assert redact_body(body) == (
+        '{"options":{"api_key":"%s","list":[{"token":"%s"}]},"q":"a"}' % (REDACTED, REDACTED)
+    )
+    assert redact_body('not json') == 'not json'
+    assert redact_body(b'') is None
+
+
+def test_record_and_replay_round_trip(local_server, recorder):
+    local_server.payload = {"results": [
+        {"title": "Recorded", "url": "https://a.example/", "snippet": "s"}
+    ]}
+    config = provider_config(local_server.url)
+    live = GenericProvider(config)
+    recorded = live.search('replay me', SECRET)
+    live.close()
+    assert recorded['results'][0]['title'] == 'Recorded'
+
+    with gzip.open(recorder.path, 'rt', encoding='utf-8') as f:
+        assert SECRET not in f.read()
+    [entry] = read_recordings(recorder.path)
+    assert entry['status'] == 200
+
+    # The upstream is gone; the replay answers from the recording
+    local_server.payload = {"results": []}
+    replay = ReplayProvider({'name': 'offline', 'replays': 'local', 'source': config,
+                             'recordings': recorder.path})
+    replayed = replay.search('replay me', SECRET)
+    assert replayed['results'] == recorded['results']
+    assert len(local_server.requests) == 1
+
+    missing = replay.search('never recorded', SECRET)
+    assert missing.get('error')
+    replay.close()
@@ -0,0 +1,113 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import threading
+import time
+
+from search_api_webui.providers.resilience import (
+    HEDGE_WORKERS, MIN_SAMPLES, HedgeBudget, ResiliencePolicy,
+)
+
+
+class CountingUpstream:
+    """
+    attempt(timeout) callable that takes `delay` seconds and counts its calls.
+    """
+
+    def __init__(self, delay):
+        self.delay = delay
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, timeout):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.delay)
+        return {"results": [], "metrics": {"latency_ms": self.delay * 1000}}
+
+
+def warmed_policy(latency, **config):
+    policy = ResiliencePolicy('test', dict({'hedge': True}, **config))
+    for _ in range(MIN_SAMPLES):
+        policy.latencies.add(latency)
+    return policy
+
+
+def call_concurrently(policy, attempt, count):
+    results = [None] * count
+
+    def run(i):
+        results[i] = policy.call(attempt)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_no_hedges_under_local_saturation():
+    # The upstream answers well within the learned p95, but three times as many searches
+    # as hedge workers run at once: none of them may be hedged for queueing locally
+    policy = warmed_policy(0.2, hedge_budget=1)
+    for _ in range(HEDGE_WORKERS * 3):
+        policy.hedge_budget.deposit()
+    upstream = CountingUpstream(0.1)
+    results = call_concurrently(policy, upstream, HEDGE_WORKERS * 3)
+    assert upstream.calls == HEDGE_WORKERS * 3
+    assert not any(r['metrics']['hedged'] for r in results)
+
+
+def test_hedges_are_capped_by_budget():
+    policy = warmed_policy(0.01, hedge_budget=0.25)
+    upstream = CountingUpstream(0.2)
+    results = call_concurrently(policy, upstream, 20)
+    hedged = sum(r['metrics']['hedged'] for r in results)
+    assert hedged == 5
+    assert upstream.calls == 25
+
+
+def test_hedge_budget_saves_up_to_burst():
+    budget = HedgeBudget(ratio=0.5, burst=2)
+    assert not budget.withdraw()
+    for _ in range(10):
+        budget.deposit()
+    assert budget.withdraw()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_throttled_provider_does_not_occupy_hedge_pool():
+    limited = ResiliencePolicy('limited', {'hedge': True}, limits={'max_in_flight': 1})
+    for _ in range(MIN_SAMPLES):
+        limited.latencies.add(0.5)
+    waiting = threading.Thread(
+        target=call_concurrently, args=(limited, CountingUpstream(0.01), HEDGE_WORKERS * 2)
+    )
+    waiting.start()
+    # With the limited provider's searches queued, another provider can still hedge
+    policy = warmed_policy(0.01, hedge_budget=1)
+    policy.hedge_budget.deposit()
+    upstream = CountingUpstream(0.1)
+    result = policy.call(upstream)
+    waiting.join()
+    assert result['metrics']['hedged']
+    assert upstream.calls == 2
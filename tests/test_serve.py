@@ -0,0 +1,54 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+from search_api_webui import serve
+
+
+def fake_find_spec(*installed):
+    return lambda name: object() if name in installed else None
+
+
+def test_gunicorn_is_preferred(monkeypatch):
+    monkeypatch.setattr(serve, 'find_spec', fake_find_spec('gunicorn', 'waitress'))
+    assert serve._select_runner() is serve._run_gunicorn
+
+
+def test_waitress_without_gunicorn(monkeypatch):
+    monkeypatch.setattr(serve, 'find_spec', fake_find_spec('waitress'))
+    assert serve._select_runner() is serve._run_waitress
+
+
+def test_no_server_installed(monkeypatch):
+    monkeypatch.setattr(serve, 'find_spec', fake_find_spec())
+    assert serve._select_runner() is None
+    assert serve.run(object(), '127.0.0.1', 0) == 1
+
+
+def test_invalid_worker_counts():
+    assert serve.run(object(), '127.0.0.1', 0, workers=0) == 2
+    assert serve.run(object(), '127.0.0.1', 0, threads=0) == 2
+
+
+def test_runner_gets_the_settings(monkeypatch):
+    calls = []
+    monkeypatch.setattr(serve, '_select_runner', lambda: lambda *args: calls.append(args) or 0)
+    init, shutdown = object(), object()
+    assert serve.run('app', 'localhost', 8080, 3, 4, init, shutdown) == 0
+    assert calls == [('app', 'localhost', 8080, 3, 4, init, shutdown)]
@@ -0,0 +1,134 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import socket
+
+from search_api_webui.cache import ResultCache
+from search_api_webui.dispatcher import SearchDispatcher
+from search_api_webui.providers.base import BaseProvider, error_result
+from search_api_webui.providers.generic import GenericProvider
+from search_api_webui.telemetry import SearchTelemetry
+
+FAMILIES = {
+    'search_requests_total': 'counter',
+    'search_cache_lookups_total': 'counter',
+    'search_cache_hit_ratio': 'gauge',
+    'search_coalesced_total': 'counter',
+    'search_upstream_requests_total': 'counter',
+    'search_upstream_errors_total': 'counter',
+    'search_upstream_in_flight': 'gauge',
+    'search_upstream_latency_seconds': 'histogram',
+    'search_queue_wait_seconds': 'histogram',
+    'search_upstream_response_size_bytes': 'histogram',
+}
+
+
+class StaticProvider(BaseProvider):
+    """
+    Answers immediately with one result, or with the given error result.
+    """
+
+    def __init__(self, error=None):
+        self.error = error
+
+    def search(self, query, api_key, **kwargs):
+        if self.error is not None:
+            return self.error
+        return {"results": [{"title": query, "url": "https://example.com/", "snippet": ""}],
+                "metrics": {"latency_ms": 1, "size_bytes": 2048}}
+
+
+def parse(text):
+    """
+    Returns:
+        tuple: ({family: type}, {sample line without the value: value}).
+    """
+    types, samples = {}, {}
+    for line in text.splitlines():
+        if line.startswith('# TYPE '):
+            _, _, name, kind = line.split(' ')
+            types[name] = kind
+        elif line and not line.startswith('#'):
+            sample, value = line.rsplit(' ', 1)
+            samples[sample] = float(value)
+    return types, samples
+
+
+def test_every_family_is_declared_before_any_search():
+    types, samples = parse(SearchTelemetry().render())
+
+    assert types == FAMILIES
+    assert samples == {}
+
+
+def test_samples_carry_provider_and_error_labels():
+    providers = {
+        'ok': StaticProvider(),
+        'limited': StaticProvider(error_result('Slow down', 'rate_limited', status_code=429)),
+    }
+    dispatcher = SearchDispatcher(providers, cache=ResultCache())
+    dispatcher.search('ok', 'q', 'key')
+    dispatcher.search('ok', 'q', 'key')
+    dispatcher.search('limited', 'q', 'key')
+    dispatcher.search('ok', 'fresh', 'key', use_cache=False)
+    dispatcher.shutdown()
+
+    types, samples = parse(dispatcher.telemetry.render())
+
+    assert types == FAMILIES
+    assert samples['search_requests_total{provider="ok"}'] == 3
+    assert samples['search_requests_total{provider="limited"}'] == 1
+    assert samples['search_cache_lookups_total{provider="ok",result="hit"}'] == 1
+    assert samples['search_cache_lookups_total{provider="ok",result="miss"}'] == 1
+    assert samples['search_cache_hit_ratio{provider="ok"}'] == 0.5
+    assert samples['search_upstream_requests_total{provider="ok"}'] == 2
+    assert samples['search_upstream_errors_total'
+                   '{provider="limited",class="rate_limited",status="429"}'] == 1
+    assert samples['search_upstream_in_flight{provider="ok"}'] == 0
+    assert samples['search_upstream_latency_seconds_count{provider="limited"}'] == 1
+    assert samples['search_upstream_latency_seconds_bucket{provider="ok",le="+Inf"}'] == 2
+    # Only successful responses are sized: 2048 bytes lands in the 4096 bucket
+    assert samples['search_upstream_response_size_bytes_bucket'
+                   '{provider="ok",le="1024.0"}'] == 0
+    assert samples['search_upstream_response_size_bytes_bucket'
+                   '{provider="ok",le="4096.0"}'] == 2
+    assert 'search_upstream_response_size_bytes_count{provider="limited"}' not in samples
+
+
+def test_label_values_are_escaped():
+    telemetry = SearchTelemetry()
+    telemetry.search_received('say "hi"\\\n')
+
+    assert 'search_requests_total{provider="say \\"hi\\"\\\\\\n"} 1' in telemetry.render()
+
+
+def test_refused_connection_is_not_a_timeout():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    provider = GenericProvider({'name': 'down', 'url': f'http://127.0.0.1:{port}/'})
+    dispatcher = SearchDispatcher({'down': provider})
+    result = dispatcher.search('down', 'q', 'key', use_cache=False)
+    dispatcher.shutdown()
+    provider.close()
+
+    assert result['error_type'] == 'connection'
+    assert ('search_upstream_errors_total{provider="down",class="connection",status=""} 1'
+            in dispatcher.telemetry.render())
@@ -0,0 +1,95 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import jmespath
+import pytest
+
+from search_api_webui.providers.generic import compile_path, compile_template
+
+CONTEXT = {'query': 'rust {async}', 'api_key': 'k-1', 'limit': 10, 'language': None}
+
+TEMPLATES = [
+    'plain',
+    '',
+    '{query}',
+    'Bearer {api_key}',
+    '{query} in {language}',
+    '{{literal}} {limit}',
+    '{{escaped only}}',
+    '{missing} {query}',
+    '{limit:>4}|{query!r}',
+    {'q': '{query}', 'n': '{limit}', 'fixed': 3, 'flag': True, 'none': None,
+     'nested': {'auth': {'key': '{api_key}'}, 'lang': '{language}'}},
+    {},
+    42,
+]
+
+PATHS = ['title', 'url', 'missing', '"dash-key"', 'meta.author', 'items[0].name',
+         'items[*].name', '@', "tags[?@ != 'b']"]
+
+DOCUMENTS = [
+    {'title': 'T', 'url': 'https://example.com/', 'dash-key': 'd', 'meta': {'author': 'A'},
+     'items': [{'name': 'x'}, {'name': 'y'}], 'tags': ['a', 'b']},
+    {'title': '', 'url': None, 'meta': {}, 'items': [], 'tags': []},
+    {'title': 0},
+    ['title'],
+    'title',
+    None,
+]
+
+
+def fill_template(template_obj, **kwargs):
+    """
+    GenericProvider's template substitution before templates were compiled.
+    """
+    if isinstance(template_obj, str):
+        safe_kwargs = {k: (v if v is not None else '') for k, v in kwargs.items()}
+        try:
+            return template_obj.format(**safe_kwargs)
+        except KeyError:
+            return template_obj
+    elif isinstance(template_obj, dict):
+        return {k: fill_template(v, **kwargs) for k, v in template_obj.items()}
+    return template_obj
+
+
+@pytest.mark.parametrize('template', TEMPLATES)
+def test_compiled_template_renders_like_format(template):
+    safe_context = {k: (v if v is not None else '') for k, v in CONTEXT.items()}
+
+    assert compile_template(template)(safe_context) == fill_template(template, **CONTEXT)
+
+
+def test_compiled_template_returns_fresh_structures():
+    render = compile_template({'q': '{query}', 'nested': {'fixed': 'x'}})
+    first = render({'query': 'a'})
+    first['nested']['fixed'] = 'changed'
+
+    assert render({'query': 'b'}) == {'q': 'b', 'nested': {'fixed': 'x'}}
+
+
+def test_malformed_template_is_sent_verbatim():
+    assert compile_template('{query')({'query': 'q'}) == '{query'
+
+
+@pytest.mark.parametrize('path', PATHS)
+@pytest.mark.parametrize('document', DOCUMENTS, ids=range(len(DOCUMENTS)))
+def test_compiled_path_matches_jmespath(path, document):
+    assert compile_path(path)(document) == jmespath.search(path, document)
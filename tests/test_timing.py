@@ -0,0 +1,79 @@
+# Copyright (c) 2026 QUERIT PRIVATE LIMITED
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+# DEALINGS IN THE SOFTWARE.
+
+import socket
+
+import pytest
+import requests
+
+from search_api_webui.providers import timing
+from search_api_webui.providers.connection import create_session
+from search_api_webui.providers.timing import RequestTimer
+
+PHASES = {'connection_reused', 'dns_ms', 'tcp_ms', 'tls_ms', 'connect_ms', 'ttfb_ms',
+          'download_ms', 'wire_bytes'}
+
+
+def resolve_test_host(monkeypatch, addresses):
+    real_getaddrinfo = socket.getaddrinfo
+
+    def getaddrinfo(host, port, *args, **kwargs):
+        if host != 'test.invalid':
+            return real_getaddrinfo(host, port, *args, **kwargs)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', (address, port))
+                for address in addresses]
+
+    monkeypatch.setattr(timing.socket, 'getaddrinfo', getaddrinfo)
+
+
+def test_phase_breakdown(local_server):
+    session = create_session()
+    with RequestTimer() as timer:
+        response = session.get(local_server.url + '/search')
+    assert response.json() == local_server.payload
+    phases = timer.phases()
+    assert set(phases) == PHASES
+    assert not phases['connection_reused']
+    assert phases['wire_bytes'] == len(response.content)
+
+    with RequestTimer() as timer:
+        session.get(local_server.url + '/search')
+    assert timer.phases()['connection_reused']
+    assert timer.phases()['connect_ms'] == 0
+    session.close()
+
+
+def test_next_address_is_tried_when_one_refuses(monkeypatch, local_server):
+    # Nothing listens on 127.0.0.2, so that connection is refused
+    resolve_test_host(monkeypatch, ['127.0.0.2', '127.0.0.1'])
+    session = create_session()
+    with RequestTimer() as timer:
+        response = session.get(f'http://test.invalid:{local_server.server_port}/search')
+    assert response.status_code == 200
+    assert timer.new_connections == 1
+    session.close()
+
+
+def test_no_resolved_address_raises_connection_error(monkeypatch):
+    resolve_test_host(monkeypatch, [])
+    session = create_session()
+    with RequestTimer(), pytest.raises(requests.ConnectionError):
+        session.get('http://test.invalid:9/search')
+    session.close()